@@ -3,11 +3,25 @@ from sec_parser.exceptions import (
     SecParserRuntimeError,
     SecParserValueError,
 )
+from sec_parser.processing_engine.auto_parser import AutoParser
+from sec_parser.processing_engine.batch import BatchParseResult, parse_many
+from sec_parser.processing_engine.classification_memo import ClassificationMemo
+from sec_parser.processing_engine.columnar_format import (
+    ColumnarDocument,
+    dump_columnar,
+    dumps_columnar,
+)
 from sec_parser.processing_engine.core import (
     Edgar10QParser,
     Edgar10KParser,
 )
 from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.processing_engine.instrumentation import (
+    DocumentReport,
+    ParsingInstrumentation,
+)
+from sec_parser.processing_engine.parse_cache import ParseCache
+from sec_parser.processing_engine.processing_log import ProcessingLogMode
 from sec_parser.processing_engine.types import ParsingOptions
 from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
     AbstractProcessingStep,
@@ -15,6 +29,9 @@ from sec_parser.processing_steps.abstract_classes.abstract_processing_step impor
 from sec_parser.semantic_elements.composite_semantic_element import (
     CompositeSemanticElement,
 )
+from sec_parser.semantic_elements.detached_semantic_element import (
+    DetachedSemanticElement,
+)
 from sec_parser.semantic_elements.highlighted_text_element import HighlightedTextElement
 from sec_parser.semantic_elements.semantic_elements import (
     AbstractSemanticElement,
@@ -45,7 +62,9 @@ __all__ = [
     # Main parser classes
     "Edgar10QParser",
     "Edgar10KParser",
+    "AutoParser",
     "TreeBuilder",
+    "parse_many",
     # Common semantic elements
     "AbstractSemanticElement",
     "CompositeSemanticElement",
@@ -61,17 +80,28 @@ __all__ = [
     "SupplementaryText",
     "EmptyElement",
     "PageNumberElement",
-    "PageHeaderElement",  # Common exceptions
+    "PageHeaderElement",
+    "DetachedSemanticElement",
+    # Common exceptions
     "SecParserError",
     "SecParserRuntimeError",
     "SecParserValueError",
     # Common types
     "AbstractNestingRule",
     "AbstractProcessingStep",
+    "DocumentReport",
+    "ParsingInstrumentation",
+    "ParseCache",
+    "ClassificationMemo",
+    "ColumnarDocument",
     "SemanticTree",
     "TreeNode",
     "HtmlTag",
     # Misc
     "render",
     "ParsingOptions",
+    "ProcessingLogMode",
+    "BatchParseResult",
+    "dump_columnar",
+    "dumps_columnar",
 ]
@@ -6,18 +6,54 @@ subpackage to perform tasks like section
 identification, title parsing, and text extraction.
 """
 
+from sec_parser.processing_engine.auto_parser import (
+    AutoParser,
+    detect_form_type,
+    register_parser,
+)
+from sec_parser.processing_engine.classification_memo import ClassificationMemo
+from sec_parser.processing_engine.columnar_format import (
+    ColumnarDocument,
+    dump_columnar,
+    dumps_columnar,
+)
 from sec_parser.processing_engine.core import (
     AbstractSemanticElementParser,
     Edgar10QParser,
     Edgar10KParser,
 )
 from sec_parser.processing_engine.html_tag import HtmlTag
-from sec_parser.processing_engine.html_tag_parser import HtmlTagParser
+from sec_parser.processing_engine.html_tag_parser import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+)
+from sec_parser.processing_engine.instrumentation import (
+    DocumentReport,
+    ParsingInstrumentation,
+    StepReport,
+)
+from sec_parser.processing_engine.parse_cache import ParseCache
+from sec_parser.processing_engine.streaming_html_tag_parser import (
+    StreamingHtmlTagParser,
+)
 
 __all__ = [
     "HtmlTagParser",
+    "LxmlHtmlTagParser",
+    "StreamingHtmlTagParser",
     "AbstractSemanticElementParser",
     "Edgar10QParser",
     "Edgar10KParser",
+    "AutoParser",
+    "detect_form_type",
+    "register_parser",
     "HtmlTag",
+    "ParsingInstrumentation",
+    "DocumentReport",
+    "StepReport",
+    "ParseCache",
+    "ClassificationMemo",
+    "ColumnarDocument",
+    "dump_columnar",
+    "dumps_columnar",
 ]
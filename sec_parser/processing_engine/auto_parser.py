@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import html as html_lib
+import re
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.core import (
+    AbstractSemanticElementParser,
+    Edgar10KParser,
+    Edgar10QParser,
+)
+from sec_parser.processing_engine.html_tag_parser import (
+    AbstractHtmlTagParser,
+    HtmlTagParser,
+)
+from sec_parser.processing_engine.types import ParsingOptions
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from sec_parser.processing_engine.classification_memo import ClassificationMemo
+    from sec_parser.processing_engine.instrumentation import (
+        ParsingInstrumentation,
+    )
+    from sec_parser.processing_engine.parse_cache import ParseCache
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+    from sec_parser.semantic_elements.detached_semantic_element import (
+        DetachedSemanticElement,
+    )
+
+# The parsers of the supported form types. A parser for another form type,
+# such as "8-K", is added with `register_parser`.
+PARSERS_BY_FORM_TYPE: dict[str, type[AbstractSemanticElementParser]] = {
+    "10-Q": Edgar10QParser,
+    "10-K": Edgar10KParser,
+}
+
+# The form type is detected from the start of the document only, which holds
+# the inline XBRL header and the cover page.
+_HEAD_LENGTH = 500_000
+
+_DOCUMENT_TYPE_FACT = re.compile(
+    r"<ix:nonnumeric\b[^>]*\bname\s*=\s*[\"']dei:DocumentType[\"'][^>]*>(.*?)"
+    r"</ix:nonnumeric>",
+    re.IGNORECASE | re.DOTALL,
+)
+# Only the text right after each word "form" that is followed by a number
+# is extracted, which is enough for the form type, as in "Form 10-Q", even
+# if it is split across tags. The words are searched in the lowercased
+# text, which is much faster than a case-insensitive search.
+_FORM = re.compile(r"form\b(?:\s|<[^>]*>|&#?\w+;)*\d")
+_FORM_WINDOW_LENGTH = 300
+# Inline tags, such as <b> or <span>, may split a word, as in "10-<b>Q</b>",
+# so they are removed. Line breaks and the tags of blocks and table cells
+# separate the words, so they are replaced with a space.
+_SEPARATING_TAG = re.compile(
+    r"<(?:br|/?(?:p|div|td|th|tr|li|h[1-6]|table))\b[^>]*>",
+    re.IGNORECASE,
+)
+_TAG = re.compile(r"<[^>]*>")
+_DASHES = re.compile(r"[\u2010-\u2015\u2212]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def register_parser(
+    form_type: str,
+    parser_cls: type[AbstractSemanticElementParser],
+) -> None:
+    """Register the parser of a form type, replacing any previous one."""
+    PARSERS_BY_FORM_TYPE[_normalize_form_type(form_type)] = parser_cls
+
+
+def get_parser_cls(form_type: str) -> type[AbstractSemanticElementParser]:
+    try:
+        return PARSERS_BY_FORM_TYPE[_normalize_form_type(form_type)]
+    except KeyError:
+        supported = ", ".join(PARSERS_BY_FORM_TYPE)
+        msg = f"Unsupported form type: {form_type!r}. Supported: {supported}"
+        raise SecParserValueError(msg) from None
+
+
+def detect_form_type(html: str | bytes) -> str | None:
+    """
+    Detect the form type of a document from its start, without parsing it.
+
+    The `dei:DocumentType` fact of the inline XBRL header is used if there
+    is one, and otherwise the first "Form 10-Q" or the like on the cover
+    page. Amendments, such as "10-K/A", are detected as the amended form
+    type, unless a parser is registered for them. Returns None if none of
+    the registered form types is found.
+    """
+    head = html[:_HEAD_LENGTH]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="ignore")
+
+    if match := _DOCUMENT_TYPE_FACT.search(head):
+        form_type = _find_registered_form_type(_get_text(match.group(1)))
+        if form_type is not None:
+            return form_type
+
+    if not PARSERS_BY_FORM_TYPE:
+        return None
+    names = sorted(map(re.escape, PARSERS_BY_FORM_TYPE), key=len, reverse=True)
+    cover_pattern = re.compile(
+        rf"form\s+({'|'.join(names)})(/A)?(?![\w-])",
+        re.IGNORECASE,
+    )
+    lowercase_head = head.lower()
+    for form in _FORM.finditer(lowercase_head):
+        start = form.start()
+        if lowercase_head[start - 1 : start].isalnum():
+            continue
+        window = lowercase_head[start : start + _FORM_WINDOW_LENGTH]
+        if match := cover_pattern.match(_get_text(window)):
+            return _find_registered_form_type(match.group(0).split(maxsplit=1)[1])
+    return None
+
+
+class AutoParser:
+    """
+    Parses documents of any registered form type, such as 10-Q and 10-K
+    reports, with the parser of the form type that is detected from the
+    start of each document (see `detect_form_type`).
+
+    A single parser is created for each form type when it is first needed,
+    and it reuses its processing steps from one document to the next, so
+    documents of mixed form types are parsed once each, without rebuilding
+    the steps.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_form_type: str | None = None,
+        parsing_options: ParsingOptions | None = None,
+        html_tag_parser: AbstractHtmlTagParser | None = None,
+        instrumentation: ParsingInstrumentation | None = None,
+        parse_cache: ParseCache | None = None,
+        classification_memo: ClassificationMemo | None = None,
+    ) -> None:
+        if default_form_type is not None:
+            get_parser_cls(default_form_type)
+        self._default_form_type = default_form_type
+        self._parsing_options = replace(
+            parsing_options or ParsingOptions(),
+            reuse_processing_steps=True,
+        )
+        self._html_tag_parser = html_tag_parser or HtmlTagParser()
+        self._instrumentation = instrumentation
+        self._parse_cache = parse_cache
+        self._classification_memo = classification_memo
+        self._parsers: dict[
+            type[AbstractSemanticElementParser],
+            AbstractSemanticElementParser,
+        ] = {}
+
+    def get_form_type(self, html: str | bytes) -> str:
+        """
+        Return the detected form type of the document, or the default form
+        type if it can't be detected.
+        """
+        form_type = detect_form_type(html) or self._default_form_type
+        if form_type is None:
+            supported = ", ".join(PARSERS_BY_FORM_TYPE)
+            msg = f"Could not detect the form type. Supported: {supported}"
+            raise SecParserValueError(msg)
+        return form_type
+
+    def get_parser(self, form_type: str) -> AbstractSemanticElementParser:
+        parser_cls = get_parser_cls(form_type)
+        if parser_cls not in self._parsers:
+            self._parsers[parser_cls] = parser_cls(
+                parsing_options=self._parsing_options,
+                html_tag_parser=self._html_tag_parser,
+                instrumentation=self._instrumentation,
+                parse_cache=self._parse_cache,
+                classification_memo=self._classification_memo,
+            )
+        return self._parsers[parser_cls]
+
+    def parse(
+        self,
+        html: str | bytes,
+        *,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
+        sections: Iterable[str] | None = None,
+    ) -> list[AbstractSemanticElement]:
+        """
+        Parse the HTML document into a list of semantic elements, with the
+        parser of its form type (see `AbstractSemanticElementParser.parse`).
+        """
+        parser = self.get_parser(self.get_form_type(html))
+        return parser.parse(
+            html,
+            unwrap_elements=unwrap_elements,
+            include_containers=include_containers,
+            include_irrelevant_elements=include_irrelevant_elements,
+            sections=sections,
+        )
+
+    def parse_detached(
+        self,
+        html: str | bytes,
+        *,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
+        sections: Iterable[str] | None = None,
+    ) -> list[DetachedSemanticElement]:
+        parser = self.get_parser(self.get_form_type(html))
+        return parser.parse_detached(
+            html,
+            unwrap_elements=unwrap_elements,
+            include_containers=include_containers,
+            include_irrelevant_elements=include_irrelevant_elements,
+            sections=sections,
+        )
+
+
+def _get_text(html: str) -> str:
+    text = _TAG.sub("", _SEPARATING_TAG.sub(" ", html))
+    text = html_lib.unescape(text)
+    return _WHITESPACE.sub(" ", _DASHES.sub("-", text)).strip()
+
+
+def _normalize_form_type(form_type: str) -> str:
+    return _WHITESPACE.sub("", _DASHES.sub("-", form_type)).upper()
+
+
+def _find_registered_form_type(text: str) -> str | None:
+    form_type = _normalize_form_type(text)
+    for candidate in (form_type, form_type.removesuffix("/A")):
+        if candidate in PARSERS_BY_FORM_TYPE:
+            return candidate
+    return None
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.auto_parser import (
+    AutoParser,
+    get_parser_cls,
+)
+from sec_parser.processing_engine.types import ParsingOptions
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.processing_engine.core import AbstractSemanticElementParser
+    from sec_parser.processing_engine.parse_cache import ParseCache
+    from sec_parser.semantic_elements.detached_semantic_element import (
+        DetachedSemanticElement,
+    )
+
+# A document is given either as a path to an HTML file, or as its raw contents.
+DocumentSource = Union[str, os.PathLike, bytes]
+
+# Documents are grouped into chunks so that small documents don't each pay
+# the inter-process round trip. Each worker gets about this many chunks,
+# which keeps the workers busy until the end of the batch.
+_CHUNKS_PER_WORKER = 4
+# Each worker has at most this many chunks submitted at a time, so that when
+# a worker dies, only the chunks that were being parsed are suspected of
+# killing it, rather than all of the chunks of the batch.
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class BatchParseResult:
+    """
+    The outcome of parsing a single document with `parse_many`.
+
+    The elements are detached records (see `parse_detached`), so that they
+    are cheap to send between processes. If the document could not be
+    parsed, `elements` is None and `error` describes the failure.
+    """
+
+    index: int
+    source: str | None
+    elements: tuple[DetachedSemanticElement, ...] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _Document:
+    index: int
+    source: DocumentSource
+    size: int
+
+
+# The parser of the current worker process, created once per process.
+_worker_parser: AbstractSemanticElementParser | AutoParser | None = None
+
+
+def parse_many(
+    sources: Iterable[DocumentSource],
+    *,
+    form_type: str | None = "10-Q",
+    workers: int | None = None,
+    parsing_options: ParsingOptions | None = None,
+    parse_cache: ParseCache | None = None,
+) -> Iterator[BatchParseResult]:
+    """
+    Parse many documents in parallel, using a pool of worker processes.
+
+    Each source is either a path to an HTML file (`str` or `os.PathLike`),
+    which is read by the worker itself, or the raw HTML contents (`bytes`).
+
+    Results are yielded as soon as they are ready, so they don't come back
+    in the input order; `BatchParseResult.index` refers to the position of
+    the source in `sources`. A document that fails to parse yields a result
+    with an error, without affecting the other documents. That includes a
+    document that kills its worker process, e.g. by running out of memory:
+    the pool is then replaced, and the documents that were being parsed at
+    the time are parsed again, until the one that killed the worker is found.
+
+    If a ParseCache is given, the documents that were parsed before are
+    loaded from it instead.
+
+    With `form_type=None`, the form type of each document is detected
+    from its start (see `AutoParser`).
+
+    `workers` defaults to the number of CPUs. With `workers=0`, the
+    documents are parsed one by one in the current process.
+    """
+    parser_cls = AutoParser if form_type is None else get_parser_cls(form_type)
+    parsing_options = replace(
+        parsing_options or ParsingOptions(),
+        reuse_processing_steps=True,
+    )
+    documents = [
+        _Document(index, source, _get_size(source))
+        for index, source in enumerate(sources)
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 0:
+        # The parser is local to this call, so that batches that are parsed
+        # in the current process at the same time don't share it.
+        parser = parser_cls(parsing_options=parsing_options, parse_cache=parse_cache)
+        for document in documents:
+            yield _parse_document(document, parser)
+        return
+
+    chunks = deque(_split_into_chunks(documents, workers * _CHUNKS_PER_WORKER))
+    # The documents that were parsed when a worker died, each in a chunk of
+    # its own. They are parsed again one at a time, so that a worker that
+    # dies then was killed by the document it parsed, and not by another one.
+    suspects: deque[list[_Document]] = deque()
+    initargs = (parser_cls, parsing_options, parse_cache)
+    while chunks or suspects:
+        if chunks:
+            queue, max_workers = chunks, workers
+            max_in_flight = workers * _CHUNKS_IN_FLIGHT_PER_WORKER
+        else:
+            queue, max_workers, max_in_flight = suspects, 1, 1
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+        try:
+            yield from _parse_until_broken(executor, max_in_flight, queue, suspects)
+        finally:
+            # If the caller stops early, e.g. by breaking out of the loop, the
+            # chunks that haven't started yet are dropped instead of parsed.
+            executor.shutdown(cancel_futures=True)
+
+
+def _parse_until_broken(
+    executor: ProcessPoolExecutor,
+    max_in_flight: int,
+    queue: deque[list[_Document]],
+    suspects: deque[list[_Document]],
+) -> Iterator[BatchParseResult]:
+    """
+    Parse the chunks of the queue, until it is empty or a worker dies. The
+    chunks that were being parsed when the worker died are split in half
+    and put back in the queue, and the single documents are suspected.
+    """
+    pending: dict[Future[list[BatchParseResult]], list[_Document]] = {}
+    is_broken = False
+    while pending or (queue and not is_broken):
+        while queue and not is_broken and len(pending) < max_in_flight:
+            chunk = queue.popleft()
+            try:
+                pending[executor.submit(_parse_chunk, chunk)] = chunk
+            except BrokenProcessPool:
+                # A worker died before any of its chunks failed
+                queue.appendleft(chunk)
+                is_broken = True
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            chunk = pending.pop(future)
+            try:
+                results = future.result()
+            except BrokenProcessPool as e:
+                is_broken = True
+                if len(chunk) > 1:
+                    middle = len(chunk) // 2
+                    queue.extendleft([chunk[middle:], chunk[:middle]])
+                elif queue is not suspects:
+                    suspects.append(chunk)
+                else:
+                    # The document was parsed alone, so it killed the worker
+                    yield _create_error_result(chunk[0], e)
+                continue
+            yield from results
+
+
+def _get_size(source: DocumentSource) -> int:
+    if isinstance(source, bytes):
+        return len(source)
+    try:
+        return Path(source).stat().st_size
+    except OSError:
+        # The error is reported by the worker, when reading the file.
+        return 0
+
+
+def _split_into_chunks(
+    documents: list[_Document],
+    max_chunk_count: int,
+) -> list[list[_Document]]:
+    """
+    Group the documents into chunks of roughly equal total size, with the
+    largest documents scheduled first, so that a large document submitted
+    late does not keep a single worker busy after all others are done.
+    """
+    total_size = sum(d.size for d in documents)
+    target_size = max(1, total_size // max(1, max_chunk_count))
+    chunks: list[list[_Document]] = []
+    chunk: list[_Document] = []
+    chunk_size = 0
+    for document in sorted(documents, key=lambda d: d.size, reverse=True):
+        if chunk and chunk_size + document.size > target_size:
+            chunks.append(chunk)
+            chunk = []
+            chunk_size = 0
+        chunk.append(document)
+        chunk_size += document.size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _init_worker(
+    parser_cls: type[AbstractSemanticElementParser | AutoParser],
+    parsing_options: ParsingOptions,
+    parse_cache: ParseCache | None,
+) -> None:
+    global _worker_parser  # noqa: PLW0603
+    _worker_parser = parser_cls(
+        parsing_options=parsing_options,
+        parse_cache=parse_cache,
+    )
+
+
+def _parse_chunk(chunk: list[_Document]) -> list[BatchParseResult]:
+    if _worker_parser is None:  # pragma: no cover
+        msg = "The worker was not initialized"
+        raise SecParserValueError(msg)
+    return [_parse_document(document, _worker_parser) for document in chunk]
+
+
+def _parse_document(
+    document: _Document,
+    parser: AbstractSemanticElementParser | AutoParser,
+) -> BatchParseResult:
+    try:
+        html = (
+            document.source
+            if isinstance(document.source, bytes)
+            else Path(document.source).read_bytes()
+        )
+        elements = parser.parse_detached(html)
+        return BatchParseResult(
+            index=document.index,
+            source=_describe_source(document.source),
+            elements=tuple(elements),
+        )
+    except Exception as e:  # noqa: BLE001
+        return _create_error_result(document, e)
+
+
+def _create_error_result(document: _Document, error: Exception) -> BatchParseResult:
+    return BatchParseResult(
+        index=document.index,
+        source=_describe_source(document.source),
+        error=f"{type(error).__name__}: {error}",
+    )
+
+
+def _describe_source(source: DocumentSource) -> str | None:
+    return None if isinstance(source, bytes) else os.fspath(source)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+import xxhash
+
+from sec_parser.exceptions import SecParserValueError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Hashable
+
+    from sec_parser.processing_engine.html_tag import HtmlTag
+
+T = TypeVar("T")
+
+
+class ClassificationMemo:
+    """
+    ClassificationMemo is an optional in-memory memo of the classification
+    outcomes that depend only on the HTML of an element, such as whether it
+    is a table, an image or empty, or the style of its text. Filings of the
+    same company repeat many identical blocks from one filing to the next,
+    e.g. cover pages, disclaimers and signatures, so these outcomes can be
+    reused across documents.
+
+    The outcomes are keyed by a hash of the source code of the tag, like its
+    `html_hash`, together with the context that the outcome depends on, if
+    any, such as the style inherited from the parent tags. The steps that
+    depend on the surrounding elements, such as the page header and the top
+    section classifiers, don't use the memo.
+
+    The memo holds at most `max_entries` outcomes, and removes the least
+    recently used ones when it is full. It can be shared by several parsers,
+    also across threads, as long as they parse the HTML with the same kind of
+    HtmlTagParser, since the trees of the same source may differ between the
+    backends.
+
+    Usage:
+        memo = ClassificationMemo(max_entries=100_000)
+        parser = Edgar10QParser(classification_memo=memo)
+        for html in filings:
+            elements = parser.parse(html)
+    """
+
+    def __init__(self, *, max_entries: int = 100_000) -> None:
+        if max_entries <= 0:
+            msg = f"max_entries must be positive, got {max_entries}"
+            raise SecParserValueError(msg)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self,
+        name: str,
+        html_tag: HtmlTag,
+        compute: Callable[[], T],
+        *,
+        context: Hashable | None = None,
+    ) -> T:
+        """
+        Return the outcome with the given name for the HTML of the tag, in
+        the given context, computing and storing it on a miss.
+        """
+        key = (name, _get_content_hash(html_tag), context)
+        with self._lock:
+            try:
+                outcome = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return outcome  # type: ignore[return-value]
+
+        outcome = compute()
+        with self._lock:
+            self._entries[key] = outcome
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return outcome
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _get_content_hash(html_tag: HtmlTag) -> bytes:
+    # The original source of the tag is hashed without copying it, if it is
+    # known. Otherwise, e.g. for tags created during processing, the source
+    # code is serialized from the tree. The hash is wider than `html_hash`,
+    # as a memo shared by many documents would run into its collisions.
+    source = html_tag.get_source_slice()
+    if source is None:
+        return xxhash.xxh3_128_digest(html_tag.get_source_code())
+    return xxhash.xxh3_128_digest(source)
@@ -0,0 +1,559 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from contextlib import suppress
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any, BinaryIO, Union
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.semantic_elements.abstract_semantic_element import (
+    AbstractSemanticElement,
+)
+from sec_parser.semantic_elements.detached_semantic_element import (
+    DetachedSemanticElement,
+)
+from sec_parser.semantic_elements.highlighted_text_element import TextStyle
+from sec_parser.semantic_tree.semantic_tree import SemanticTree
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.semantic_tree.tree_node import TreeNode
+
+    ColumnarSource = Union[
+        SemanticTree,
+        Iterable[Union[AbstractSemanticElement, DetachedSemanticElement]],
+    ]
+
+# Bump this whenever the layout of the files changes, so that the old files
+# are rejected instead of being misread.
+COLUMNAR_FORMAT_VERSION = 1
+
+_MAGIC = b"SECPCOL\0"
+# The magic, the format version and the length of the JSON metadata
+_PREAMBLE = struct.Struct("<8sII")
+# Every column starts at a multiple of this, so that it can be cast in place
+_ALIGNMENT = 8
+_NONE = -1
+
+_TEXT_STYLE_FIELDS = tuple(f.name for f in fields(TextStyle))
+# The fields of a TextStyle are stored as the lower bits of a byte, and the
+# highest bit tells whether the element has a text style at all.
+_HAS_TEXT_STYLE = 0x80
+if len(_TEXT_STYLE_FIELDS) >= _HAS_TEXT_STYLE.bit_length():  # pragma: no cover
+    msg = "TextStyle has too many fields for the style bitfield"
+    raise RuntimeError(msg)
+
+# The columns with one item per element, and the type codes of their items
+_ROW_COLUMNS = {
+    "class_ids": "H",
+    "levels": "h",
+    "section_ids": "i",
+    "styles": "B",
+    "inner_ends": "I",
+    "node_ends": "I",
+}
+
+
+def dumps_columnar(source: ColumnarSource) -> bytes:
+    """
+    Serialize a list of elements, or a SemanticTree, into the columnar
+    format that is loaded by ColumnarDocument.
+
+    The elements are stored in pre-order, with the inner elements of the
+    composite elements right after them, followed by the child nodes of the
+    tree, if any. Each property of the elements is stored as a single
+    column, i.e. an array with one item per element, such as the class ids,
+    the levels, the section ids and the style bitfields. The texts of all
+    elements are concatenated into a single UTF-8 buffer, which is indexed
+    by their offsets.
+    """
+    return _ColumnarWriter(source).write()
+
+
+def dump_columnar(source: ColumnarSource, file: str | os.PathLike | BinaryIO) -> None:
+    """Serialize the elements or the tree into a file (see `dumps_columnar`)."""
+    data = dumps_columnar(source)
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as f:  # noqa: PTH123
+            f.write(data)
+    else:
+        file.write(data)
+
+
+class ColumnarDocument:
+    """
+    ColumnarDocument is a read-only view of a document serialized with
+    `dumps_columnar`. The columns are used in place, without copying or
+    decoding them up front, so that opening a file only maps it into memory.
+    The elements are lazy views, which read their properties from the
+    columns when they are accessed.
+
+    The document is a sequence of the (top-level) elements that were
+    serialized, or of the elements of all nodes of a tree, in pre-order.
+    The elements within a top section, such as "part2item1a", can be
+    accessed directly by `get_section`.
+
+    Usage:
+        dump_columnar(parser.parse(html), "filing.secp")
+        with ColumnarDocument.open("filing.secp") as document:
+            risk_factors = document.get_section("part2item1a")
+            texts = [element.text for element in risk_factors]
+    """
+
+    def __init__(self, buffer: bytes | bytearray | memoryview | mmap.mmap) -> None:
+        view = memoryview(buffer)
+        if len(view) < _PREAMBLE.size:
+            msg = "Not a columnar document: the data is too short"
+            raise SecParserValueError(msg)
+        magic, version, metadata_length = _PREAMBLE.unpack_from(view)
+        if magic != _MAGIC:
+            msg = "Not a columnar document: invalid magic bytes"
+            raise SecParserValueError(msg)
+        if version != COLUMNAR_FORMAT_VERSION:
+            msg = f"Unsupported columnar format version: {version}"
+            raise SecParserValueError(msg)
+        metadata_end = _PREAMBLE.size + metadata_length
+        metadata = json.loads(bytes(view[_PREAMBLE.size : metadata_end]))
+        self._class_names: list[str] = metadata["class_names"]
+        self._section_names: list[str] = metadata["section_names"]
+        is_native = metadata["byteorder"] == sys.byteorder
+
+        self._buffer = view
+        self._mmap: mmap.mmap | None = None
+        self._columns: dict[str, memoryview] = {}
+        for name, (typecode, offset, count) in metadata["columns"].items():
+            itemsize = array(typecode).itemsize
+            column = view[offset : offset + count * itemsize]
+            if is_native or itemsize == 1:
+                column = column.cast(typecode)
+            else:
+                # Only a file written on a machine of another byte order is
+                # copied, to swap the bytes of its items.
+                swapped = array(typecode, column.tobytes())
+                swapped.byteswap()
+                column = memoryview(swapped)
+            self._columns[name] = column
+
+        self._text = self._columns["text"]
+        self._text_offsets = self._columns["text_offsets"]
+        self._html_hashes = self._columns["html_hashes"]
+        self._html_hash_offsets = self._columns["html_hash_offsets"]
+        self._class_ids = self._columns["class_ids"]
+        self._levels = self._columns["levels"]
+        self._section_ids = self._columns["section_ids"]
+        self._styles = self._columns["styles"]
+        self._source_spans = self._columns["source_spans"]
+        self._inner_ends = self._columns["inner_ends"]
+        self._node_ends = self._columns["node_ends"]
+        self._node_rows = self._columns["node_rows"]
+        self._section_ranges = self._columns["section_ranges"]
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> ColumnarDocument:  # noqa: A003
+        """Map the file into memory, and return the document it holds."""
+        with open(path, "rb") as f:  # noqa: PTH123
+            if os.fstat(f.fileno()).st_size < _PREAMBLE.size:
+                msg = f"Not a columnar document: {path}"
+                raise SecParserValueError(msg)
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            document = cls(mapped)
+        except BaseException:
+            # The views of a partially loaded document may still hold on to
+            # the mapping, in which case it is unmapped once they are freed.
+            with suppress(BufferError):
+                mapped.close()
+            raise
+        document._mmap = mapped  # noqa: SLF001
+        return document
+
+    def close(self) -> None:
+        """
+        Release the underlying buffer, and unmap the file, if the document
+        was opened from one. The elements can't be accessed afterwards.
+        """
+        for column in self._columns.values():
+            column.release()
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> ColumnarDocument:  # noqa: PYI034
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._node_rows)
+
+    def __getitem__(self, index: int) -> ColumnarElement:
+        return ColumnarElement(self, self._node_rows[index])
+
+    def __iter__(self) -> Iterator[ColumnarElement]:
+        for row in self._node_rows:
+            yield ColumnarElement(self, row)
+
+    @property
+    def root_nodes(self) -> list[ColumnarTreeNode]:
+        """
+        The root nodes of the serialized tree. For a serialized list of
+        elements, these are all of its elements, without any children.
+        """
+        return self._get_nodes(0, len(self._class_ids))
+
+    @property
+    def sections(self) -> list[str]:
+        """The identifiers of the top sections of the document, in order."""
+        ranges = self._section_ranges
+        found = dict.fromkeys(
+            self._section_names[ranges[i]] for i in range(0, len(ranges), 3)
+        )
+        return list(found)
+
+    def get_section(self, identifier: str) -> list[ColumnarElement]:
+        """
+        Return the elements within the top section, such as "part2item1a",
+        from its title up to the next title of the same or a higher level.
+        """
+        elements: list[ColumnarElement] = []
+        ranges = self._section_ranges
+        node_rows = self._node_rows
+        for i in range(0, len(ranges), 3):
+            if self._section_names[ranges[i]] != identifier:
+                continue
+            start = bisect_left(node_rows, ranges[i + 1])
+            end = bisect_left(node_rows, ranges[i + 2])
+            elements.extend(
+                ColumnarElement(self, node_rows[j]) for j in range(start, end)
+            )
+        return elements
+
+    def detach(self) -> list[DetachedSemanticElement]:
+        """Load all elements of the document, as detached records."""
+        return [element.detach() for element in self]
+
+    def _get_nodes(self, start: int, end: int) -> list[ColumnarTreeNode]:
+        # The nodes are stored in pre-order, so the next sibling of a node
+        # starts right after the end of its subtree.
+        nodes = []
+        row = start
+        while row < end:
+            nodes.append(ColumnarTreeNode(self, row))
+            row = self._node_ends[row]
+        return nodes
+
+    def _get_text(self, row: int) -> str:
+        offsets = self._text_offsets
+        return str(self._text[offsets[row] : offsets[row + 1]], "utf-8")
+
+    def _get_html_hash(self, row: int) -> str:
+        offsets = self._html_hash_offsets
+        return str(self._html_hashes[offsets[row] : offsets[row + 1]], "ascii")
+
+
+class ColumnarElement:
+    """
+    A lazy view of an element of a ColumnarDocument, with the same properties
+    as a DetachedSemanticElement. Each property is read from the columns of
+    the document when it is accessed.
+    """
+
+    __slots__ = ("_document", "_row")
+
+    def __init__(self, document: ColumnarDocument, row: int) -> None:
+        self._document = document
+        self._row = row
+
+    @property
+    def cls_name(self) -> str:
+        document = self._document
+        return document._class_names[document._class_ids[self._row]]  # noqa: SLF001
+
+    @property
+    def text(self) -> str:
+        return self._document._get_text(self._row)  # noqa: SLF001
+
+    @property
+    def html_hash(self) -> str:
+        return self._document._get_html_hash(self._row)  # noqa: SLF001
+
+    @property
+    def level(self) -> int | None:
+        level = self._document._levels[self._row]  # noqa: SLF001
+        return None if level == _NONE else level
+
+    @property
+    def section_type(self) -> str | None:
+        document = self._document
+        section_id = document._section_ids[self._row]  # noqa: SLF001
+        return None if section_id == _NONE else document._section_names[section_id]  # noqa: SLF001
+
+    @property
+    def text_style(self) -> TextStyle | None:
+        bits = self._document._styles[self._row]  # noqa: SLF001
+        if not bits & _HAS_TEXT_STYLE:
+            return None
+        return TextStyle(
+            **{
+                name: bool(bits & (1 << i)) for i, name in enumerate(_TEXT_STYLE_FIELDS)
+            },
+        )
+
+    @property
+    def source_span(self) -> tuple[int, int] | None:
+        spans = self._document._source_spans  # noqa: SLF001
+        start = spans[2 * self._row]
+        return None if start == _NONE else (start, spans[2 * self._row + 1])
+
+    @property
+    def inner_elements(self) -> tuple[ColumnarElement, ...]:
+        document = self._document
+        inner_ends = document._inner_ends  # noqa: SLF001
+        inner_elements = []
+        row = self._row + 1
+        while row < inner_ends[self._row]:
+            inner_elements.append(ColumnarElement(document, row))
+            row = inner_ends[row]
+        return tuple(inner_elements)
+
+    def detach(self) -> DetachedSemanticElement:
+        """Load the element, and its inner elements, as a detached record."""
+        return DetachedSemanticElement(
+            cls_name=self.cls_name,
+            text=self.text,
+            html_hash=self.html_hash,
+            level=self.level,
+            section_type=self.section_type,
+            text_style=self.text_style,
+            source_span=self.source_span,
+            inner_elements=tuple(e.detach() for e in self.inner_elements),
+        )
+
+    def to_dict(
+        self,
+        *,
+        include_previews: bool = False,
+        include_contents: bool = False,
+    ) -> dict[str, Any]:
+        return self.detach().to_dict(
+            include_previews=include_previews,
+            include_contents=include_contents,
+        )
+
+    def __repr__(self) -> str:
+        return f"Columnar{self.cls_name}<{self.html_hash}>"
+
+
+class ColumnarTreeNode:
+    """A lazy view of a node of a SemanticTree stored in a ColumnarDocument."""
+
+    __slots__ = ("_document", "_row")
+
+    def __init__(self, document: ColumnarDocument, row: int) -> None:
+        self._document = document
+        self._row = row
+
+    @property
+    def semantic_element(self) -> ColumnarElement:
+        return ColumnarElement(self._document, self._row)
+
+    @property
+    def children(self) -> list[ColumnarTreeNode]:
+        document = self._document
+        return document._get_nodes(  # noqa: SLF001
+            document._inner_ends[self._row],  # noqa: SLF001
+            document._node_ends[self._row],  # noqa: SLF001
+        )
+
+    def get_descendants(self) -> Iterator[ColumnarTreeNode]:
+        for child in self.children:
+            yield child
+            yield from child.get_descendants()
+
+    @property
+    def text(self) -> str:
+        return self.semantic_element.text
+
+    def __repr__(self) -> str:
+        return f"ColumnarTreeNode(children={len(self.children)})"
+
+
+class _ColumnarWriter:
+    def __init__(self, source: ColumnarSource) -> None:
+        self._source = source
+        self._class_ids: dict[str, int] = {}
+        self._section_ids: dict[str, int] = {}
+        self._columns = {
+            name: array(typecode) for name, typecode in _ROW_COLUMNS.items()
+        }
+        self._text = bytearray()
+        self._text_offsets = array("Q", [0])
+        self._html_hashes = bytearray()
+        self._html_hash_offsets = array("Q", [0])
+        self._source_spans = array("q")
+        self._node_rows = array("I")
+
+    def write(self) -> bytes:
+        if isinstance(self._source, SemanticTree):
+            for node in self._source:
+                self._add_node(node)
+        else:
+            for element in self._source:
+                self._add_element(_detach(element), is_node=True)
+
+        columns: dict[str, array | bytearray] = {
+            **self._columns,
+            "text_offsets": self._text_offsets,
+            "html_hash_offsets": self._html_hash_offsets,
+            "source_spans": self._source_spans,
+            "node_rows": self._node_rows,
+            "section_ranges": self._get_section_ranges(),
+            "text": self._text,
+            "html_hashes": self._html_hashes,
+        }
+        column_layout: dict[str, list[Any]] = {}
+        offset = 0
+        for name, column in columns.items():
+            typecode = column.typecode if isinstance(column, array) else "B"
+            column_layout[name] = [typecode, offset, len(column)]
+            offset += _align(len(column) * array(typecode).itemsize)
+        metadata = {
+            "byteorder": sys.byteorder,
+            "class_names": list(self._class_ids),
+            "section_names": list(self._section_ids),
+            "columns": column_layout,
+        }
+        # The offsets of the columns in the metadata depend on the length of
+        # the metadata itself, so it is padded up to the first column.
+        base = 0
+        encoded_metadata = _encode_metadata(metadata, base)
+        while _PREAMBLE.size + len(encoded_metadata) > base:
+            base = _align(_PREAMBLE.size + len(encoded_metadata))
+            encoded_metadata = _encode_metadata(metadata, base)
+        encoded_metadata += b" " * (base - _PREAMBLE.size - len(encoded_metadata))
+
+        data = bytearray(
+            _PREAMBLE.pack(_MAGIC, COLUMNAR_FORMAT_VERSION, len(encoded_metadata)),
+        )
+        data += encoded_metadata
+        for column in columns.values():
+            data += bytes(_align(len(data)) - len(data))
+            data += column if isinstance(column, bytearray) else column.tobytes()
+        return bytes(data)
+
+    def _add_node(self, node: TreeNode) -> None:
+        row = self._add_element(_detach(node.semantic_element), is_node=True)
+        for child in node.children:
+            self._add_node(child)
+        self._columns["node_ends"][row] = len(self._columns["class_ids"])
+
+    def _add_element(self, element: DetachedSemanticElement, *, is_node: bool) -> int:
+        columns = self._columns
+        row = len(columns["class_ids"])
+        if is_node:
+            self._node_rows.append(row)
+        columns["class_ids"].append(
+            self._class_ids.setdefault(element.cls_name, len(self._class_ids)),
+        )
+        columns["levels"].append(_NONE if element.level is None else element.level)
+        columns["section_ids"].append(
+            _NONE
+            if element.section_type is None
+            else self._section_ids.setdefault(
+                element.section_type,
+                len(self._section_ids),
+            ),
+        )
+        columns["styles"].append(_get_style_bits(element.text_style))
+        self._text += element.text.encode()
+        self._text_offsets.append(len(self._text))
+        self._html_hashes += element.html_hash.encode("ascii")
+        self._html_hash_offsets.append(len(self._html_hashes))
+        self._source_spans.extend(element.source_span or (_NONE, _NONE))
+        columns["inner_ends"].append(0)
+        columns["node_ends"].append(0)
+
+        for inner_element in element.inner_elements:
+            self._add_element(inner_element, is_node=False)
+        end = len(columns["class_ids"])
+        columns["inner_ends"][row] = end
+        # Updated by `_add_node` once the child nodes are added.
+        columns["node_ends"][row] = end
+        return row
+
+    def _get_section_ranges(self) -> array:
+        """
+        Find the rows of each top section, which starts with its title and
+        ends with the next title of the same or a higher level. A title
+        within a composite element starts the section at the node of the
+        composite element, like in `TopSectionFilter`.
+        """
+        ranges: list[tuple[int, int, int]] = []
+        open_sections: list[tuple[int, int, int]] = []
+        node_rows = set(self._node_rows)
+        node_row = 0
+        for row, section_id in enumerate(self._columns["section_ids"]):
+            if row in node_rows:
+                node_row = row
+            if section_id == _NONE:
+                continue
+            level = self._columns["levels"][row]
+            while open_sections and open_sections[-1][0] >= level:
+                _, open_section_id, start = open_sections.pop()
+                ranges.append((start, open_section_id, node_row))
+            open_sections.append((level, section_id, node_row))
+        row_count = len(self._columns["class_ids"])
+        ranges.extend(
+            (start, section_id, row_count) for _, section_id, start in open_sections
+        )
+        # Sorted by their start, so that the sections are listed in order.
+        return array(
+            "I",
+            [
+                item
+                for start, section_id, end in sorted(ranges)
+                for item in (section_id, start, end)
+            ],
+        )
+
+
+def _detach(
+    element: AbstractSemanticElement | DetachedSemanticElement,
+) -> DetachedSemanticElement:
+    if isinstance(element, AbstractSemanticElement):
+        return element.detach()
+    return element
+
+
+def _get_style_bits(text_style: TextStyle | None) -> int:
+    if text_style is None:
+        return 0
+    bits = _HAS_TEXT_STYLE
+    for i, name in enumerate(_TEXT_STYLE_FIELDS):
+        if getattr(text_style, name):
+            bits |= 1 << i
+    return bits
+
+
+def _encode_metadata(metadata: dict[str, Any], base: int) -> bytes:
+    columns = {
+        name: [typecode, base + offset, count]
+        for name, (typecode, offset, count) in metadata["columns"].items()
+    }
+    return json.dumps(
+        {**metadata, "columns": columns},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
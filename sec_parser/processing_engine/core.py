@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import nullcontext
+from time import perf_counter
 from typing import TYPE_CHECKING, Callable
 
+from sec_parser.exceptions import SecParserValueError
 from sec_parser.processing_engine.html_tag_parser import (
     AbstractHtmlTagParser,
     HtmlTagParser,
 )
+from sec_parser.processing_engine.processing_log import ProcessingLog
 from sec_parser.processing_engine.types import ParsingOptions
 from sec_parser.processing_steps.empty_element_classifier import EmptyElementClassifier
+from sec_parser.processing_steps.fused_elementwise_processing_step import (
+    fuse_elementwise_steps,
+)
 from sec_parser.processing_steps.highlighted_text_classifier import (
     HighlightedTextClassifier,
 )
@@ -37,6 +46,8 @@ from sec_parser.processing_steps.introductory_section_classifier import (
     IntroductorySectionElementClassifier,
 )
 from sec_parser.processing_steps.page_header_classifier import (
+    PageHeaderByDistanceToPagebreakCandidate,
+    PageHeaderCandidate,
     PageHeaderClassifier,
     PageHeaderByDistanceToPagebreakClassifier,
 )
@@ -52,6 +63,8 @@ from sec_parser.processing_steps.table_of_contents_classifier import (
 from sec_parser.processing_steps.text_classifier import TextClassifier
 from sec_parser.processing_steps.text_element_merger import TextElementMerger
 from sec_parser.processing_steps.title_classifier import TitleClassifier
+from sec_parser.processing_steps.top_section_filter import TopSectionFilter
+from sec_parser.processing_steps.top_section_manager import TopSectionManager
 from sec_parser.processing_steps.top_section_manager_for_10q import (
     TopSectionManagerFor10Q,
 )
@@ -70,7 +83,16 @@ from sec_parser.semantic_elements.semantic_elements import (
 from sec_parser.semantic_elements.table_element.table_element import TableElement
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from contextlib import AbstractContextManager
+
+    from sec_parser.processing_engine.classification_memo import ClassificationMemo
     from sec_parser.processing_engine.html_tag import HtmlTag
+    from sec_parser.processing_engine.instrumentation import (
+        DocumentRecorder,
+        ParsingInstrumentation,
+    )
+    from sec_parser.processing_engine.parse_cache import ParseCache
     from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
         AbstractProcessingStep,
     )
@@ -80,6 +102,20 @@ if TYPE_CHECKING:  # pragma: no cover
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
+    from sec_parser.semantic_elements.detached_semantic_element import (
+        DetachedSemanticElement,
+    )
+
+# Matches the text of any element that may hold a top section title, i.e.
+# anything that the part and item patterns of the top section managers match.
+# The titles are found within the top-level elements, so the top-level
+# elements that don't match can't hold one.
+_TOP_SECTION_TITLE_HINT = re.compile(r"part\s+i|item\s+\d", re.IGNORECASE)
+
+_TOP_SECTION_STEPS = (
+    TopSectionManager,
+    IntroductorySectionElementClassifier,
+)
 
 
 class AbstractSemanticElementParser(ABC):
@@ -123,10 +159,25 @@ class AbstractSemanticElementParser(ABC):
         *,
         parsing_options: ParsingOptions | None = None,
         html_tag_parser: AbstractHtmlTagParser | None = None,
+        instrumentation: ParsingInstrumentation | None = None,
+        parse_cache: ParseCache | None = None,
+        classification_memo: ClassificationMemo | None = None,
     ) -> None:
         self._get_steps = get_steps or self.get_default_steps
         self._parsing_options = parsing_options or ParsingOptions()
         self._html_tag_parser = html_tag_parser or HtmlTagParser()
+        # Records the metrics of each document and of each step, if given.
+        self._instrumentation = instrumentation
+        # Caches the results of `parse_detached` on disk, if given.
+        self._parse_cache = parse_cache
+        self._cache_configuration: tuple[str, ...] | None = None
+        # Reuses the element-local classification outcomes across documents,
+        # if given. It is passed to the default steps.
+        self._classification_memo = classification_memo
+        # Idle step pipelines, only used if `reuse_processing_steps` is set.
+        # Each document being parsed takes one out of the pool, so a single
+        # pipeline is never used for two documents at the same time.
+        self._step_pool: list[list[AbstractProcessingStep]] = []
 
     @abstractmethod
     def get_default_steps(self) -> list[AbstractProcessingStep]:
@@ -139,14 +190,90 @@ class AbstractSemanticElementParser(ABC):
         unwrap_elements: bool | None = None,
         include_containers: bool | None = None,
         include_irrelevant_elements: bool | None = None,
+        sections: Iterable[str] | None = None,
     ) -> list[AbstractSemanticElement]:
-        root_tags = self._html_tag_parser.parse(html)
-        return self.parse_from_tags(
-            root_tags,
+        """
+        Parse the HTML document into a list of semantic elements.
+
+        If `sections` is given, such as {"part2item1a"}, only the elements
+        within these top sections are processed by all of the steps, and
+        the other elements are irrelevant (see `parse_from_tags`).
+        """
+        with self._record_document(source_length=len(html)) as recorder:
+            start_time = perf_counter()
+            root_tags = self._html_tag_parser.parse(html)
+            if recorder is not None:
+                recorder.html_parsing_time = perf_counter() - start_time
+            return self.parse_from_tags(
+                root_tags,
+                unwrap_elements=unwrap_elements,
+                include_containers=include_containers,
+                include_irrelevant_elements=include_irrelevant_elements,
+                sections=sections,
+            )
+
+    def parse_detached(
+        self,
+        html: str | bytes,
+        *,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
+        sections: Iterable[str] | None = None,
+    ) -> list[DetachedSemanticElement]:
+        """
+        Parse the HTML document like `parse`, but return detached records
+        of the elements (see `AbstractSemanticElement.detach`), so that the
+        parsed document can be freed as soon as parsing is done.
+
+        If the parser has a ParseCache, a document that was parsed before,
+        with the same arguments, is loaded from the cache instead.
+        """
+        if sections is not None:
+            sections = sorted(sections)
+        if self._parse_cache is not None:
+            key = self._parse_cache.get_key(
+                html,
+                (
+                    *self._get_cache_configuration(),
+                    repr(
+                        (
+                            unwrap_elements,
+                            include_containers,
+                            include_irrelevant_elements,
+                            sections,
+                        ),
+                    ),
+                ),
+            )
+            if (cached_elements := self._parse_cache.get(key)) is not None:
+                return cached_elements
+
+        elements = self.parse(
+            html,
             unwrap_elements=unwrap_elements,
             include_containers=include_containers,
             include_irrelevant_elements=include_irrelevant_elements,
+            sections=sections,
         )
+        detached_elements = [element.detach() for element in elements]
+        if self._parse_cache is not None:
+            self._parse_cache.put(key, detached_elements)
+        return detached_elements
+
+    def _get_cache_configuration(self) -> tuple[str, ...]:
+        """
+        Return the configuration of the parser that its results depend on,
+        other than the version of sec-parser, for the keys of its ParseCache.
+        """
+        if self._cache_configuration is None:
+            self._cache_configuration = (
+                _get_qualified_name(type(self)),
+                self._html_tag_parser.cache_key,
+                repr(self._parsing_options),
+                *(step.cache_key for step in self._get_steps()),
+            )
+        return self._cache_configuration
 
     def unwrap_ix_tag(self, tag: HtmlTag) -> list[HtmlTag]:
         out: list[HtmlTag] = []
@@ -164,9 +291,46 @@ class AbstractSemanticElementParser(ABC):
         unwrap_elements: bool | None = None,
         include_containers: bool | None = None,
         include_irrelevant_elements: bool | None = None,
+        sections: Iterable[str] | None = None,
+    ) -> list[AbstractSemanticElement]:
+        """
+        Parse the top-level HTML tags into a list of semantic elements.
+
+        If `sections` is given, the top sections are found first, by
+        running the steps up to the top section manager only on the
+        top-level elements that may hold a top section title, a page break,
+        a page header or a page number. Then all of the steps run on these
+        elements, and on the elements within the given sections, while the
+        other elements are irrelevant and skipped by all of the steps.
+        Finally, the elements outside of the sections are irrelevant too.
+
+        The steps that look at the whole document only see part of it, so
+        the result may differ slightly from the same sections of a full
+        parse, e.g. if a title style is only used outside of the sections.
+        """
+        with self._record_document() as recorder:
+            elements = self._parse_from_tags(
+                root_tags,
+                unwrap_elements=unwrap_elements,
+                include_containers=include_containers,
+                include_irrelevant_elements=include_irrelevant_elements,
+                sections=sections,
+            )
+            if recorder is not None:
+                recorder.element_count = len(elements)
+            return elements
+
+    def _parse_from_tags(
+        self,
+        root_tags: list[HtmlTag],
+        *,
+        unwrap_elements: bool | None,
+        include_containers: bool | None,
+        include_irrelevant_elements: bool | None,
+        sections: Iterable[str] | None,
     ) -> list[AbstractSemanticElement]:
-        steps = self._get_steps()
         elements: list[AbstractSemanticElement] = []
+        log_mode = self._parsing_options.processing_log_mode
 
         for tag in root_tags:
             self.pre_merge_span_with_only_ix_non(tag)
@@ -184,13 +348,24 @@ class AbstractSemanticElementParser(ABC):
             # unwrap root level ix:continuation
             if tag.name == "ix:continuation":
                 elements += [
-                    NotYetClassifiedElement(child) for child in self.unwrap_ix_tag(tag)
+                    NotYetClassifiedElement(
+                        child,
+                        processing_log=ProcessingLog(log_mode),
+                    )
+                    for child in self.unwrap_ix_tag(tag)
                 ]
             else:
-                elements.append(NotYetClassifiedElement(tag))
+                elements.append(
+                    NotYetClassifiedElement(
+                        tag,
+                        processing_log=ProcessingLog(log_mode),
+                    ),
+                )
 
-        for step in steps:
-            elements = step.process(elements)
+        if sections is None:
+            elements = self._process_elements(elements)
+        else:
+            elements = self._process_sections(elements, frozenset(sections))
 
         if not include_irrelevant_elements:
             elements = [
@@ -203,6 +378,110 @@ class AbstractSemanticElementParser(ABC):
             include_containers=include_containers,
         )
 
+    def _process_elements(
+        self,
+        elements: list[AbstractSemanticElement],
+        *,
+        until_top_sections: bool = False,
+    ) -> list[AbstractSemanticElement]:
+        recorder = (
+            self._instrumentation.get_recorder()
+            if self._instrumentation is not None
+            else None
+        )
+        steps = self._acquire_steps()
+        try:
+            selected_steps = steps
+            if until_top_sections:
+                selected_steps = steps[: _get_top_section_steps_end(steps)]
+            for step in selected_steps:
+                if recorder is None:
+                    elements = step.process(elements)
+                else:
+                    elements = recorder.run_step(step, elements)
+        finally:
+            self._release_steps(steps)
+        return elements
+
+    def _process_sections(
+        self,
+        elements: list[AbstractSemanticElement],
+        sections: frozenset[str],
+    ) -> list[AbstractSemanticElement]:
+        # The elements that may hold a top section title, or page furniture
+        # such as page breaks and headers, are always processed, as the steps
+        # that look at the whole document depend on them. The others are only
+        # processed if they are within one of the sections, and are kept as
+        # placeholders otherwise, so that the steps still see the positions
+        # of the elements.
+        is_context = _get_context_elements(elements)
+
+        # Find the top sections first
+        log_mode = self._parsing_options.processing_log_mode
+        context_elements = self._process_elements(
+            [
+                (NotYetClassifiedElement if is_context[i] else IrrelevantElement)(
+                    e.html_tag,
+                    processing_log=ProcessingLog(log_mode),
+                )
+                for i, e in enumerate(elements)
+            ],
+            until_top_sections=True,
+        )
+        is_selected = [True] * len(elements)
+        if len(context_elements) == len(elements):
+            section_filter = TopSectionFilter(sections)
+            for i, element in enumerate(context_elements):
+                if is_context[i]:
+                    for e in CompositeSemanticElement.unwrap_elements([element]):
+                        section_filter.update_section(e)
+                else:
+                    is_selected[i] = section_filter.is_in_selected_section
+
+        elements = self._process_elements(
+            [
+                e
+                if is_context[i] or is_selected[i]
+                else IrrelevantElement.create_from_element(
+                    e,
+                    log_origin=TopSectionFilter.__name__,
+                )
+                for i, e in enumerate(elements)
+            ],
+        )
+        return TopSectionFilter(sections).process(elements)
+
+    def _record_document(
+        self,
+        *,
+        source_length: int | None = None,
+    ) -> AbstractContextManager[DocumentRecorder | None]:
+        if self._instrumentation is None:
+            return nullcontext()
+        return self._instrumentation.record_document(
+            self.__class__.__name__,
+            source_length=source_length,
+        )
+
+    def _acquire_steps(self) -> list[AbstractProcessingStep]:
+        if self._parsing_options.reuse_processing_steps:
+            try:
+                return self._step_pool.pop()
+            except IndexError:
+                pass
+        steps = self._get_steps()
+        if self._parsing_options.fuse_elementwise_steps:
+            steps = fuse_elementwise_steps(steps)
+        return steps
+
+    def _release_steps(self, steps: list[AbstractProcessingStep]) -> None:
+        if not self._parsing_options.reuse_processing_steps:
+            return
+        # Resetting right away frees the state of the processed document.
+        for step in steps:
+            step.reset()
+        self._step_pool.append(steps)
+
     def pre_merge_span_with_only_ix_non(self, tag: HtmlTag):
         if not tag.has_tag_children():
             return
@@ -212,10 +491,56 @@ class AbstractSemanticElementParser(ABC):
                 for descendant in tag._bs4.find_all():
                     descendant.decompose()
                 tag._bs4.string = text
+                tag.invalidate_feature_index()
         for child in tag.get_children():
             self.pre_merge_span_with_only_ix_non(child)
 
 
+def _get_context_elements(elements: list[AbstractSemanticElement]) -> list[bool]:
+    """
+    Mark the top-level elements that may hold a top section title, a page
+    break, a page header or a page number, i.e. a short text that occurs
+    several times, apart from its digits, or that is close to a possible
+    page break.
+    """
+    max_length = PageHeaderCandidate.TEXT_LENGTH_THRESHOLD
+    max_distance = PageHeaderByDistanceToPagebreakCandidate.DISTANCE_THRESHOLD
+    texts = [e.text for e in elements]
+    keys = [
+        "".join(c for c in text if not c.isdigit())
+        if len(text) <= max_length
+        else None
+        for text in texts
+    ]
+    counts = Counter(keys)
+
+    is_context = [_TOP_SECTION_TITLE_HINT.search(text) is not None for text in texts]
+    page_breaks = [i for i, text in enumerate(texts) if not text]
+    for i in page_breaks:
+        for j in range(i - max_distance, i + max_distance + 1):
+            if 0 <= j < len(texts) and keys[j] is not None:
+                is_context[j] = True
+    for i, key in enumerate(keys):
+        if key is not None and counts[key] > 1:
+            is_context[i] = True
+    return is_context
+
+
+def _get_top_section_steps_end(steps: list[AbstractProcessingStep]) -> int:
+    """Return the index after the steps that find the top sections."""
+    indices = [
+        i for i, step in enumerate(steps) if isinstance(step, _TOP_SECTION_STEPS)
+    ]
+    if not indices:
+        msg = "Parsing by sections requires a step that finds the top sections."
+        raise SecParserValueError(msg)
+    return indices[-1] + 1
+
+
+def _get_qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
 class Edgar10QParser(AbstractSemanticElementParser):
     """
     The Edgar10QParser class is responsible for parsing SEC EDGAR 10-Q
@@ -234,10 +559,18 @@ class Edgar10QParser(AbstractSemanticElementParser):
                 get_checks=get_checks or self.get_default_single_element_checks,
             ),
             PageBreakClassifier(types_to_process={NotYetClassifiedElement}),
-            ImageClassifier(types_to_process={NotYetClassifiedElement}),
-            EmptyElementClassifier(types_to_process={NotYetClassifiedElement}),
+            ImageClassifier(
+                types_to_process={NotYetClassifiedElement},
+                classification_memo=self._classification_memo,
+            ),
+            EmptyElementClassifier(
+                types_to_process={NotYetClassifiedElement},
+                classification_memo=self._classification_memo,
+            ),
             TableClassifier(
-                types_to_process={NotYetClassifiedElement}, check_threshold=True
+                types_to_process={NotYetClassifiedElement},
+                check_threshold=True,
+                classification_memo=self._classification_memo,
             ),
             TableOfContentsClassifier(types_to_process={TableElement}),
             PageHeaderByDistanceToPagebreakClassifier(
@@ -250,7 +583,10 @@ class Edgar10QParser(AbstractSemanticElementParser):
             TextClassifier(
                 types_to_process={NotYetClassifiedElement, TextPreMergedElement}
             ),
-            HighlightedTextClassifier(types_to_process={TextElement}),
+            HighlightedTextClassifier(
+                types_to_process={TextElement},
+                classification_memo=self._classification_memo,
+            ),
             SupplementaryTextClassifier(
                 types_to_process={TextElement, HighlightedTextElement},
             ),
@@ -291,10 +627,18 @@ class Edgar10KParser(AbstractSemanticElementParser):
                 get_checks=get_checks or self.get_default_single_element_checks,
             ),
             PageBreakClassifier(types_to_process={NotYetClassifiedElement}),
-            ImageClassifier(types_to_process={NotYetClassifiedElement}),
-            EmptyElementClassifier(types_to_process={NotYetClassifiedElement}),
+            ImageClassifier(
+                types_to_process={NotYetClassifiedElement},
+                classification_memo=self._classification_memo,
+            ),
+            EmptyElementClassifier(
+                types_to_process={NotYetClassifiedElement},
+                classification_memo=self._classification_memo,
+            ),
             TableClassifier(
-                types_to_process={NotYetClassifiedElement}, check_threshold=True
+                types_to_process={NotYetClassifiedElement},
+                check_threshold=True,
+                classification_memo=self._classification_memo,
             ),
             TableOfContentsClassifier(types_to_process={TableElement}),
             PageHeaderByDistanceToPagebreakClassifier(
@@ -307,7 +651,10 @@ class Edgar10KParser(AbstractSemanticElementParser):
             TextClassifier(
                 types_to_process={NotYetClassifiedElement, TextPreMergedElement}
             ),
-            HighlightedTextClassifier(types_to_process={TextElement}),
+            HighlightedTextClassifier(
+                types_to_process={TextElement},
+                classification_memo=self._classification_memo,
+            ),
             SupplementaryTextClassifier(
                 types_to_process={TextElement, HighlightedTextElement},
             ),
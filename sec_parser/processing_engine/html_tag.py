@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Callable
 
 import bs4
@@ -22,13 +25,18 @@ from sec_parser.utils.bs4_.has_tag_children import has_tag_children
 from sec_parser.utils.bs4_.has_text_outside_tags import has_text_outside_tags
 from sec_parser.utils.bs4_.is_unary_tree import is_unary_tree
 from sec_parser.utils.bs4_.table_check_data_cell import check_table_contains_text_page
-from sec_parser.utils.bs4_.table_to_markdown import TableToMarkdown
-from sec_parser.utils.bs4_.text_styles_metrics import compute_text_styles_metrics
+from sec_parser.utils.bs4_.table_grid import TableGrid
+from sec_parser.utils.bs4_.text_styles_metrics import (
+    compute_effective_style,
+    compute_text_styles_metrics,
+)
 from sec_parser.utils.bs4_.without_tags import without_tags
 from sec_parser.utils.bs4_.wrap_tags_in_new_parent import wrap_tags_in_new_parent
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.utils.bs4_.tag_feature_index import TagFeatureIndex, TagFeatures
 
 TEXT_PREVIEW_LENGTH = 40
 
@@ -39,6 +47,43 @@ opening_tag_pattern = re.compile(r"<ix:[^>]+>")
 closing_tag_pattern = re.compile(r"</ix:[^>]+>")
 
 
+class HtmlTagCacheStats:
+    """The hits and misses of the cached HtmlTag computations, by their name."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def record(self, name: str, *, hit: bool) -> None:
+        (self.hits if hit else self.misses)[name] += 1
+
+
+# The stats are only collected within `collect_cache_stats`, and are kept
+# per context, so that documents parsed by other threads are not counted.
+_cache_stats: ContextVar[HtmlTagCacheStats | None] = ContextVar(
+    "html_tag_cache_stats",
+    default=None,
+)
+
+
+@contextmanager
+def collect_cache_stats() -> Iterator[HtmlTagCacheStats]:
+    """Count the cache hits and misses of all HtmlTags within the block."""
+    stats = HtmlTagCacheStats()
+    token = _cache_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _cache_stats.reset(token)
+
+
+def _record_cache_access(name: str, *, hit: bool) -> None:
+    if (stats := _cache_stats.get()) is not None:
+        stats.record(name, hit=hit)
+
+
 class HtmlTag:
     """
     The HtmlTag class is a wrapper for BeautifulSoup4 Tag objects.
@@ -55,15 +100,20 @@ class HtmlTag:
        BeautifulSoup4 Tag class. This enhances the usability of the class.
 
     3. Caching: The HtmlTag class also caches processing results, improving
-       performance by avoiding unnecessary re-computation.
+       performance by avoiding unnecessary re-computation. Tags that belong
+       to a parsed document additionally share a document-level feature index,
+       so that the subtree aggregates are computed once for all nested tags.
     """
 
     def __init__(
         self,
         bs4_element: bs4.PageElement,
+        *,
+        feature_index: TagFeatureIndex | None = None,
     ) -> None:
         self._bs4: bs4.Tag = self._to_tag(bs4_element)
         self._parent: HtmlTag | None = None
+        self._feature_index = feature_index
 
         # We use cached properties to prevent performance issues in intensive loops.
         # As the source code is immutable, we can afford to use some extra memory
@@ -74,6 +124,7 @@ class HtmlTag:
         self._first_deepest_tag: HtmlTag | None | NotSetType = NotSet
         self._text_styles_metrics: dict[tuple[str, str], float] | None = None
         self._frozen_dict: frozendict | None = None
+        self._html_hash: str | None = None
         self._source_code: str | None = None
         self._pretty_source_code: str | None = None
         self._compatible_source_code: str | None = None
@@ -83,6 +134,7 @@ class HtmlTag:
         self._count_tags: dict[str, int] = {}
         self._has_text_outside_tags: dict[tuple[str, ...], bool] = {}
         self._contains_words: bool | None = None
+        self._table_grid: TableGrid | None = None
         self._markdown_table: str | None = None
 
     @property
@@ -90,9 +142,15 @@ class HtmlTag:
         if self._parent is None:
             parent = self._bs4.parent
             if parent is not None:
-                self._parent = HtmlTag(parent)
+                self._parent = HtmlTag(parent, feature_index=self._feature_index)
         return self._parent
 
+    def _get_features(self) -> TagFeatures | None:
+        """Return the indexed aggregates of this tag, if it is indexed."""
+        if self._feature_index is None:
+            return None
+        return self._feature_index.get(self._bs4)
+
     def get_source_code(
         self,
         *,
@@ -142,13 +200,47 @@ class HtmlTag:
                             suffix=f"</{self._bs4.name}>",
                         ),
                     ),
-                    "html_hash": xxhash.xxh32(self.get_source_code()).hexdigest(),
+                    "html_hash": self.html_hash,
                 },
             )
         return self._frozen_dict
 
+    @property
+    def html_hash(self) -> str:
+        """Return the hash of the source code of the HTML tag."""
+        _record_cache_access("html_hash", hit=self._html_hash is not None)
+        if self._html_hash is None:
+            self._html_hash = xxhash.xxh32(self.get_source_code()).hexdigest()
+        return self._html_hash
+
+    @property
+    def source_span(self) -> tuple[int, int] | None:
+        """
+        Return the start and end offsets of the tag in the parsed source, in
+        bytes. Returns None if they are not known, e.g. for tags created during
+        processing, or tags that were rearranged to fix malformed HTML.
+        """
+        if self._feature_index is None:
+            return None
+        return self._feature_index.get_source_span(self._bs4)
+
+    def get_source_slice(self) -> memoryview | None:
+        """
+        Return the original source of the tag, without copying or
+        re-serializing it. Returns None if `source_span` is not known.
+        """
+        span = self.source_span
+        if span is None or self._feature_index is None:
+            return None
+        source = self._feature_index.source
+        if source is None:  # pragma: no cover
+            return None
+        start, end = span
+        return memoryview(source)[start:end]
+
     def contains_words(self) -> bool:
         """Return True if the semantic element contains text."""
+        _record_cache_access("contains_words", hit=self._contains_words is not None)
         if self._contains_words is None:
             self._contains_words = (
                 any(char.isalnum() for char in self.text) if self.text else False
@@ -161,7 +253,16 @@ class HtmlTag:
         `text` property recursively extracts text from the child tags.
         The result is cached as the underlying data doesn't change.
         """
+        _record_cache_access("text", hit=self._text is not None)
         if self._text is None:
+            features = self._get_features()
+            if (
+                features is not None
+                and self._bs4.interesting_string_types
+                == bs4.Tag.DEFAULT_INTERESTING_STRING_TYPES
+            ):
+                self._text = features.text
+                return self._text
             texts: list[str] = []
             for text in self._bs4.stripped_strings:
                 texts.append(" ".join([t.strip() for t in text.split("\n")]))
@@ -186,9 +287,10 @@ class HtmlTag:
         return has_tag_children(self._bs4)
 
     def get_children(self) -> list[HtmlTag]:
+        _record_cache_access("children", hit=self._children is not None)
         if self._children is None:
             self._children = [
-                HtmlTag(child)
+                HtmlTag(child, feature_index=self._feature_index)
                 for child in self._bs4.children
                 if not (isinstance(child, bs4.NavigableString) and child.strip() == "")
             ]
@@ -223,7 +325,15 @@ class HtmlTag:
         return True, as there is a 'b' tag within the descendants of the 'div' tag.
         """
         tag_key = (name, include_self)
+        _record_cache_access("contains_tag", hit=tag_key in self._contains_tag)
         if self._contains_tag.get(tag_key) is None:
+            features = self._get_features()
+            if features is not None:
+                self._contains_tag[tag_key] = features.contains_tag(
+                    name,
+                    include_self=include_self,
+                )
+                return self._contains_tag[tag_key]
             self._contains_tag[tag_key] = contains_tag(
                 self._bs4,
                 name,
@@ -241,7 +351,17 @@ class HtmlTag:
         tag within the descendants of the 'div' tag.
         """
         tag_names = tuple(tags if isinstance(tags, list) else [tags])
+        _record_cache_access(
+            "has_text_outside_tags",
+            hit=tag_names in self._has_text_outside_tags,
+        )
         if tag_names not in self._has_text_outside_tags:
+            features = self._get_features()
+            if features is not None:
+                self._has_text_outside_tags[tag_names] = (
+                    features.has_text_outside_tags(tag_names)
+                )
+                return self._has_text_outside_tags[tag_names]
             self._has_text_outside_tags[tag_names] = has_text_outside_tags(
                 self._bs4,
                 tag_names,
@@ -257,6 +377,7 @@ class HtmlTag:
         return a copy HtmlTag instance representing "<div><p>bar</p></div>".
         """
         tag_key = tuple(names)
+        _record_cache_access("without_tags", hit=tag_key in self._without_tags)
         if self._without_tags.get(tag_key) is None:
             self._without_tags[tag_key] = HtmlTag(
                 without_tags(
@@ -275,7 +396,12 @@ class HtmlTag:
         the 'div' tag.
         """
         tag_key = name
+        _record_cache_access("count_tags", hit=tag_key in self._count_tags)
         if self._count_tags.get(tag_key) is None:
+            features = self._get_features()
+            if features is not None:
+                self._count_tags[tag_key] = features.count_tags(name)
+                return self._count_tags[tag_key]
             self._count_tags[tag_key] = count_tags(
                 self._bs4,
                 name,
@@ -294,8 +420,14 @@ class HtmlTag:
         regardless of its children. This is because in the context of this application,
         'table' tags are always considered unary.
         """
+        _record_cache_access("is_unary_tree", hit=self._is_unary_tree is not None)
         if self._is_unary_tree is None:
-            self._is_unary_tree = is_unary_tree(self._bs4)
+            features = self._get_features()
+            self._is_unary_tree = (
+                features.is_unary_tree
+                if features is not None
+                else is_unary_tree(self._bs4)
+            )
         return self._is_unary_tree
 
     def get_text_styles_metrics(self) -> dict[tuple[str, str], float]:
@@ -317,10 +449,38 @@ class HtmlTag:
         Each dictionary entry corresponds to a unique style, (property, value) and
         the percentage of text it affects.
         """
+        _record_cache_access(
+            "text_styles_metrics",
+            hit=self._text_styles_metrics is not None,
+        )
         if self._text_styles_metrics is None:
-            self._text_styles_metrics = compute_text_styles_metrics(self._bs4)
+            features = self._get_features()
+            self._text_styles_metrics = (
+                features.get_text_styles_metrics()
+                if features is not None
+                else compute_text_styles_metrics(
+                    self._bs4,
+                    style_cascade=(
+                        self._feature_index.style_cascade
+                        if self._feature_index is not None
+                        else None
+                    ),
+                )
+            )
         return self._text_styles_metrics
 
+    def get_inherited_style(self) -> dict[str, str]:
+        """
+        Return the effective style of the parent tag, i.e. the styles that the
+        text of this tag inherits from outside of its own source code.
+        """
+        parent = self._bs4.parent
+        if parent is None:
+            return {}
+        if self._feature_index is not None:
+            return self._feature_index.style_cascade.get_effective_style(parent)
+        return compute_effective_style(parent)
+
     def is_ix_continuation(self) -> bool:
         for text_node in self._bs4.find_all(string=True, recursive=True):
             text: str = text_node.strip()
@@ -339,6 +499,10 @@ class HtmlTag:
         return False
 
     def get_approx_table_metrics(self) -> ApproxTableMetrics | None:
+        _record_cache_access(
+            "approx_table_metrics",
+            hit=self._approx_table_metrics is not NotSet,
+        )
         if self._approx_table_metrics is NotSet:
             self._approx_table_metrics = get_approx_table_metrics(self._bs4)
 
@@ -355,9 +519,16 @@ class HtmlTag:
     def is_table_of_content(self) -> bool:
         return check_table_contains_text_page(self._bs4)
 
+    def get_table_grid(self) -> TableGrid:
+        _record_cache_access("table_grid", hit=self._table_grid is not None)
+        if self._table_grid is None:
+            self._table_grid = TableGrid.from_tag(self._bs4)
+        return self._table_grid
+
     def table_to_markdown(self) -> str:
+        _record_cache_access("markdown_table", hit=self._markdown_table is not None)
         if self._markdown_table is None:
-            self._markdown_table = TableToMarkdown(self._bs4).convert()
+            self._markdown_table = self.get_table_grid().to_markdown()
         return self._markdown_table
 
     @staticmethod
@@ -383,18 +554,32 @@ class HtmlTag:
     ) -> HtmlTag:
         html_tags = tuple(tags)
         bs4_tags = [tag._bs4 for tag in html_tags]  # noqa: SLF001
+        for html_tag in html_tags:
+            # The tags are moved out of the indexed document.
+            html_tag.invalidate_feature_index()
 
         tag = HtmlTag(wrap_tags_in_new_parent(parent_tag_name, bs4_tags))
 
         tag._parent = html_tags[0].parent  # noqa: SLF001
         return tag
 
+    def invalidate_feature_index(self) -> None:
+        """
+        Has to be called after mutating the underlying bs4 tree,
+        so that the aggregates are recomputed from the current state.
+        """
+        if self._feature_index is not None:
+            self._feature_index.invalidate()
+
     def count_text_matches_in_descendants(
         self,
         predicate: Callable[[str], bool],
         *,
         exclude_links: bool | None = None,
     ) -> int:
+        features = self._get_features()
+        if features is not None:
+            return features.count_text_matches_in_descendants(predicate)
         return count_text_matches_in_descendants(
             self._bs4,
             predicate,
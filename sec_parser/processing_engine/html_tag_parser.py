@@ -8,6 +8,9 @@ from bs4.builder import XMLParsedAsHTMLWarning
 
 from sec_parser.exceptions import SecParserValueError
 from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.utils.bs4_.lxml_soup import parse_with_lxml
+from sec_parser.utils.bs4_.source_spans import SourceSpanIndex
+from sec_parser.utils.bs4_.tag_feature_index import TagFeatureIndex
 
 DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND = "lxml"
 
@@ -17,25 +20,56 @@ class AbstractHtmlTagParser(ABC):
     def parse(self, html: str | bytes) -> list[HtmlTag]:
         raise NotImplementedError  # pragma: no cover
 
+    @property
+    def cache_key(self) -> str:
+        """
+        Describe the configuration of the parser, for the keys of a ParseCache.
+        Parsers that may return different tags for the same HTML must have
+        different cache keys.
+        """
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
 
 class HtmlTagParser(AbstractHtmlTagParser):
     """
     The HtmlTagParser parses an HTML document using BeautifulSoup4.
-    It then wraps the parsed bs4.Tag objects into HtmlTag objects.
+    It then wraps the parsed bs4.Tag objects into HtmlTag objects,
+    which share a single feature index of the parsed document.
+
+    Unless `track_source_spans` is disabled, the offsets of the tags in
+    the source are recorded as well, see `HtmlTag.source_span`.
     """
 
-    def __init__(self, parser_backend: str | None = None) -> None:
+    def __init__(
+        self,
+        parser_backend: str | None = None,
+        *,
+        track_source_spans: bool = True,
+    ) -> None:
         default = DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND
         self._parser_backend = (parser_backend or default).lower().strip()
+        self._track_source_spans = track_source_spans
+
+    @property
+    def cache_key(self) -> str:
+        return (
+            f"{super().cache_key}(parser_backend={self._parser_backend!r}, "
+            f"track_source_spans={self._track_source_spans!r})"
+        )
 
     def parse(self, html: str | bytes) -> list[HtmlTag]:
         root: bs4.Tag = self._parse_to_bs4(html)
+        source_spans = (
+            SourceSpanIndex(root, html) if self._track_source_spans else None
+        )
+        feature_index = TagFeatureIndex(root, source_spans=source_spans)
 
         elements: list[HtmlTag] = []
         for child in root.children:
             if isinstance(child, bs4.NavigableString) and not child.strip():
                 continue
-            elements.append(HtmlTag(child))
+            elements.append(HtmlTag(child, feature_index=feature_index))
         if not elements:
             msg = (
                 "The HTML document did not contain any top-level tags. "
@@ -47,10 +81,11 @@ class HtmlTagParser(AbstractHtmlTagParser):
     def _parse_to_bs4(self, html: str | bytes) -> bs4.Tag:
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
-            root: bs4.Tag = bs4.BeautifulSoup(
-                html,
-                features=self._parser_backend,
-            )
+            soup = self._create_soup(html)
+        return self._get_root(soup)
+
+    def _get_root(self, soup: bs4.BeautifulSoup) -> bs4.Tag:
+        root: bs4.Tag = soup
         if root.html:
             root = root.html
             root = root.body if root.body else root
@@ -58,6 +93,9 @@ class HtmlTagParser(AbstractHtmlTagParser):
         root = self._find_root(root)
         return root
 
+    def _create_soup(self, html: str | bytes) -> bs4.BeautifulSoup:
+        return bs4.BeautifulSoup(html, features=self._parser_backend)
+
     def _find_root(self, root: bs4.Tag) -> bs4.Tag:
         child_count = 0
         first_child = None
@@ -81,3 +119,20 @@ class HtmlTagParser(AbstractHtmlTagParser):
             return root
         if child_count == 1:
             return self._find_root(first_child)
+
+
+class LxmlHtmlTagParser(HtmlTagParser):
+    """
+    The LxmlHtmlTagParser is a faster drop-in replacement for the HtmlTagParser.
+
+    It builds the BeautifulSoup tree straight from the parser events of lxml,
+    skipping the generic tree builder of BeautifulSoup. The resulting tree is
+    the same as the one of the HtmlTagParser with the default "lxml" backend,
+    so all processing steps and helpers work on it unchanged.
+    """
+
+    def __init__(self, *, track_source_spans: bool = True) -> None:
+        super().__init__("lxml", track_source_spans=track_source_spans)
+
+    def _create_soup(self, html: str | bytes) -> bs4.BeautifulSoup:
+        return parse_with_lxml(html)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable
+
+from loguru import logger
+
+from sec_parser.processing_engine.html_tag import collect_cache_stats
+from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+    AbstractElementwiseProcessingStep,
+    collect_element_counts,
+)
+from sec_parser.processing_steps.fused_elementwise_processing_step import (
+    FusedElementwiseProcessingStep,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
+        AbstractProcessingStep,
+    )
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+
+
+@dataclass(frozen=True)
+class StepReport:
+    """
+    The metrics of a single processing step, for a single document.
+
+    - `wall_time`: the time spent in the step, in seconds.
+    - `elements_seen`: the elements that the step visited, including the
+      inner elements of the composite elements it recursed into, counted
+      once per pass over the elements, e.g. twice for two-pass steps.
+    - `elements_processed`: the visits among them in which the step processed
+      the element, i.e. did not skip it. Steps that don't work element by
+      element are counted as seeing and processing all of the elements once.
+    - `type_transitions`: how many elements were turned from one type into
+      another, keyed by the names of both types. Elements that were merged
+      or split are not counted.
+    - `cache_hits` and `cache_misses`: the cached HtmlTag computations that
+      were reused or computed, by their name, e.g. "text".
+    """
+
+    name: str
+    wall_time: float
+    elements_seen: int
+    elements_processed: int
+    type_transitions: dict[tuple[str, str], int] = field(default_factory=dict)
+    cache_hits: dict[str, int] = field(default_factory=dict)
+    cache_misses: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class DocumentReport:
+    """
+    The metrics of parsing a single document.
+
+    - `parser`: the name of the parser class, e.g. "Edgar10QParser".
+    - `source_length`: the length of the parsed HTML, if it is known.
+    - `wall_time`: the total time spent parsing the document, in seconds.
+    - `html_parsing_time`: the part of it spent parsing the HTML into tags,
+      if the document was parsed from HTML.
+    - `element_count`: the number of returned elements.
+    - `steps`: the reports of the steps, in the order in which they ran.
+      When parsing by sections, the steps run twice (see `parse_from_tags`).
+    """
+
+    parser: str
+    source_length: int | None
+    wall_time: float
+    html_parsing_time: float | None
+    element_count: int
+    steps: tuple[StepReport, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as JSON-serializable data, e.g. for exporting it."""
+        result = asdict(self)
+        for step in result["steps"]:
+            step["type_transitions"] = [
+                {"from": from_type, "to": to_type, "count": count}
+                for (from_type, to_type), count in step["type_transitions"].items()
+            ]
+        return result
+
+
+ReportCallback = Callable[[DocumentReport], None]
+
+
+class ParsingInstrumentation:
+    """
+    ParsingInstrumentation is an opt-in hook of the parsers, which records
+    the metrics of each parsed document, and of each of its processing
+    steps, into a DocumentReport.
+
+    The report of each document is passed to the callbacks, e.g. to export
+    it to a metrics system, and the report of the last document is kept in
+    `last_report`. An error raised by a callback is logged, and does not
+    affect parsing.
+
+    Usage:
+        instrumentation = ParsingInstrumentation(callbacks=[print])
+        parser = Edgar10QParser(instrumentation=instrumentation)
+        elements = parser.parse(html)
+        report = instrumentation.last_report
+    """
+
+    def __init__(self, *, callbacks: Iterable[ReportCallback] = ()) -> None:
+        self._callbacks = list(callbacks)
+        self.last_report: DocumentReport | None = None
+
+    def add_callback(self, callback: ReportCallback) -> None:
+        self._callbacks.append(callback)
+
+    @contextmanager
+    def record_document(
+        self,
+        parser_name: str,
+        *,
+        source_length: int | None = None,
+    ) -> Iterator[DocumentRecorder]:
+        """
+        Record the document parsed within the block. Blocks nested within
+        the block of the same document record into the same report.
+        """
+        recorder = _current_recorder.get()
+        if recorder is not None and recorder.instrumentation is self:
+            yield recorder
+            return
+
+        recorder = DocumentRecorder(self, parser_name, source_length=source_length)
+        token = _current_recorder.set(recorder)
+        try:
+            yield recorder
+        finally:
+            _current_recorder.reset(token)
+        self._report(recorder.create_report())
+
+    def get_recorder(self) -> DocumentRecorder | None:
+        """Return the recorder of the document that is being parsed, if any."""
+        recorder = _current_recorder.get()
+        if recorder is None or recorder.instrumentation is not self:
+            return None
+        return recorder
+
+    def _report(self, report: DocumentReport) -> None:
+        self.last_report = report
+        for callback in self._callbacks:
+            try:
+                callback(report)
+            except Exception:  # noqa: BLE001, PERF203
+                logger.exception("Error in a parsing report callback")
+
+
+class DocumentRecorder:
+    """Records the metrics of a single document, see ParsingInstrumentation."""
+
+    def __init__(
+        self,
+        instrumentation: ParsingInstrumentation,
+        parser_name: str,
+        *,
+        source_length: int | None,
+    ) -> None:
+        self.instrumentation = instrumentation
+        self.html_parsing_time: float | None = None
+        self.element_count = 0
+        self._parser_name = parser_name
+        self._source_length = source_length
+        self._start_time = perf_counter()
+        self._steps: list[StepReport] = []
+
+    def run_step(
+        self,
+        step: AbstractProcessingStep,
+        elements: list[AbstractSemanticElement],
+    ) -> list[AbstractSemanticElement]:
+        """Run the step on the elements, recording its metrics."""
+        types_before = _get_types(elements)
+        element_count = _count_elements(elements)
+        with collect_cache_stats() as cache_stats, collect_element_counts() as counts:
+            start_time = perf_counter()
+            elements = step.process(elements)
+            wall_time = perf_counter() - start_time
+        if isinstance(
+            step,
+            (AbstractElementwiseProcessingStep, FusedElementwiseProcessingStep),
+        ):
+            elements_seen, elements_processed = counts.seen, counts.processed
+        else:
+            elements_seen = elements_processed = element_count
+        transitions: Counter[tuple[str, str]] = Counter()
+        _count_transitions(types_before, elements, transitions)
+        self._steps.append(
+            StepReport(
+                name=_get_step_name(step),
+                wall_time=wall_time,
+                elements_seen=elements_seen,
+                elements_processed=elements_processed,
+                type_transitions=dict(transitions),
+                cache_hits=dict(cache_stats.hits),
+                cache_misses=dict(cache_stats.misses),
+            ),
+        )
+        return elements
+
+    def create_report(self) -> DocumentReport:
+        return DocumentReport(
+            parser=self._parser_name,
+            source_length=self._source_length,
+            wall_time=perf_counter() - self._start_time,
+            html_parsing_time=self.html_parsing_time,
+            element_count=self.element_count,
+            steps=tuple(self._steps),
+        )
+
+
+_current_recorder: ContextVar[DocumentRecorder | None] = ContextVar(
+    "current_document_recorder",
+    default=None,
+)
+
+# The types of a list of elements, with the types of the inner elements of
+# the composite elements, as they are replaced in place by the steps.
+_ElementTypes = list[tuple[type, "_ElementTypes | None"]]
+
+
+def _get_types(elements: Iterable[AbstractSemanticElement]) -> _ElementTypes:
+    return [
+        (
+            type(e),
+            _get_types(e.inner_elements)
+            if isinstance(e, CompositeSemanticElement)
+            else None,
+        )
+        for e in elements
+    ]
+
+
+def _count_transitions(
+    types_before: _ElementTypes,
+    elements: Iterable[AbstractSemanticElement],
+    transitions: Counter[tuple[str, str]],
+) -> None:
+    elements = list(elements)
+    if len(elements) != len(types_before):
+        return
+    for (type_before, inner_types_before), element in zip(types_before, elements):
+        if type(element) is not type_before:
+            transitions[(type_before.__name__, type(element).__name__)] += 1
+        if inner_types_before is not None and isinstance(
+            element,
+            CompositeSemanticElement,
+        ):
+            _count_transitions(inner_types_before, element.inner_elements, transitions)
+
+
+def _count_elements(elements: Iterable[AbstractSemanticElement]) -> int:
+    return len(
+        CompositeSemanticElement.unwrap_elements(elements, include_containers=True),
+    )
+
+
+def _get_step_name(step: AbstractProcessingStep) -> str:
+    if isinstance(step, FusedElementwiseProcessingStep):
+        return "+".join(s.__class__.__name__ for s in step.steps)
+    return step.__class__.__name__
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import zlib
+from contextlib import suppress
+from dataclasses import astuple, fields
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import xxhash
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.semantic_elements.detached_semantic_element import (
+    DetachedSemanticElement,
+)
+from sec_parser.semantic_elements.highlighted_text_element import TextStyle
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+# Bump this whenever the format of the cache files changes, so that the old
+# files are treated as misses instead of being misread.
+CACHE_FORMAT_VERSION = 1
+
+_FILE_SUFFIX = ".parsed"
+_TEXT_STYLE_FIELDS = tuple(f.name for f in fields(TextStyle))
+# When the cache gets too large, the least recently used files are removed
+# until it is this fraction of its maximum size, so that the cache directory
+# is not scanned again on every following put.
+_EVICTION_TARGET_RATIO = 0.9
+# The size of the cache is tracked locally, so the files written by other
+# processes are only seen when the directory is scanned again. It is scanned
+# whenever this process has written this fraction of the maximum size since
+# the last scan.
+_RESCAN_RATIO = 0.1
+
+
+class ParseCache:
+    """
+    ParseCache is an optional on-disk cache of parsed documents, which lets
+    a parser skip documents it has already parsed, e.g. after a restart of
+    a pipeline that re-parses the same filings.
+
+    The cache is content-addressed: each entry is keyed by the hash of the
+    HTML, together with the version of sec-parser and the configuration of
+    the parser (its class, options, and processing steps with the arguments
+    they were created with, see `AbstractProcessingStep.cache_key`). Any
+    change to them leads to a new entry instead of a stale result. Entries
+    can be further separated with a `namespace`, e.g. for steps configured
+    after they are created.
+
+    Entries are the detached elements (see `parse_detached`), stored as
+    compressed JSON. The total size of the entries is capped at `max_size`
+    bytes, by removing the least recently used entries.
+
+    Several processes can share a cache directory. Each of them sees the
+    writes of the others only when it scans the directory again, i.e. after
+    writing a tenth of `max_size` itself, so N processes can overshoot the
+    cap by up to about N tenths of `max_size` before one of them evicts.
+
+    Usage:
+        cache = ParseCache("~/.cache/sec-parser", max_size=2**30)
+        parser = Edgar10QParser(parse_cache=cache)
+        elements = parser.parse_detached(html)
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        *,
+        max_size: int = 2**30,
+        namespace: str = "",
+    ) -> None:
+        if max_size <= 0:
+            msg = f"max_size must be positive, got {max_size}"
+            raise SecParserValueError(msg)
+        self._directory = Path(directory).expanduser()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._namespace = namespace
+        self._size: int | None = None
+        self._written_since_scan = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """The total size of the cache files, in bytes."""
+        if self._size is None:
+            self._size = sum(_get_file_size(entry) for entry in self._scan())
+            self._written_since_scan = 0
+        return self._size
+
+    def get_key(self, html: str | bytes, configuration: Iterable[str] = ()) -> str:
+        """
+        Return the cache key of the document, for a parser with the given
+        configuration, such as the names of its options and steps.
+        """
+        if isinstance(html, str):
+            html = html.encode()
+        hasher = xxhash.xxh3_128()
+        for part in (
+            str(CACHE_FORMAT_VERSION),
+            _get_code_version(),
+            self._namespace,
+            *configuration,
+        ):
+            hasher.update(part.encode())
+            hasher.update(b"\0")
+        hasher.update(html)
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> list[DetachedSemanticElement] | None:
+        """Return the elements stored under the key, or None on a miss."""
+        path = self._get_path(key)
+        try:
+            elements = _deserialize(path.read_bytes())
+        except (OSError, ValueError, TypeError, zlib.error):
+            # A corrupt entry, e.g. of an older format, is a miss like a
+            # missing one, and is overwritten by the next put.
+            self.misses += 1
+            return None
+        # The modification time of the files orders them for the eviction,
+        # from the least to the most recently used.
+        with suppress(OSError):
+            os.utime(path)
+        self.hits += 1
+        return elements
+
+    def put(self, key: str, elements: Iterable[DetachedSemanticElement]) -> None:
+        """Store the elements under the key, evicting old entries if needed."""
+        data = _serialize(elements)
+        path = self._get_path(key)
+        path.parent.mkdir(exist_ok=True)
+        size = self.size
+        if path.exists():
+            size -= path.stat().st_size
+        # The file is written under a temporary name and then renamed, so
+        # that other processes never read a partially written entry.
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            Path(temp_name).replace(path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self._size = size + len(data)
+        self._written_since_scan += len(data)
+        if self._written_since_scan > self._max_size * _RESCAN_RATIO:
+            # Pick up the writes of the other processes sharing the directory.
+            self._size = None
+        if self.size > self._max_size:
+            self._evict()
+
+    def clear(self) -> None:
+        for entry in self._scan():
+            Path(entry.path).unlink(missing_ok=True)
+        self._size = 0
+
+    def _get_path(self, key: str) -> Path:
+        # Entries are spread over subdirectories, as a single directory with
+        # many files is slow to work with on some file systems.
+        return self._directory / key[:2] / f"{key}{_FILE_SUFFIX}"
+
+    def _scan(self) -> list[os.DirEntry[str]]:
+        entries: list[os.DirEntry[str]] = []
+        with os.scandir(self._directory) as subdirectories:
+            for subdirectory in subdirectories:
+                if not subdirectory.is_dir():
+                    continue
+                with os.scandir(subdirectory.path) as subdirectory_entries:
+                    entries.extend(
+                        entry
+                        for entry in subdirectory_entries
+                        if entry.name.endswith(_FILE_SUFFIX)
+                    )
+        return entries
+
+    def _evict(self) -> None:
+        # The cache may be shared with other processes, so the actual files
+        # are listed, rather than relying on the size known to this one.
+        entries = []
+        for entry in self._scan():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        size = sum(size for _, size, _ in entries)
+        target_size = self._max_size * _EVICTION_TARGET_RATIO
+        for _, entry_size, path in entries:
+            if size <= target_size:
+                break
+            Path(path).unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+        self._written_since_scan = 0
+
+
+def _get_file_size(entry: os.DirEntry[str]) -> int:
+    try:
+        return entry.stat().st_size
+    except FileNotFoundError:
+        # Removed by another process sharing the cache directory
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _get_code_version() -> str:
+    """
+    Return the version of sec-parser, along with a hash of its source code,
+    so that the cached results of a modified checkout are not reused.
+    """
+    try:
+        version = metadata.version("sec-parser")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    hasher = xxhash.xxh3_64()
+    package_directory = Path(__file__).resolve().parent.parent
+    for path in sorted(package_directory.rglob("*.py")):
+        hasher.update(path.relative_to(package_directory).as_posix().encode())
+        hasher.update(path.read_bytes())
+    return f"{version}+{hasher.hexdigest()}"
+
+
+def _serialize(elements: Iterable[DetachedSemanticElement]) -> bytes:
+    payload = [CACHE_FORMAT_VERSION, [_to_row(e) for e in elements]]
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(text.encode(), 1)
+
+
+def _deserialize(data: bytes) -> list[DetachedSemanticElement]:
+    version, rows = json.loads(zlib.decompress(data))
+    if version != CACHE_FORMAT_VERSION:
+        msg = f"Unsupported cache format version: {version}"
+        raise ValueError(msg)
+    return [_from_row(row) for row in rows]
+
+
+def _to_row(element: DetachedSemanticElement) -> list[Any]:
+    return [
+        element.cls_name,
+        element.text,
+        element.html_hash,
+        element.level,
+        element.section_type,
+        None if element.text_style is None else astuple(element.text_style),
+        element.source_span,
+        [_to_row(e) for e in element.inner_elements],
+    ]
+
+
+def _from_row(row: list[Any]) -> DetachedSemanticElement:
+    (
+        cls_name,
+        text,
+        html_hash,
+        level,
+        section_type,
+        text_style,
+        source_span,
+        inner_rows,
+    ) = row
+    return DetachedSemanticElement(
+        cls_name=cls_name,
+        text=text,
+        html_hash=html_hash,
+        level=level,
+        section_type=section_type,
+        text_style=None
+        if text_style is None
+        else TextStyle(**dict(zip(_TEXT_STYLE_FIELDS, text_style))),
+        source_span=None if source_span is None else tuple(source_span),
+        inner_elements=tuple(_from_row(inner_row) for inner_row in inner_rows),
+    )
@@ -1,11 +1,14 @@
-import copy
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Any, Union
+from enum import Enum
+from typing import Any, Callable, Union
 
 from loguru import logger
 
 LogItemOrigin = str
 LogItemPayload = Union[str, dict[str, Any]]
+LazyLogItemPayload = Callable[[], LogItemPayload]
 
 
 @dataclass(frozen=True)
@@ -14,22 +17,115 @@ class LogItem:
     payload: LogItemPayload
 
 
+class ProcessingLogMode(Enum):
+    """
+    ProcessingLogMode controls how much work is spent on recording
+    the processing history of the semantic elements.
+    """
+
+    # No items are recorded
+    OFF = "off"
+
+    # Payloads passed as callables are only evaluated once the items are read
+    LAZY = "lazy"
+
+    # Payloads are evaluated as soon as the items are added
+    FULL = "full"
+
+
+class _LazyLogItem:
+    __slots__ = ("_origin", "_payload_factory", "_item")
+
+    def __init__(
+        self,
+        origin: LogItemOrigin,
+        payload_factory: LazyLogItemPayload,
+    ) -> None:
+        self._origin = origin
+        self._payload_factory = payload_factory
+        self._item: LogItem | None = None
+
+    def get(self) -> LogItem:
+        if self._item is None:
+            self._item = LogItem(self._origin, self._payload_factory())
+        return self._item
+
+
 class ProcessingLog:
-    def __init__(self) -> None:
-        self._log: list[LogItem] = []
+    """
+    ProcessingLog records the processing history of a semantic element.
+
+    Copies of a log share the items recorded before the copy was made,
+    instead of duplicating them: a copy refers to the log it was copied
+    from, and to how many of its items it shares. The items are never
+    removed, so each copy can be extended independently.
+    """
+
+    def __init__(self, mode: ProcessingLogMode = ProcessingLogMode.FULL) -> None:
+        self._mode = mode
+        # The log this one was copied from, and how many of its items it shares
+        self._parent: ProcessingLog | None = None
+        self._parent_length = 0
+        # Items added to this log itself. Only ever appended to.
+        self._items: list[LogItem | _LazyLogItem] = []
+
+    @property
+    def mode(self) -> ProcessingLogMode:
+        return self._mode
 
     def add_item(
         self,
         *,
-        message: LogItemPayload,
+        message: LogItemPayload | LazyLogItemPayload,
         log_origin: LogItemOrigin,
     ) -> None:
-        logger.trace("Adding log item: {}", str(message))
-        log_item = LogItem(log_origin, message)
-        self._log.append(log_item)
+        """
+        Add an item to the log. The message can be passed as a callable
+        returning the payload, which is not called at all if the log is
+        turned off, and only called on read if the log is lazy.
+        """
+        if self._mode is ProcessingLogMode.OFF:
+            return
+        log_item: LogItem | _LazyLogItem
+        if callable(message):
+            if self._mode is ProcessingLogMode.LAZY:
+                log_item = _LazyLogItem(log_origin, message)
+            else:
+                log_item = LogItem(log_origin, message())
+        else:
+            log_item = LogItem(log_origin, message)
+        logger.opt(lazy=True).trace(
+            "Adding log item: {}",
+            lambda: str(_resolve(log_item).payload),
+        )
+        self._items.append(log_item)
 
     def get_items(self) -> tuple[LogItem, ...]:
-        return tuple(self._log)
+        segments = []
+        log: ProcessingLog | None = self
+        length = len(self._items)
+        while log is not None:
+            segments.append(log._items[:length])  # noqa: SLF001
+            length = log._parent_length  # noqa: SLF001
+            log = log._parent  # noqa: SLF001
+        return tuple(
+            _resolve(log_item)
+            for items in reversed(segments)
+            for log_item in items
+        )
+
+    def copy(self) -> ProcessingLog:
+        log_copy = ProcessingLog(self._mode)
+        if self._items:
+            log_copy._parent = self  # noqa: SLF001
+            log_copy._parent_length = len(self._items)  # noqa: SLF001
+        else:
+            # Nothing was added since this log was copied, so the copy can
+            # share the items of its parent directly.
+            log_copy._parent = self._parent  # noqa: SLF001
+            log_copy._parent_length = self._parent_length  # noqa: SLF001
+        return log_copy
+
 
-    def copy(self) -> "ProcessingLog":
-        return copy.deepcopy(self)
+def _resolve(log_item: LogItem | _LazyLogItem) -> LogItem:
+    return log_item.get() if isinstance(log_item, _LazyLogItem) else log_item
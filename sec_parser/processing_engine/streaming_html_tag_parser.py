@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import codecs
+from collections import deque
+from typing import TYPE_CHECKING, BinaryIO, Union
+
+import bs4
+from bs4.dammit import EncodingDetector
+from lxml import etree
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.processing_engine.html_tag_parser import LxmlHtmlTagParser
+from sec_parser.utils.bs4_.lxml_soup import SoupTarget
+from sec_parser.utils.bs4_.tag_feature_index import TagFeatureIndex
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+    from bs4.builder import TreeBuilder
+
+# The HTML document, either as a whole or as a binary file to read it from
+HtmlSource = Union[str, bytes, BinaryIO]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# How much of the beginning of a document is used to detect its encoding
+_ENCODING_DETECTION_SIZE = 64 * 1024
+
+# How many tags may be held back while it is not yet known which tag
+# is the root, i.e. the one whose children are the top-level tags.
+DEFAULT_MAX_BUFFERED_TAGS = 20_000
+
+
+class StreamingHtmlTagParser(LxmlHtmlTagParser):
+    """
+    The StreamingHtmlTagParser parses an HTML document incrementally and
+    yields its top-level tags as soon as they are complete.
+
+    Each top-level tag is moved out of the document once it is complete,
+    so the memory of a top-level tag is released as soon as the caller
+    drops it. The peak memory use scales with the largest top-level tag,
+    rather than with the whole document.
+
+    The top-level tags are the same as the ones of the HtmlTagParser, i.e.
+    the children of the first tag with several child tags. Whether a tag
+    has another child tag is only known once it ends, which, for a tag
+    that wraps the whole document, is at the very end. So, once more than
+    `max_buffered_tags` tags are held back, the tag that wraps all tags so
+    far is assumed to wrap the rest of the document as well. If it turns
+    out not to, the tags that follow it are yielded as top-level tags too.
+
+    Each top-level tag keeps copies of its ancestors, without their other
+    children, so that inherited styles are preserved. Source spans are not
+    tracked, as the source is not kept in memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_buffered_tags: int = DEFAULT_MAX_BUFFERED_TAGS,
+    ) -> None:
+        super().__init__(track_source_spans=False)
+        self._chunk_size = chunk_size
+        self._max_buffered_tags = max_buffered_tags
+
+    def parse(self, html: str | bytes) -> list[HtmlTag]:
+        return list(self.iter_parse(html))
+
+    def iter_parse(self, html: HtmlSource) -> Iterator[HtmlTag]:
+        chunks = _iter_chunks(html, self._chunk_size)
+        encoding = None
+        if not isinstance(html, str):
+            chunks, encoding = _decode_chunks(chunks)  # type: ignore[arg-type]
+        chunks = _split_after_tags(chunks)  # type: ignore[arg-type]
+
+        soup = bs4.BeautifulSoup("", "lxml")
+        builder = soup.builder
+        soup.reset()
+        builder.initialize_soup(soup)
+        soup.original_encoding = encoding
+        target = _StreamingSoupTarget(soup, builder, self._max_buffered_tags)
+        parser = etree.HTMLParser(target=target, strip_cdata=False, recover=True)
+
+        found = False
+        for chunk in chunks:
+            parser.feed(chunk)
+            while target.completed:
+                found = True
+                yield self._wrap(target.completed.popleft())
+        parser.close()
+        builder.soup = None
+        while target.completed:
+            found = True
+            yield self._wrap(target.completed.popleft())
+
+        if not target.is_root_found:
+            # The whole document was held back, so the root can be
+            # found the same way as by the HtmlTagParser.
+            root = self._get_root(soup)
+            feature_index = TagFeatureIndex(root)
+            for child in root.children:
+                if isinstance(child, bs4.NavigableString) and not child.strip():
+                    continue
+                found = True
+                yield HtmlTag(child, feature_index=feature_index)
+
+        if not found:
+            msg = (
+                "The HTML document did not contain any top-level tags. "
+                "This may indicate that the document is malformed."
+            )
+            raise SecParserValueError(msg)
+
+    @staticmethod
+    def _wrap(element: bs4.PageElement) -> HtmlTag:
+        if isinstance(element, bs4.Tag):
+            return HtmlTag(element, feature_index=TagFeatureIndex(element))
+        return HtmlTag(element)
+
+
+class _StreamingSoupTarget(SoupTarget):
+    """
+    A parser target that moves the top-level tags out of the document into
+    `completed` as soon as they end.
+
+    Until the root is found, the target tracks the chain of tags that can
+    still turn out to be the root: the <body>, its first child tag, and so
+    on, down to the first tag that has several child tags, if any.
+    """
+
+    def __init__(
+        self,
+        soup: bs4.BeautifulSoup,
+        builder: TreeBuilder,
+        max_buffered_tags: int,
+    ) -> None:
+        super().__init__(soup, builder)
+        self.completed: deque[bs4.PageElement] = deque()
+        self._max_buffered_tags = max_buffered_tags
+        self._buffered_tags = 0
+        self._chain: list[bs4.Tag] = []
+        # Whether the last tag of the chain has several child tags
+        self._is_chain_branched = False
+        # Once the root is found, its children are moved out of the document,
+        # and so are the later children of its ancestors, up to the <body>.
+        self._root_chain: list[bs4.Tag] | None = None
+        self._root_chain_ids: frozenset[int] = frozenset()
+
+    @property
+    def is_root_found(self) -> bool:
+        return self._root_chain is not None
+
+    def start(self, name: str, attrs: dict[str, str], _nsmap: object = None) -> None:
+        super().start(name, attrs)
+        if self._root_chain is None:
+            self._track_chain(self._current)
+
+    def end(self, name: str) -> None:
+        tag = self._current
+        super().end(name)
+        if self._is_top_level(tag):
+            self._move_out(tag)
+
+    def _append(self, element: bs4.PageElement) -> None:
+        super()._append(element)
+        if self._is_top_level(element):
+            self._move_out(element)
+
+    def _is_top_level(self, element: bs4.PageElement) -> bool:
+        if self._root_chain is None:
+            return False
+        return (
+            id(element.parent) in self._root_chain_ids
+            and id(element) not in self._root_chain_ids
+        )
+
+    def _track_chain(self, tag: bs4.Tag) -> None:
+        parent = tag.parent
+        if not self._chain:
+            if (
+                tag.name == "body"
+                and parent.name == "html"
+                and parent.parent is self._soup
+            ):
+                self._chain.append(tag)
+            return
+
+        self._buffered_tags += 1
+        for i in range(len(self._chain) - 1, -1, -1):
+            if self._chain[i] is parent:
+                if i < len(self._chain) - 1:
+                    # The tag is the second child tag of a tag in the chain
+                    del self._chain[i + 1 :]
+                    self._is_chain_branched = True
+                elif not self._is_chain_branched:
+                    self._chain.append(tag)
+                break
+
+        if self._is_chain_branched and (
+            len(self._chain) == 1 or self._buffered_tags > self._max_buffered_tags
+        ):
+            self._set_root()
+
+    def _set_root(self) -> None:
+        self._root_chain = self._chain
+        self._root_chain_ids = frozenset(id(tag) for tag in self._chain)
+        children = list(self._chain[-1].contents)
+        # The last child may still be open, it is moved out once it ends
+        if children and any(children[-1] is tag for tag in self._stack):
+            children.pop()
+        for child in children:
+            self._move_out(child)
+
+    def _move_out(self, element: bs4.PageElement) -> None:
+        parent = element.parent
+        element.extract()
+        last = parent
+        while isinstance(last, bs4.Tag) and last.contents:
+            last = last.contents[-1]
+        self._most_recent = last
+        if isinstance(element, bs4.NavigableString) and not element.strip():
+            return
+        self._copy_ancestors(parent).append(element)
+        self.completed.append(element)
+
+    def _copy_ancestors(self, tag: bs4.Tag) -> bs4.Tag:
+        """Copy the tag and its ancestors, without any of their children."""
+        copies: list[bs4.Tag] = []
+        while tag is not None and tag is not self._soup:
+            copy = bs4.Tag(
+                None,
+                self._builder,
+                tag.name,
+                tag.namespace,
+                tag.prefix,
+                dict(tag.attrs),
+            )
+            if copies:
+                copy.append(copies[-1])
+            copies.append(copy)
+            tag = tag.parent
+        return copies[0]
+
+
+def _iter_chunks(html: HtmlSource, chunk_size: int) -> Iterator[str | bytes]:
+    if isinstance(html, (str, bytes)):
+        for start in range(0, len(html), chunk_size):
+            yield html[start : start + chunk_size]
+        return
+    while chunk := html.read(chunk_size):
+        yield chunk
+
+
+def _split_after_tags(chunks: Iterator[str]) -> Iterator[str]:
+    """
+    Move the boundaries of the chunks to right after the end of a tag.
+
+    The incremental parser of libxml2 can stall until the end of the
+    document if a chunk ends within a start tag, e.g. in the middle of an
+    attribute value. Then, nothing would be yielded before the whole
+    document is parsed.
+    """
+    rest = ""
+    for chunk in chunks:
+        chunk = rest + chunk  # noqa: PLW2901
+        end = chunk.rfind(">") + 1
+        rest = chunk[end:]
+        if end:
+            yield chunk[:end]
+    if rest:
+        yield rest
+
+
+def _decode_chunks(chunks: Iterator[bytes]) -> tuple[Iterator[str], str]:
+    """
+    Detect the encoding of a document from its beginning, the same way as
+    BeautifulSoup does from the whole document, and decode its chunks.
+    """
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= _ENCODING_DETECTION_SIZE:
+            break
+    detector = EncodingDetector(head, is_html=True)
+    # Without a byte order mark, if any
+    head = detector.markup
+    encoding = "utf-8"
+    for candidate in detector.encodings:
+        try:
+            codecs.getincrementaldecoder(candidate)().decode(head)
+        except (UnicodeDecodeError, LookupError):
+            continue
+        # The beginning of a document is often plain ASCII, even if the rest
+        # is not. UTF-8 is a superset of ASCII, so it is used instead.
+        if codecs.lookup(candidate).name != "ascii":
+            encoding = candidate
+        break
+
+    def decode() -> Iterator[str]:
+        # Malformed bytes are replaced, rather than stopping the parsing
+        # of the rest of the document.
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        yield decoder.decode(head)
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    return decode(), encoding
@@ -1,7 +1,21 @@
 from dataclasses import dataclass
 
+from sec_parser.processing_engine.processing_log import ProcessingLogMode
+
 
 @dataclass(frozen=True)
 class ParsingOptions:
     # Integrity checks are disabled by default to improve performance
     html_integrity_checks: bool = False
+
+    # Run consecutive single-iteration elementwise steps in a single
+    # traversal of the elements. The output is the same either way.
+    fuse_elementwise_steps: bool = False
+
+    # Reuse the processing step instances across documents, calling `reset()`
+    # on them after each document, instead of creating new ones every time.
+    reuse_processing_steps: bool = False
+
+    # Controls how the processing history of the elements is recorded.
+    # Turning it off, or making it lazy, saves work if the logs are not read.
+    processing_log_mode: ProcessingLogMode = ProcessingLogMode.FULL
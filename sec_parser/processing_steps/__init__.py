@@ -25,6 +25,10 @@ from sec_parser.processing_steps.supplementary_text_classifier import (
 from sec_parser.processing_steps.table_classifier import TableClassifier
 from sec_parser.processing_steps.text_classifier import TextClassifier
 from sec_parser.processing_steps.title_classifier import TitleClassifier
+from sec_parser.processing_steps.top_section_manager import (
+    TopSectionLayout,
+    TopSectionManager,
+)
 from sec_parser.processing_steps.top_section_manager_for_10q import (
     TopSectionManagerFor10Q,
 )
@@ -43,6 +47,8 @@ __all__ = [
     "IndividualSemanticElementExtractor",
     "SupplementaryTextClassifier",
     "EmptyElementClassifier",
+    "TopSectionLayout",
+    "TopSectionManager",
     "TopSectionManagerFor10Q",
     "TopSectionManagerFor10K",
 ]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, auto
+from typing import TYPE_CHECKING, cast
 
 from loguru import logger
 
@@ -19,6 +22,8 @@ from sec_parser.semantic_elements.top_section_title import TopSectionTitle
 from sec_parser.semantic_elements.semantic_elements import ErrorWhileProcessingElement
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
@@ -26,6 +31,52 @@ if TYPE_CHECKING:  # pragma: no cover
 MODULE_LOGGER_NAME = __name__
 
 
+class ElementDispatch(Enum):
+    """What an elementwise step does with an element of a given type."""
+
+    SKIP = auto()
+    PROCESS = auto()
+    RECURSE = auto()
+
+
+class ElementCounts:
+    """The elements that the elementwise steps visited, and processed."""
+
+    __slots__ = ("seen", "processed")
+
+    def __init__(self) -> None:
+        self.seen = 0
+        self.processed = 0
+
+    def record(self, *, processed: bool) -> None:
+        self.seen += 1
+        self.processed += processed
+
+
+# The counts are only collected within `collect_element_counts`, and are kept
+# per context, so that documents parsed by other threads are not counted.
+_element_counts: ContextVar[ElementCounts | None] = ContextVar(
+    "element_counts",
+    default=None,
+)
+
+
+@contextmanager
+def collect_element_counts() -> Iterator[ElementCounts]:
+    """Count the elements visited by the elementwise steps within the block."""
+    counts = ElementCounts()
+    token = _element_counts.set(counts)
+    try:
+        yield counts
+    finally:
+        _element_counts.reset(token)
+
+
+def get_element_counts() -> ElementCounts | None:
+    """Return the counts of the current `collect_element_counts` block, if any."""
+    return _element_counts.get()
+
+
 class AbstractElementwiseProcessingStep(AbstractProcessingStep):
     """
     `AbstractElementwiseTransformStep` class is used to iterate over
@@ -37,6 +88,15 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
     # change the iteration count.
     _NUM_ITERATIONS = 1
 
+    # _IS_ELEMENT_LOCAL specifies whether processing an element only looks
+    # at that element and at the state the step has built up from the
+    # elements before it, in document order. It must not look at the
+    # elements after it, nor at what other steps have made of the other
+    # elements. Single-iteration steps that are element-local can be fused
+    # with their neighbouring steps into a single traversal of the
+    # elements, which still visits the elements in document order.
+    _IS_ELEMENT_LOCAL = False
+
     def __init__(
         self,
         *,
@@ -49,6 +109,7 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
             self._types_to_process.add(CompositeSemanticElement)
         self._types_to_exclude = types_to_exclude or set()
         self._types_to_exclude.add(ErrorWhileProcessingElement)
+        self._dispatch_by_type: dict[type, ElementDispatch] = {}
 
     @abstractmethod
     def _process_element(
@@ -72,6 +133,7 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
         _context: ElementProcessingContext,
         is_inner: bool,
     ) -> list[AbstractSemanticElement]:
+        counts = _element_counts.get()
         for i, e in enumerate(elements):
             if not is_inner:
                 _context.element_index = i
@@ -81,34 +143,90 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
                 # print(e.section_type.identifier)
                 _context.section_id = e.section_type.identifier
             try:
-                if self._types_to_process and not any(
-                    isinstance(element, t) for t in self._types_to_process
-                ):
-                    continue
-                if any(isinstance(element, t) for t in self._types_to_exclude):
+                dispatch = self.get_element_dispatch(type(element))
+                if counts is not None:
+                    counts.record(processed=dispatch is ElementDispatch.PROCESS)
+                if dispatch is ElementDispatch.SKIP:
                     continue
 
-                if isinstance(element, CompositeSemanticElement):
+                if dispatch is ElementDispatch.RECURSE:
+                    composite = cast(CompositeSemanticElement, element)
                     inner_elements = self._process_recursively(
-                        list(element.inner_elements),
+                        list(composite.inner_elements),
                         _context=_context,
                         is_inner=True,
                     )
-                    element.inner_elements = tuple(inner_elements)
+                    composite.inner_elements = tuple(inner_elements)
                 else:
                     element = self._process_element(element, _context)
 
-                elements[i] = element
+                self._replace_element(elements, i, element, _context, is_inner=is_inner)
             except SecParserError as e:
-                logger.exception(e)
-                elements[i] = ErrorWhileProcessingElement.create_from_element(
-                    element,
-                    error=e,
-                    log_origin=self.__class__.__name__,
+                error_element = self._create_error_element(element, e)
+                self._replace_element(
+                    elements,
+                    i,
+                    error_element,
+                    _context,
+                    is_inner=is_inner,
                 )
 
         return elements
 
+    def get_element_dispatch(
+        self,
+        element_type: type[AbstractSemanticElement],
+    ) -> ElementDispatch:
+        """
+        `get_element_dispatch` decides whether elements of the given type
+        are skipped, processed, or recursed into (composite elements),
+        based on `types_to_process` and `types_to_exclude`.
+
+        The decision is computed once per type and then cached, instead of
+        checking every element against all of the configured types.
+        """
+        dispatch = self._dispatch_by_type.get(element_type)
+        if dispatch is None:
+            if (
+                self._types_to_process
+                and not issubclass(element_type, tuple(self._types_to_process))
+            ) or issubclass(element_type, tuple(self._types_to_exclude)):
+                dispatch = ElementDispatch.SKIP
+            elif issubclass(element_type, CompositeSemanticElement):
+                dispatch = ElementDispatch.RECURSE
+            else:
+                dispatch = ElementDispatch.PROCESS
+            self._dispatch_by_type[element_type] = dispatch
+        return dispatch
+
+    def _create_error_element(
+        self,
+        element: AbstractSemanticElement,
+        error: SecParserError,
+    ) -> AbstractSemanticElement:
+        logger.exception(error)
+        return ErrorWhileProcessingElement.create_from_element(
+            element,
+            error=error,
+            log_origin=self.__class__.__name__,
+        )
+
+    @staticmethod
+    def _replace_element(
+        elements: list[AbstractSemanticElement],
+        index: int,
+        element: AbstractSemanticElement,
+        context: ElementProcessingContext,
+        *,
+        is_inner: bool,
+    ) -> None:
+        if is_inner:
+            elements[index] = element
+        else:
+            # Top-level replacements go through the context,
+            # which keeps its page break index up to date.
+            context.replace_element(index, element)
+
     def _process(
         self,
         elements: list[AbstractSemanticElement],
@@ -121,3 +239,17 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
             self._process_recursively(elements, _context=context, is_inner=False)
 
         return elements
+
+    def is_fusable(self) -> bool:
+        """
+        `is_fusable` tells whether this step can be fused with its
+        neighbouring steps into a single traversal of the elements.
+        """
+        cls = type(self)
+        base = AbstractElementwiseProcessingStep
+        return (
+            self._IS_ELEMENT_LOCAL
+            and self._NUM_ITERATIONS == 1
+            and cls._process is base._process  # noqa: SLF001
+            and cls._process_recursively is base._process_recursively  # noqa: SLF001
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, TypeVar
 
 from sec_parser.exceptions import SecParserRuntimeError
 from sec_parser.semantic_elements.abstract_semantic_element import (
@@ -10,6 +10,8 @@ from sec_parser.semantic_elements.abstract_semantic_element import (
 
 ElementTransformer = Callable[[AbstractSemanticElement], AbstractSemanticElement]
 
+_Step = TypeVar("_Step", bound="AbstractProcessingStep")
+
 
 class AlreadyProcessedError(SecParserRuntimeError):
     pass
@@ -25,8 +27,21 @@ class AbstractProcessingStep(ABC):
     transformation operation. This ensures that any internal state
     maintained during a transformation is isolated to the processing
     of a single document.
+
+    To process another document with the same instance, `reset` has to be
+    called first. Steps that keep per-document state reinitialize it in
+    `reset`, while their configuration and any setup that is independent
+    of the document are kept.
     """
 
+    _init_arguments: tuple[tuple[object, ...], dict[str, object]]
+
+    def __new__(cls: type[_Step], *args: object, **kwargs: object) -> _Step:  # noqa: PYI019
+        step = super().__new__(cls)
+        # The arguments are kept to describe the configuration of the step
+        step._init_arguments = (args, kwargs)  # noqa: SLF001
+        return step
+
     def __init__(self) -> None:
         """
         Initialize the step. Sets `_transformed` to False to ensure
@@ -34,6 +49,20 @@ class AbstractProcessingStep(ABC):
         """
         self._already_processed = False
 
+    @property
+    def cache_key(self) -> str:
+        """
+        Describe the step and the arguments it was created with, which its
+        results depend on, for the keys of a ParseCache. Steps whose results
+        depend on anything else have to extend it.
+        """
+        args, kwargs = self._init_arguments
+        arguments = [
+            *(_describe(value) for value in args),
+            *(f"{name}={_describe(value)}" for name, value in sorted(kwargs.items())),
+        ]
+        return f"{_describe(type(self))}({', '.join(arguments)})"
+
     def process(
         self,
         elements: list[AbstractSemanticElement],
@@ -44,17 +73,32 @@ class AbstractProcessingStep(ABC):
         Note: The `elements` argument could potentially be mutated for
         performance reasons.
         """
+        self._mark_as_processed()
+        return self._process(elements)
+
+    def reset(self) -> None:
+        """
+        Discard the per-document state, so that the instance can process
+        another document. Child classes keeping per-document state have to
+        extend this method, calling `super().reset()`.
+        """
+        self._already_processed = False
+
+    def _mark_as_processed(self) -> None:
+        """
+        Mark the step as used, ensuring that it processes at most one document.
+        Only needed when the elements are processed without calling `process`.
+        """
         if self._already_processed:
             msg = (
                 "This Step instance has already processed a document. "
                 "Each Step instance is designed for a single "
                 "transformation operation. Please create a new instance "
-                "of the Step to process another document."
+                "of the Step, or call reset(), to process another document."
             )
             raise AlreadyProcessedError(msg)
 
         self._already_processed = True
-        return self._process(elements)
 
     @abstractmethod
     def _process(
@@ -68,3 +112,30 @@ class AbstractProcessingStep(ABC):
         transformation logic.
         """
         raise NotImplementedError  # pragma: no cover
+
+
+def _describe(value: object) -> str:
+    """
+    Describe the value, the same way in every process, i.e. without the
+    addresses of the objects, or the arbitrary order of the sets.
+    """
+    cache_key = getattr(value, "cache_key", None)
+    if isinstance(cache_key, str):
+        return cache_key
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(map(_describe, value))}]"
+    if isinstance(value, (set, frozenset, dict)):
+        items = (
+            [f"{_describe(k)}: {_describe(v)}" for k, v in value.items()]
+            if isinstance(value, dict)
+            else [_describe(item) for item in value]
+        )
+        return f"{{{', '.join(sorted(items))}}}"
+    qualified_name = getattr(value, "__qualname__", None)
+    if isinstance(qualified_name, str):
+        # Classes and functions are described by their names
+        return f"{getattr(value, '__module__', None)}.{qualified_name}"
+    if type(value).__repr__ is object.__repr__:
+        # The default representation holds the address of the object
+        return _describe(type(value))
+    return repr(value)
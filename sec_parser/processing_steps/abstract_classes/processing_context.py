@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 
 from sec_parser.semantic_elements.semantic_elements import (
     AbstractSemanticElement,
@@ -6,6 +8,38 @@ from sec_parser.semantic_elements.semantic_elements import (
 )
 
 
+class _PageBreakIndex:
+    """
+    Precomputed positions of the top-level page break elements, so that
+    the nearest page break and the page number of any element can be
+    looked up in constant time.
+    """
+
+    def __init__(self, elements: list[AbstractSemanticElement]) -> None:
+        count = len(elements)
+        self.previous: list[int | None] = [None] * count
+        self.next: list[int | None] = [None] * count
+        self.page_numbers: list[int] = [1] * count
+        self.page_break_count = 0
+
+        last = None
+        for i, element in enumerate(elements):
+            self.previous[i] = last
+            self.page_numbers[i] = self.page_break_count + 1
+            if isinstance(element, PageBreakElement):
+                self.page_break_count += 1
+                # A page break at index 0 is never treated as a previous
+                # page break, consistent with the original backward scan.
+                if i > 0:
+                    last = i
+
+        last = None
+        for i in range(count - 1, -1, -1):
+            self.next[i] = last
+            if isinstance(elements[i], PageBreakElement):
+                last = i
+
+
 @dataclass
 class ElementProcessingContext:
     """
@@ -19,14 +53,56 @@ class ElementProcessingContext:
     element_index: int = None
     section_id: str = None
 
+    _page_breaks: _PageBreakIndex | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+
+    def replace_element(self, index: int, element: AbstractSemanticElement) -> None:
+        """
+        Replace a top-level element, keeping the page break index up to date.
+        The index is only rebuilt if an element became, or stopped being,
+        a page break.
+        """
+        previous = self.elements[index]
+        self.elements[index] = element
+        if isinstance(previous, PageBreakElement) != isinstance(
+            element,
+            PageBreakElement,
+        ):
+            self._page_breaks = None
+
+    @property
+    def page_break_count(self) -> int:
+        return self._get_page_breaks().page_break_count
+
     def distant_to_previous_pagebreak_element(
-        self, element: AbstractSemanticElement
+        self,
+        element: AbstractSemanticElement,  # noqa: ARG002
     ) -> int | None:
         if not self.element_index:
-            return
-        if self.element_index == 0:
             return None
-        for x in range(self.element_index - 1, 0, -1):
-            if isinstance(self.elements[x], PageBreakElement):
-                return self.element_index - x
-        return None
+        previous = self._get_page_breaks().previous[self.element_index]
+        if previous is None:
+            return None
+        return self.element_index - previous
+
+    def distance_to_next_pagebreak_element(self) -> int | None:
+        if self.element_index is None:
+            return None
+        following = self._get_page_breaks().next[self.element_index]
+        if following is None:
+            return None
+        return following - self.element_index
+
+    def get_page_number(self) -> int | None:
+        """Return the 1-based page of the current element, based on page breaks."""
+        if self.element_index is None:
+            return None
+        return self._get_page_breaks().page_numbers[self.element_index]
+
+    def _get_page_breaks(self) -> _PageBreakIndex:
+        if self._page_breaks is None:
+            self._page_breaks = _PageBreakIndex(self.elements)
+        return self._page_breaks
@@ -9,6 +9,8 @@ from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processin
 from sec_parser.semantic_elements.semantic_elements import EmptyElement
 
 if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.processing_engine.classification_memo import ClassificationMemo
+    from sec_parser.processing_engine.html_tag import HtmlTag
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
@@ -27,16 +29,20 @@ class EmptyElementClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with IrrelevantElement instances.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
         types_to_process: set[type[AbstractSemanticElement]] | None = None,
         types_to_exclude: set[type[AbstractSemanticElement]] | None = None,
+        classification_memo: ClassificationMemo | None = None,
     ) -> None:
         super().__init__(
             types_to_process=types_to_process,
             types_to_exclude=types_to_exclude,
         )
+        self._classification_memo = classification_memo
 
     def _process_element(
         self,
@@ -47,7 +53,7 @@ class EmptyElementClassifier(AbstractElementwiseProcessingStep):
         Transform a single semantic element
         into a EmptyElement if applicable.
         """
-        if not element.contains_words():
+        if not self._contains_words(element.html_tag):
             element.processing_log.add_item(
                 message="Does not contain words",
                 log_origin=self.__class__.__name__,
@@ -57,3 +63,12 @@ class EmptyElementClassifier(AbstractElementwiseProcessingStep):
                 log_origin=self.__class__.__name__,
             )
         return element
+
+    def _contains_words(self, html_tag: HtmlTag) -> bool:
+        if self._classification_memo is None:
+            return html_tag.contains_words()
+        return self._classification_memo.get_or_compute(
+            self.__class__.__name__,
+            html_tag,
+            html_tag.contains_words,
+        )
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from sec_parser.exceptions import SecParserError, SecParserValueError
+from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+    AbstractElementwiseProcessingStep,
+    ElementDispatch,
+    get_element_counts,
+)
+from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
+    AbstractProcessingStep,
+)
+from sec_parser.processing_steps.abstract_classes.processing_context import (
+    ElementProcessingContext,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+
+
+class FusedElementwiseProcessingStep(AbstractProcessingStep):
+    """
+    FusedElementwiseProcessingStep runs several consecutive elementwise steps
+    in a single traversal of the elements. Each element is passed through all
+    of the fused steps, in their original order, before moving on to the
+    next element.
+
+    The output is identical to running the steps one after another, as long
+    as every fused step is element-local (see `is_fusable`), i.e. processing
+    an element depends only on that element and on the elements before it,
+    and not on what the other fused steps have made of the other elements.
+    """
+
+    def __init__(self, steps: list[AbstractElementwiseProcessingStep]) -> None:
+        super().__init__()
+        for step in steps:
+            if not step.is_fusable():
+                msg = f"{step.__class__.__name__} can't be fused with other steps"
+                raise SecParserValueError(msg)
+        self._steps = list(steps)
+
+    @property
+    def steps(self) -> list[AbstractElementwiseProcessingStep]:
+        return list(self._steps)
+
+    def reset(self) -> None:
+        super().reset()
+        for step in self._steps:
+            step.reset()
+
+    def _process(
+        self,
+        elements: list[AbstractSemanticElement],
+    ) -> list[AbstractSemanticElement]:
+        for step in self._steps:
+            step._mark_as_processed()  # noqa: SLF001
+
+        # Each step keeps its own context, as it would when run on its own.
+        steps = [
+            (step, ElementProcessingContext(iteration=0, elements=elements))
+            for step in self._steps
+        ]
+        for i, element in enumerate(elements):
+            for _, context in steps:
+                context.element_index = i
+            processed = self._process_element(element, steps)
+            if processed is not element:
+                for _, context in steps:
+                    context.replace_element(i, processed)
+        return elements
+
+    @classmethod
+    def _process_element(
+        cls,
+        element: AbstractSemanticElement,
+        steps: list[tuple[AbstractElementwiseProcessingStep, ElementProcessingContext]],
+    ) -> AbstractSemanticElement:
+        """
+        Pass a single element through the steps in order. A composite element
+        stays composite, so its inner elements are traversed only once, by all
+        of the remaining steps that accept it.
+        """
+        counts = get_element_counts()
+        processed = False
+        for k, (step, context) in enumerate(steps):
+            dispatch = cls._visit(element, step, context)
+            if dispatch is ElementDispatch.SKIP:
+                continue
+            if dispatch is ElementDispatch.RECURSE:
+                if counts is not None:
+                    counts.record(processed=processed)
+                accepting_steps = [(step, context)] + [
+                    (other_step, other_context)
+                    for other_step, other_context in steps[k + 1 :]
+                    if cls._visit(element, other_step, other_context)
+                    is not ElementDispatch.SKIP
+                ]
+                composite = cast(CompositeSemanticElement, element)
+                composite.inner_elements = tuple(
+                    cls._process_element(inner_element, accepting_steps)
+                    for inner_element in composite.inner_elements
+                )
+                return element
+            processed = True
+            try:
+                element = step._process_element(element, context)  # noqa: SLF001
+            except SecParserError as e:
+                element = step._create_error_element(element, e)  # noqa: SLF001
+        if counts is not None:
+            counts.record(processed=processed)
+        return element
+
+    @staticmethod
+    def _visit(
+        element: AbstractSemanticElement,
+        step: AbstractElementwiseProcessingStep,
+        context: ElementProcessingContext,
+    ) -> ElementDispatch:
+        """Mirror the checks of a step visiting an element on its own."""
+        if isinstance(element, TopSectionTitle):
+            context.section_id = element.section_type.identifier
+        return step.get_element_dispatch(type(element))
+
+
+def fuse_elementwise_steps(
+    steps: list[AbstractProcessingStep],
+) -> list[AbstractProcessingStep]:
+    """
+    Group each run of consecutive fusable steps into
+    a FusedElementwiseProcessingStep. The other steps,
+    e.g. the ones iterating over the elements more than
+    once, are kept as they are and act as barriers.
+    """
+    result: list[AbstractProcessingStep] = []
+    group: list[AbstractElementwiseProcessingStep] = []
+
+    def flush() -> None:
+        if len(group) == 1:
+            result.append(group[0])
+        elif group:
+            result.append(FusedElementwiseProcessingStep(group.copy()))
+        group.clear()
+
+    for step in steps:
+        if isinstance(step, AbstractElementwiseProcessingStep) and step.is_fusable():
+            group.append(step)
+        else:
+            flush()
+            result.append(step)
+    flush()
+    return result
@@ -12,6 +12,8 @@ from sec_parser.semantic_elements.highlighted_text_element import (
 )
 
 if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.processing_engine.classification_memo import ClassificationMemo
+    from sec_parser.processing_engine.html_tag import HtmlTag
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
@@ -25,23 +27,27 @@ class HighlightedTextClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with HighlightedText instances.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         types_to_process: set[type[AbstractSemanticElement]] | None = None,
         types_to_exclude: set[type[AbstractSemanticElement]] | None = None,
+        *,
+        classification_memo: ClassificationMemo | None = None,
     ) -> None:
         super().__init__(
             types_to_process=types_to_process,
             types_to_exclude=types_to_exclude,
         )
+        self._classification_memo = classification_memo
 
     def _process_element(
         self,
         element: AbstractSemanticElement,
         _: ElementProcessingContext,
     ) -> AbstractSemanticElement:
-        styles_metrics = element.html_tag.get_text_styles_metrics()
-        style: TextStyle = TextStyle.from_style_and_text(styles_metrics, element.text)
+        style = self._get_text_style(element.html_tag)
         if not style:
             return element
         return HighlightedTextElement.create_from_element(
@@ -50,3 +56,21 @@ class HighlightedTextClassifier(AbstractElementwiseProcessingStep):
             style=style,
             ix_continuation=element.html_tag.is_ix_continuation(),
         )
+
+    def _get_text_style(self, html_tag: HtmlTag) -> TextStyle:
+        def compute() -> TextStyle:
+            styles_metrics = html_tag.get_text_styles_metrics()
+            return TextStyle.from_style_and_text(styles_metrics, html_tag.text)
+
+        if self._classification_memo is None:
+            return compute()
+        # The text inherits the styles of the parent tags, so the style of
+        # the same HTML differs between contexts. Whether the element is an
+        # inline XBRL continuation depends on the parent tags too, and is
+        # not memoized.
+        return self._classification_memo.get_or_compute(
+            self.__class__.__name__,
+            html_tag,
+            compute,
+            context=tuple(sorted(html_tag.get_inherited_style().items())),
+        )
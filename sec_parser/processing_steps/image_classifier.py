@@ -9,6 +9,8 @@ from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processin
 from sec_parser.semantic_elements.semantic_elements import ImageElement
 
 if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.processing_engine.classification_memo import ClassificationMemo
+    from sec_parser.processing_engine.html_tag import HtmlTag
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
@@ -22,15 +24,42 @@ class ImageClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with ImageElement instances.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
+    def __init__(
+        self,
+        *,
+        types_to_process: set[type[AbstractSemanticElement]] | None = None,
+        types_to_exclude: set[type[AbstractSemanticElement]] | None = None,
+        classification_memo: ClassificationMemo | None = None,
+    ) -> None:
+        super().__init__(
+            types_to_process=types_to_process,
+            types_to_exclude=types_to_exclude,
+        )
+        self._classification_memo = classification_memo
+
     def _process_element(
         self,
         element: AbstractSemanticElement,
         _: ElementProcessingContext,
     ) -> AbstractSemanticElement:
-        if element.html_tag.contains_tag("img", include_self=True):
+        if self._contains_image(element.html_tag):
             return ImageElement.create_from_element(
                 element,
                 log_origin=self.__class__.__name__,
             )
 
         return element
+
+    def _contains_image(self, html_tag: HtmlTag) -> bool:
+        def compute() -> bool:
+            return html_tag.contains_tag("img", include_self=True)
+
+        if self._classification_memo is None:
+            return compute()
+        return self._classification_memo.get_or_compute(
+            self.__class__.__name__,
+            html_tag,
+            compute,
+        )
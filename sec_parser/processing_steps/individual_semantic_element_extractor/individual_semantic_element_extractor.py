@@ -31,6 +31,8 @@ class IndividualSemanticElementExtractor(AbstractElementwiseProcessingStep):
     can hold significant meaning.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
@@ -86,9 +88,11 @@ class IndividualSemanticElementExtractor(AbstractElementwiseProcessingStep):
         for check in self._contains_single_element_checks:
             contains_single_element = check.contains_single_element(element)
             if contains_single_element is not None:
-                element.processing_log.add_item(
-                    log_origin=check.__class__.__name__,
-                    message=f"Contains single element: {contains_single_element}",
-                )
-                return contains_single_element
-        return True
+                break
+        else:
+            return True
+        element.processing_log.add_item(
+            log_origin=check.__class__.__name__,
+            message=lambda: f"Contains single element: {contains_single_element}",
+        )
+        return contains_single_element
@@ -5,30 +5,33 @@ from typing import TYPE_CHECKING
 from sec_parser.processing_steps.individual_semantic_element_extractor.single_element_checks.abstract_single_element_check import (
     AbstractSingleElementCheck,
 )
-from sec_parser.processing_steps.top_section_manager_for_10q import (
-    TopSectionManagerFor10Q,
-)
 from sec_parser.processing_steps.top_section_manager_for_10k import (
-    TopSectionManagerFor10K,
+    TOP_SECTIONS_IN_10K,
+)
+from sec_parser.processing_steps.top_section_manager_for_10q import (
+    TOP_SECTIONS_IN_10Q,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.processing_steps.top_section_manager import TopSectionLayout
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
 
 
-def _is_match_part_or_item_10q(text: str) -> bool:
-    return TopSectionManagerFor10Q.is_match_part_or_item(text)
+class TopSectionTitleCheck(AbstractSingleElementCheck):
+    """
+    Splits the elements that contain the title of a part or an item of the
+    given form type, 10-Q by default, so that the titles can be found by
+    the TopSectionManager of the form type.
+    """
 
-def _is_match_part_or_item_10k(text: str) -> bool:
-    return TopSectionManagerFor10K.is_match_part_or_item(text)
+    def __init__(self, layout: TopSectionLayout | None = None) -> None:
+        self._layout = layout or TOP_SECTIONS_IN_10Q
 
-
-class TopSectionTitleCheck10Q(AbstractSingleElementCheck):
     def contains_single_element(self, element: AbstractSemanticElement) -> bool | None:
         match_count = element.html_tag.count_text_matches_in_descendants(
-            _is_match_part_or_item_10q,
+            self._layout.is_match_part_or_item,
             exclude_links=True,
         )
 
@@ -37,16 +40,12 @@ class TopSectionTitleCheck10Q(AbstractSingleElementCheck):
 
         return None
 
-class TopSectionTitleCheck10K(AbstractSingleElementCheck):
-    def contains_single_element(self, element: AbstractSemanticElement) -> bool | None:
-        match_count = element.html_tag.count_text_matches_in_descendants(
-            _is_match_part_or_item_10k,
-            exclude_links=True,
-        )
-
-        if match_count >= 1:
-            return False
 
-        return None
+class TopSectionTitleCheck10Q(TopSectionTitleCheck):
+    def __init__(self) -> None:
+        super().__init__(TOP_SECTIONS_IN_10Q)
 
 
+class TopSectionTitleCheck10K(TopSectionTitleCheck):
+    def __init__(self) -> None:
+        super().__init__(TOP_SECTIONS_IN_10K)
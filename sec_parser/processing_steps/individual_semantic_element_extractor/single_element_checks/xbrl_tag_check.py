@@ -14,10 +14,11 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class XbrlTagCheck(AbstractSingleElementCheck):
     def contains_single_element(self, element: AbstractSemanticElement) -> bool | None:
-        if element.html_tag.name.startswith("ix"):
+        name = element.html_tag.name
+        if name.startswith("ix"):
             element.processing_log.add_item(
                 log_origin=self.__class__.__name__,
-                message=f"Detected XBRL tag {element.html_tag.name}",
+                message=lambda: f"Detected XBRL tag {name}",
             )
             return False
 
@@ -68,6 +68,8 @@ class TextElementPreMerger(AbstractElementwiseProcessingStep):
     into a single TextElement(<div><span>ab</span><div>).
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
@@ -37,6 +37,10 @@ class IntroductorySectionElementClassifier(AbstractElementwiseProcessingStep):
             types_to_process=types_to_process,
             types_to_exclude=types_to_exclude,
         )
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
         self._part1_exists = False
         self._part1_found = False
 
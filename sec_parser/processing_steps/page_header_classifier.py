@@ -12,12 +12,7 @@ from sec_parser.semantic_elements.highlighted_text_element import (
     HighlightedTextElement,
     TextStyle,
 )
-from sec_parser.semantic_elements.semantic_elements import (
-    PageHeaderElement,
-    PageBreakElement,
-)
-
-from functools import reduce
+from sec_parser.semantic_elements.semantic_elements import PageHeaderElement
 
 if TYPE_CHECKING:  # pragma: no cover
     from sec_parser.semantic_elements.abstract_semantic_element import (
@@ -57,6 +52,10 @@ class PageHeaderClassifier(AbstractElementwiseProcessingStep):
             types_to_process=types_to_process,
             types_to_exclude=types_to_exclude,
         )
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
         self._element_to_page_header_candidate: dict[
             AbstractSemanticElement,
             PageHeaderCandidate,
@@ -97,7 +96,7 @@ class PageHeaderClassifier(AbstractElementwiseProcessingStep):
             return element
 
         element.processing_log.add_item(
-            message=f"Matches one of the most common candidates: {candidate}",
+            message=lambda: f"Matches one of the most common candidates: {candidate}",
             log_origin=self.__class__.__name__,
         )
         return PageHeaderElement.create_from_element(
@@ -129,6 +128,10 @@ class PageHeaderByDistanceToPagebreakClassifier(AbstractElementwiseProcessingSte
             types_to_process=types_to_process,
             types_to_exclude=types_to_exclude,
         )
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
         self._element_to_page_header_by_distance_candidate: dict[
             AbstractSemanticElement,
             PageHeaderByDistanceToPagebreakCandidate,
@@ -141,26 +144,6 @@ class PageHeaderByDistanceToPagebreakClassifier(AbstractElementwiseProcessingSte
             dict[PageHeaderByDistanceToPagebreakCandidate, int] | None
         ) = None
 
-    def _process(
-        self,
-        elements: list[AbstractSemanticElement],
-    ) -> list[AbstractSemanticElement]:
-        def sum_if_page_break_element(res: int, e: AbstractSemanticElement) -> int:
-            if isinstance(e, PageBreakElement):
-                return res + 1
-            return res
-
-        page_break_count = reduce(sum_if_page_break_element, elements, 0)
-        # print("page_break_count", page_break_count)
-        for iteration in range(self._NUM_ITERATIONS):
-            context = ElementProcessingContext(
-                iteration=iteration,
-                elements=elements,
-            )
-            context.page_break_count = page_break_count
-            self._process_recursively(elements, _context=context, is_inner=False)
-        return elements
-
     def _process_element(
         self,
         element: AbstractSemanticElement,
@@ -205,7 +188,9 @@ class PageHeaderByDistanceToPagebreakClassifier(AbstractElementwiseProcessingSte
             return element
 
         element.processing_log.add_item(
-            message=f"Matches one of the most common by_distance candidates: {candidate}",
+            message=lambda: (
+                f"Matches one of the most common by_distance candidates: {candidate}"
+            ),
             log_origin=self.__class__.__name__,
         )
 
@@ -222,7 +207,7 @@ class PageHeaderByDistanceToPagebreakClassifier(AbstractElementwiseProcessingSte
         def candidate_filter(count: int) -> bool:
             if count < PageHeaderByDistanceToPagebreakCandidate.OCCURRENCE_THRESHOLD:
                 return False
-            if _context.page_break_count is not None and _context.page_break_count > 0:
+            if _context.page_break_count > 0:
                 return count / _context.page_break_count > 0.7
 
         if self._most_common_by_pagebreak_candidates is None:
@@ -42,6 +42,10 @@ class PageNumberClassifier(AbstractElementwiseProcessingStep):
             types_to_process=types_to_process,
             types_to_exclude=types_to_exclude,
         )
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
         self._element_to_page_number_candidate: dict[
             AbstractSemanticElement,
             PageNumberCandidate,
@@ -94,8 +98,9 @@ class PageNumberClassifier(AbstractElementwiseProcessingStep):
         if candidate != self._most_common_candidate:
             return element
 
+        count = self._most_common_candidate_count
         element.processing_log.add_item(
-            message=f"Matches the most common (x{self._most_common_candidate_count}) candidate: {candidate}",
+            message=lambda: f"Matches the most common (x{count}) candidate: {candidate}",
             log_origin=self.__class__.__name__,
         )
         return PageNumberElement.create_from_element(
@@ -15,6 +15,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class PageBreakClassifier(AbstractElementwiseProcessingStep):
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
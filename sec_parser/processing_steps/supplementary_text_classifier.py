@@ -30,6 +30,8 @@ class SupplementaryTextClassifier(
     primarily by replacing suitable candidates with SupplementaryText instances.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
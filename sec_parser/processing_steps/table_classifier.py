@@ -9,9 +9,12 @@ from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processin
 from sec_parser.semantic_elements.table_element.table_element import TableElement
 
 if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.processing_engine.classification_memo import ClassificationMemo
+    from sec_parser.processing_engine.html_tag import HtmlTag
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
+    from sec_parser.utils.bs4_.approx_table_metrics import ApproxTableMetrics
 
 
 class TableClassifier(AbstractElementwiseProcessingStep):
@@ -22,12 +25,15 @@ class TableClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with TableElement instances.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
         types_to_process: set[type[AbstractSemanticElement]] | None = None,
         types_to_exclude: set[type[AbstractSemanticElement]] | None = None,
         check_threshold: bool = True,
+        classification_memo: ClassificationMemo | None = None,
     ) -> None:
         super().__init__(
             types_to_process=types_to_process,
@@ -35,21 +41,20 @@ class TableClassifier(AbstractElementwiseProcessingStep):
         )
         self._row_count_threshold = 1
         self._check_threshold = check_threshold
+        self._classification_memo = classification_memo
 
     def _process_element(
         self,
         element: AbstractSemanticElement,
         _: ElementProcessingContext,
     ) -> AbstractSemanticElement:
-        if element.html_tag.name == "table" or element.html_tag.contains_tag(
-            "table", include_self=True
-        ):
+        if self._contains_table(element.html_tag):
             if not self._check_threshold:
                 return TableElement.create_from_element(
                     element,
                     log_origin=self.__class__.__name__,
                 )
-            metrics = element.html_tag.get_approx_table_metrics()
+            metrics = self._get_table_metrics(element.html_tag)
             if metrics is None:
                 element.processing_log.add_item(
                     log_origin=self.__class__.__name__,
@@ -61,11 +66,36 @@ class TableClassifier(AbstractElementwiseProcessingStep):
                     element,
                     log_origin=self.__class__.__name__,
                 )
+            rows, threshold = metrics.rows, self._row_count_threshold
             element.processing_log.add_item(
                 log_origin=self.__class__.__name__,
-                message=(
-                    f"Skipping: Table has {metrics.rows} rows, which is below the "
-                    f"threshold of {self._row_count_threshold}."
+                message=lambda: (
+                    f"Skipping: Table has {rows} rows, which is below the "
+                    f"threshold of {threshold}."
                 ),
             )
         return element
+
+    def _contains_table(self, html_tag: HtmlTag) -> bool:
+        def compute() -> bool:
+            return html_tag.name == "table" or html_tag.contains_tag(
+                "table",
+                include_self=True,
+            )
+
+        if self._classification_memo is None:
+            return compute()
+        return self._classification_memo.get_or_compute(
+            f"{self.__class__.__name__}.contains_table",
+            html_tag,
+            compute,
+        )
+
+    def _get_table_metrics(self, html_tag: HtmlTag) -> ApproxTableMetrics | None:
+        if self._classification_memo is None:
+            return html_tag.get_approx_table_metrics()
+        return self._classification_memo.get_or_compute(
+            f"{self.__class__.__name__}.table_metrics",
+            html_tag,
+            html_tag.get_approx_table_metrics,
+        )
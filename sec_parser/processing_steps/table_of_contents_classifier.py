@@ -24,6 +24,8 @@ class TableOfContentsClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with TableOfContentsElement instances.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
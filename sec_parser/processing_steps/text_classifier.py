@@ -22,6 +22,8 @@ class TextClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with TextElement instances.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         *,
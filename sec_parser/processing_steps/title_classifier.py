@@ -49,6 +49,8 @@ class TitleClassifier(AbstractElementwiseProcessingStep):
       or section headings.
     """
 
+    _IS_ELEMENT_LOCAL = True
+
     def __init__(
         self,
         types_to_process: set[type[AbstractSemanticElement]] | None = None,
@@ -60,6 +62,10 @@ class TitleClassifier(AbstractElementwiseProcessingStep):
         )
         self._title_length_threshold = 120
         self._title_end_with_period_length_threshold = 20
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
         self._unique_styles_by_order: dict[str, tuple[TextStyle, ...]] = {}
 
     def _add_unique_style(self, section_id: str, style: TextStyle) -> None:
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+    AbstractElementwiseProcessingStep,
+    ElementDispatch,
+    ElementProcessingContext,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+from sec_parser.semantic_elements.semantic_elements import IrrelevantElement
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+
+
+class TopSectionFilter(AbstractElementwiseProcessingStep):
+    """
+    The TopSectionFilter is a processing step that marks the elements
+    outside of the given top sections as irrelevant, so that the steps
+    after it skip them.
+
+    A top section starts with its TopSectionTitle, and ends with the next
+    title of the same or a higher level. For example, in a 10-Q report,
+    the section 'part2' includes all of its items, such as 'part2item1a',
+    and ends with the title of 'part3', if there is one.
+
+    A composite element is kept as a whole if any part of it is within
+    one of the sections, so that no irrelevant elements are left within
+    the relevant ones.
+
+    It relies on the top section titles, so it has to come after the
+    top section manager of the pipeline.
+    """
+
+    _IS_ELEMENT_LOCAL = True
+
+    def __init__(
+        self,
+        sections: Iterable[str],
+        *,
+        types_to_process: set[type[AbstractSemanticElement]] | None = None,
+        types_to_exclude: set[type[AbstractSemanticElement]] | None = None,
+    ) -> None:
+        super().__init__(
+            types_to_process=types_to_process,
+            types_to_exclude=types_to_exclude,
+        )
+        self._sections = frozenset(sections)
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
+        self._section_level: int | None = None
+
+    @property
+    def is_in_selected_section(self) -> bool:
+        """Whether the elements seen so far end within one of the sections."""
+        return self._section_level is not None
+
+    def update_section(self, element: AbstractSemanticElement) -> None:
+        """Enter or leave the selected sections, if the element is a title."""
+        if not isinstance(element, TopSectionTitle):
+            return
+        level = element.section_type.level
+        if self._section_level is not None and level <= self._section_level:
+            self._section_level = None
+        if (
+            self._section_level is None
+            and element.section_type.identifier in self._sections
+        ):
+            self._section_level = level
+
+    def get_element_dispatch(
+        self,
+        element_type: type[AbstractSemanticElement],
+    ) -> ElementDispatch:
+        dispatch = super().get_element_dispatch(element_type)
+        if dispatch is ElementDispatch.RECURSE:
+            return ElementDispatch.PROCESS
+        return dispatch
+
+    def _process_element(
+        self,
+        element: AbstractSemanticElement,
+        _: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        is_selected = False
+        for inner_element in CompositeSemanticElement.unwrap_elements([element]):
+            self.update_section(inner_element)
+            is_selected |= self.is_in_selected_section
+        if is_selected or isinstance(element, IrrelevantElement):
+            return element
+        return IrrelevantElement.create_from_element(
+            element,
+            log_origin=self.__class__.__name__,
+        )
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import re
+import warnings
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+    AbstractElementwiseProcessingStep,
+    ElementProcessingContext,
+)
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+    from sec_parser.semantic_elements.top_section_title_types import TopSectionType
+
+
+@dataclass(frozen=True)
+class TopSectionLayout:
+    """
+    The top sections of a form type, such as "10-Q", and the patterns
+    of their titles. A TopSectionManager finds the top sections of any
+    form type that is described by a layout.
+
+    - `part_pattern` and `item_pattern` match the start of the titles of
+      parts and items. Their first group is the number of the part or item,
+      e.g. "II" in "Part II" or "1a" in "Item 1A. Risk Factors".
+    - `sections` are the valid top sections, identified by the numbers of
+      their part and item, e.g. "part2" or "part2item1a".
+    - `invalid_section` is the section type of the titles that match one of
+      the patterns, but are not one of the `sections`.
+    """
+
+    form_type: str
+    part_pattern: re.Pattern[str]
+    item_pattern: re.Pattern[str]
+    sections: tuple[TopSectionType, ...]
+    invalid_section: TopSectionType
+    part_or_item_pattern: re.Pattern[str] = field(init=False, repr=False)
+    identifier_to_section: dict[str, TopSectionType] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        # The patterns of parts and items are combined, so that a text that
+        # is neither is ruled out by matching it only once.
+        part_or_item_pattern = re.compile(
+            f"{self.part_pattern.pattern}|{self.item_pattern.pattern}",
+            self.part_pattern.flags | self.item_pattern.flags,
+        )
+        object.__setattr__(self, "part_or_item_pattern", part_or_item_pattern)
+        object.__setattr__(
+            self,
+            "identifier_to_section",
+            {section.identifier: section for section in self.sections},
+        )
+
+    def is_match_part_or_item(self, text: str) -> bool:
+        return self.part_or_item_pattern.match(text) is not None
+
+    def match_part(self, text: str) -> str | None:
+        if match := self.part_pattern.match(text):
+            match match.group(1).lower():
+                case "i":
+                    return "1"
+                case "ii":
+                    return "2"
+                case "iii":
+                    return "3"
+                case "iv":
+                    return "4"
+                case _:
+                    return str(len(match.group(1)))
+        return None
+
+    def match_item(self, text: str) -> str | None:
+        if match := self.item_pattern.match(text):
+            return match.group(1).lower()
+        return None
+
+    def get_section_type(self, identifier: str) -> TopSectionType:
+        """
+        Return the top section with the given identifier, or the
+        `invalid_section` if there is none.
+        """
+        return self.identifier_to_section.get(identifier, self.invalid_section)
+
+
+@dataclass
+class _Candidate:
+    section_type: TopSectionType
+    element: AbstractSemanticElement
+
+
+class TopSectionManager(AbstractElementwiseProcessingStep):
+    """
+    Documents are divided into sections, subsections, and so on.
+    Top level sections are the highest level of sections and are
+    standardized across each type of document.
+
+    An example of a Top Level Section in a 10-Q report is
+    "Part I, Item 3. Quantitative and Qualitative
+    Disclosures About Market Risk.".
+
+    The top sections, and the patterns of their titles, are given by the
+    TopSectionLayout of the form type. For example, TopSectionManagerFor10Q
+    is a TopSectionManager with the layout of 10-Q reports.
+
+    In the first iteration, the elements whose text starts like the title
+    of a part or an item become candidates. In the second iteration, one
+    candidate is selected for each section type, preferring the candidates
+    that do not contain a table, and the selected candidates become
+    TopSectionTitle elements, as long as they are in the order of their
+    sections.
+    """
+
+    _NUM_ITERATIONS = 2
+
+    def __init__(
+        self,
+        layout: TopSectionLayout,
+        *,
+        types_to_process: set[type[AbstractSemanticElement]] | None = None,
+        types_to_exclude: set[type[AbstractSemanticElement]] | None = None,
+    ) -> None:
+        super().__init__(
+            types_to_process=types_to_process,
+            types_to_exclude=types_to_exclude,
+        )
+        self._layout = layout
+        self.reset()
+
+    @property
+    def layout(self) -> TopSectionLayout:
+        return self._layout
+
+    def reset(self) -> None:
+        super().reset()
+        self._candidates: list[_Candidate] = []
+        self._selected_candidates: tuple[_Candidate, ...] | None = None
+        # The selected candidates of each element, keyed by the id of the
+        # element, so that each element is looked up in constant time.
+        self._selected_candidates_by_element: dict[int, list[_Candidate]] = {}
+        self._last_part: str = "?"
+        self._last_order_number = float("-inf")
+
+    def _process_element(
+        self,
+        element: AbstractSemanticElement,
+        context: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        if context.iteration == 0:
+            self._identify_candidate(element)
+            return element
+
+        if context.iteration == 1:
+            if self._selected_candidates is None:
+                self._select_candidates()
+            return self._process_selected_candidates(element)
+
+        msg = f"Invalid iteration: {context.iteration}"
+        raise ValueError(msg)
+
+    def _identify_candidate(self, element: AbstractSemanticElement) -> None:
+        layout = self._layout
+        identifier = None
+        if part := layout.match_part(element.text):
+            self._last_part = part
+            identifier = f"part{self._last_part}"
+        elif item := layout.match_item(element.text):
+            identifier = f"part{self._last_part}item{item}"
+        if identifier is None:
+            return
+
+        section_type = layout.get_section_type(identifier)
+        if section_type is layout.invalid_section:
+            warnings.warn(
+                f"Invalid section type for {identifier}. Defaulting to "
+                f"the invalid section of {layout.form_type}.",
+                UserWarning,
+                stacklevel=7,
+            )
+        candidate = _Candidate(section_type, element)
+        self._candidates.append(candidate)
+        element.processing_log.add_item(
+            message=lambda: f"Identified as candidate: {identifier}",
+            log_origin=self.__class__.__name__,
+        )
+
+    def _select_candidates(self) -> None:
+        """
+        Select a single candidate for each section type, and index the
+        selected candidates by their elements. The selected candidates are
+        sorted by the order of their sections.
+        """
+        grouped_candidates = defaultdict(list)
+        for candidate in self._candidates:
+            grouped_candidates[candidate.section_type].append(candidate.element)
+
+        selected_candidates = [
+            _Candidate(
+                section_type=section_type,
+                element=_select_element(elements),
+            )
+            for section_type, elements in grouped_candidates.items()
+        ]
+        selected_candidates.sort(key=lambda c: c.section_type.order)
+        self._selected_candidates = tuple(selected_candidates)
+        for candidate in self._selected_candidates:
+            self._selected_candidates_by_element.setdefault(
+                id(candidate.element),
+                [],
+            ).append(candidate)
+
+    def _process_selected_candidates(
+        self,
+        element: AbstractSemanticElement,
+    ) -> AbstractSemanticElement:
+        """
+        Turn the element into a TopSectionTitle, if it is one of the selected
+        candidates, and its section comes after the sections found so far.
+        """
+        for candidate in self._selected_candidates_by_element.get(id(element), ()):
+            if candidate.section_type.order > self._last_order_number:
+                self._update_last_order_number(element, candidate.section_type.order)
+                return self._create_top_section_title(candidate)
+            self._log_order_number_not_greater(element, candidate.section_type.order)
+        return element
+
+    def _update_last_order_number(
+        self,
+        element: AbstractSemanticElement,
+        order: float,
+    ) -> None:
+        last_order_number = self._last_order_number
+        element.processing_log.add_item(
+            message=lambda: f"this.order={order} last_order_number={last_order_number}.",
+            log_origin=self.__class__.__name__,
+        )
+        self._last_order_number = order
+
+    def _log_order_number_not_greater(
+        self,
+        element: AbstractSemanticElement,
+        order: float,
+    ) -> None:
+        last_order_number = self._last_order_number
+        element.processing_log.add_item(
+            message=lambda: (
+                f"Order number {order} is not greater than "
+                f"last order number {last_order_number}."
+            ),
+            log_origin=self.__class__.__name__,
+        )
+
+    def _create_top_section_title(
+        self,
+        candidate: _Candidate,
+    ) -> AbstractSemanticElement:
+        return TopSectionTitle.create_from_element(
+            candidate.element,
+            level=candidate.section_type.level,
+            section_type=candidate.section_type,
+            log_origin=self.__class__.__name__,
+        )
+
+
+def _select_element(
+    elements: list[AbstractSemanticElement],
+) -> AbstractSemanticElement:
+    """Select the first element that does not contain a table, if any."""
+    if len(elements) == 1:
+        return elements[0]
+    for element in elements:
+        if not element.html_tag.contains_tag("table", include_self=True):
+            return element
+    return elements[0]
@@ -4,7 +4,14 @@ from abc import ABC
 from typing import TYPE_CHECKING, Any
 
 from sec_parser.exceptions import SecParserValueError
-from sec_parser.processing_engine.processing_log import LogItemOrigin, ProcessingLog
+from sec_parser.processing_engine.processing_log import (
+    LogItemOrigin,
+    ProcessingLog,
+    ProcessingLogMode,
+)
+from sec_parser.semantic_elements.detached_semantic_element import (
+    DetachedSemanticElement,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from sec_parser.processing_engine.html_tag import HtmlTag
@@ -41,7 +48,11 @@ class AbstractSemanticElement(ABC):  # noqa: B024
 
     def log_init(self, log_origin: LogItemOrigin | None = None) -> None:
         """Has to be called at the very end of the __init__ method."""
-        if log_origin:
+        # The payload is built right away, also when the log is lazy, so
+        # that it records the element as it was created, and the log does
+        # not keep the element alive once it is replaced. It only holds the
+        # class name and a few scalar fields, so it is cheap to build.
+        if log_origin and self.processing_log.mode is not ProcessingLogMode.OFF:
             self.processing_log.add_item(
                 log_origin=log_origin,
                 message=self.to_dict(include_previews=False),
@@ -77,6 +88,23 @@ class AbstractSemanticElement(ABC):  # noqa: B024
             result.update(self._html_tag.to_dict())
         return result
 
+    def detach(self) -> DetachedSemanticElement:
+        """
+        Create a compact record of the semantic element, which does not
+        hold on to the HtmlTag, and therefore to the parsed document.
+        """
+        return DetachedSemanticElement(
+            cls_name=self.__class__.__name__,
+            text=self.text,
+            html_hash=self._html_tag.html_hash,
+            source_span=self._html_tag.source_span,
+            **self._get_detached_fields(),
+        )
+
+    def _get_detached_fields(self) -> dict[str, Any]:
+        """Return the subclass-specific fields of the detached record."""
+        return {}
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}<{self._html_tag.name}>"
 
@@ -89,6 +117,11 @@ class AbstractSemanticElement(ABC):  # noqa: B024
         """Property text is a passthrough to the HtmlTag text property."""
         return self._html_tag.text
 
+    @property
+    def source_span(self) -> tuple[int, int] | None:
+        """Property source_span is a passthrough to the HtmlTag source_span."""
+        return self._html_tag.source_span
+
     def get_source_code(
         self,
         *,
@@ -170,6 +203,9 @@ class AbstractLevelElement(AbstractSemanticElement):
             "level": self.level,
         }
 
+    def _get_detached_fields(self) -> dict[str, Any]:
+        return {**super()._get_detached_fields(), "level": self.level}
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}[L{self.level}]<{self._html_tag.name}>"
 
@@ -99,6 +99,12 @@ class CompositeSemanticElement(AbstractSemanticElement):
             "inner_elements": len(self.inner_elements),
         }
 
+    def _get_detached_fields(self) -> dict[str, Any]:
+        return {
+            **super()._get_detached_fields(),
+            "inner_elements": tuple(e.detach() for e in self.inner_elements),
+        }
+
     @classmethod
     def unwrap_elements(
         cls,
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.semantic_elements.highlighted_text_element import TextStyle
+
+
+class DetachedSemanticElement:
+    """
+    DetachedSemanticElement is a compact, read-only record of a semantic element.
+
+    Unlike the semantic elements themselves, it holds no reference to the
+    HtmlTag, and through it to the parsed BeautifulSoup document. Once all
+    elements of a document are detached, the document can be garbage collected,
+    which makes the records suitable for keeping many parsed documents around.
+    """
+
+    __slots__ = (
+        "cls_name",
+        "text",
+        "html_hash",
+        "level",
+        "section_type",
+        "text_style",
+        "source_span",
+        "inner_elements",
+    )
+
+    def __init__(
+        self,
+        *,
+        cls_name: str,
+        text: str,
+        html_hash: str,
+        level: int | None = None,
+        section_type: str | None = None,
+        text_style: TextStyle | None = None,
+        source_span: tuple[int, int] | None = None,
+        inner_elements: tuple[DetachedSemanticElement, ...] = (),
+    ) -> None:
+        self.cls_name = cls_name
+        self.text = text
+        self.html_hash = html_hash
+        self.level = level
+        # The identifier of the top section type, e.g. "part1item2"
+        self.section_type = section_type
+        self.text_style = text_style
+        # The start and end offsets of the element in the source document
+        self.source_span = source_span
+        self.inner_elements = inner_elements
+
+    def to_dict(
+        self,
+        *,
+        include_previews: bool = False,
+        include_contents: bool = False,
+    ) -> dict[str, Any]:
+        result: dict[str, Any] = {"cls_name": self.cls_name}
+        if include_previews:
+            result["html_hash"] = self.html_hash
+        if self.level is not None:
+            result["level"] = self.level
+        if self.section_type is not None:
+            result["section_type"] = self.section_type
+        if self.text_style is not None:
+            result["text_style"] = asdict(self.text_style)
+        if self.inner_elements:
+            result["inner_elements"] = len(self.inner_elements)
+        if include_contents:
+            result["text_content"] = self.text
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DetachedSemanticElement):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.cls_name, self.html_hash, self.source_span))
+
+    def __repr__(self) -> str:
+        return f"Detached{self.cls_name}<{self.html_hash}>"
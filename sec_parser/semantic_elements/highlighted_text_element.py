@@ -81,6 +81,9 @@ class HighlightedTextElement(AbstractSemanticElement):
             "text_style": asdict(self.style),
         }
 
+    def _get_detached_fields(self) -> dict[str, Any]:
+        return {**super()._get_detached_fields(), "text_style": self.style}
+
 
 @dataclass(frozen=True)
 class TextStyle:
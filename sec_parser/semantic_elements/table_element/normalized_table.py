@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.utils.bs4_.table_grid import TableGrid
+
+# Cells that only hold a marker for the number next to them. Financial
+# statements often put these in columns of their own.
+_CURRENCY_MARKERS = ["$", "€", "£", "¥"]
+_PERCENT_MARKERS = ["%", "%)", ")%"]
+_CLOSING_MARKERS = [")", "%)", ")%"]
+_OPENING_MARKERS = ["(", "$(", "($"]
+
+# Cells that stand for zero, or for no amount, such as an em dash
+_ZERO_MARKERS = ["—", "–", "-", "−"]  # noqa: RUF001
+
+# Characters that don't change the value of a number
+_IGNORED_CHARACTERS = [",", " ", "\xa0", *_CURRENCY_MARKERS, "%", "(", ")"]
+
+_SCALE_HINT = re.compile(r"\bin\s+(thousands|millions|billions)\b", re.IGNORECASE)
+_SCALES = {"thousands": 1_000, "millions": 1_000_000, "billions": 1_000_000_000}
+
+
+@dataclass(frozen=True, eq=False)
+class NormalizedTable:
+    """
+    The numbers of a table, parsed from its cells into numeric arrays.
+
+    The columns that only contain markers, such as "$", "%" or the ")" of
+    a negative number, are merged into the columns of the numbers they
+    belong to. All arrays have the same shape, one row per row of the
+    table, and one column per remaining column.
+
+    - `text`: the text of each cell, without the markers of other columns.
+    - `values`: the number in each cell, as written, or NaN if there is none.
+      Negative numbers in parentheses are negative, dashes are zero.
+    - `is_currency` and `is_percent`: whether a number is marked as such.
+    - `scale`: the unit of the amounts, e.g. 1,000,000 for a table whose
+      amounts are "in millions", or 1 if there is no such hint.
+    """
+
+    text: np.ndarray
+    values: np.ndarray
+    is_currency: np.ndarray
+    is_percent: np.ndarray
+    scale: int = 1
+
+    @property
+    def scaled_values(self) -> np.ndarray:
+        """The values, multiplied by the scale, except for percentages."""
+        return np.where(self.is_percent, self.values, self.values * self.scale)
+
+    @classmethod
+    def from_grid(cls, grid: TableGrid, *, context: str = "") -> NormalizedTable:
+        """
+        Normalize the cells of a table grid in a single vectorized pass.
+
+        The `context` is text near the table, such as its caption, that may
+        hold the scale hint, if the table itself does not.
+        """
+        cells = np.char.strip(_to_array(grid.rows))
+        if not cells.size:
+            return cls(
+                text=cells,
+                values=np.full(cells.shape, np.nan),
+                is_currency=np.zeros(cells.shape, dtype=bool),
+                is_percent=np.zeros(cells.shape, dtype=bool),
+                scale=_get_scale(context),
+            )
+        width = cells.shape[1]
+
+        is_currency_marker = np.isin(cells, _CURRENCY_MARKERS)
+        is_percent_marker = np.isin(cells, _PERCENT_MARKERS)
+        is_closing_marker = np.isin(cells, _CLOSING_MARKERS)
+        is_opening_marker = np.isin(cells, _OPENING_MARKERS)
+        is_marker = (
+            is_currency_marker
+            | is_percent_marker
+            | is_closing_marker
+            | is_opening_marker
+        )
+        has_content = (cells != "") & ~is_marker
+
+        # A marker belongs to the closest cell with content on its side:
+        # a currency sign or an opening parenthesis precedes the number,
+        # a percent sign or a closing parenthesis follows it.
+        column = np.arange(width)
+        following = np.where(has_content, column, width)
+        following = np.minimum.accumulate(following[:, ::-1], axis=1)[:, ::-1]
+        preceding = np.where(has_content, column, -1)
+        preceding = np.maximum.accumulate(preceding, axis=1)
+        is_currency = _mark_owners(is_currency_marker, following, width)
+        is_percent = _mark_owners(is_percent_marker, preceding, width)
+        is_negative = _mark_owners(is_opening_marker, following, width)
+        is_negative |= _mark_owners(is_closing_marker, preceding, width)
+
+        # Markers and signs within the cells themselves
+        is_currency |= np.char.find(cells, "$") >= 0
+        is_percent |= np.char.find(cells, "%") >= 0
+        is_negative |= np.char.startswith(cells, "(")
+        is_negative |= np.char.startswith(cells, "$(")
+        digits = cells
+        for character in _IGNORED_CHARACTERS:
+            digits = np.char.replace(digits, character, "")
+        has_minus = np.char.startswith(digits, "-") | np.char.startswith(
+            digits,
+            "−",  # noqa: RUF001
+        )
+        digits = np.where(has_minus, np.char.lstrip(digits, "-−"), digits)  # noqa: RUF001
+        is_negative |= has_minus
+
+        is_number = has_content & np.char.isdecimal(
+            np.char.replace(digits, ".", "", count=1),
+        )
+        values = np.full(cells.shape, np.nan)
+        values[is_number] = digits[is_number].astype(np.float64)
+        values[is_number & is_negative] *= -1
+        values[has_content & np.isin(cells, _ZERO_MARKERS)] = 0.0
+
+        # The columns that only hold markers are merged away
+        keep = has_content.any(axis=0)
+        has_value = ~np.isnan(values)
+        text = " ".join([*(" ".join(row) for row in grid.rows), context])
+        return cls(
+            text=np.where(has_content, cells, "")[:, keep],
+            values=values[:, keep],
+            is_currency=(is_currency & has_value)[:, keep],
+            is_percent=(is_percent & has_value)[:, keep],
+            scale=_get_scale(text),
+        )
+
+
+def _to_array(rows: tuple[tuple[str, ...], ...]) -> np.ndarray:
+    if not rows:
+        return np.empty((0, 0), dtype=str)
+    return np.array(rows, dtype=str).reshape(len(rows), -1)
+
+
+def _mark_owners(
+    is_marker: np.ndarray,
+    owners: np.ndarray,
+    width: int,
+) -> np.ndarray:
+    """Mark the cells that the markers belong to, given by their columns."""
+    result = np.zeros(is_marker.shape, dtype=bool)
+    rows, columns = np.nonzero(is_marker)
+    owner_columns = owners[rows, columns]
+    has_owner = (owner_columns >= 0) & (owner_columns < width)
+    result[rows[has_owner], owner_columns[has_owner]] = True
+    return result
+
+
+def _get_scale(text: str) -> int:
+    match = _SCALE_HINT.search(text)
+    if match is None:
+        return 1
+    return _SCALES[match.group(1).lower()]
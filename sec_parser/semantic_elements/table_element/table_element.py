@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import asdict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.semantic_elements.table_element.normalized_table import (
+        NormalizedTable,
+    )
+    from sec_parser.utils.bs4_.table_grid import TableGrid
+
 
 class TableElement(AbstractSemanticElement):
     """The TableElement class represents a standard table within a document."""
@@ -42,5 +48,18 @@ class TableElement(AbstractSemanticElement):
             result_dict["metrics"] = asdict(metrics) if metrics is not None else None
         return result_dict
 
+    def get_table_grid(self) -> TableGrid:
+        """Return the cells of the table, from which it can be exported."""
+        return self.html_tag.get_table_grid()
+
+    def get_normalized_table(self, *, context: str = "") -> NormalizedTable:
+        """Return the numbers of the table, see NormalizedTable."""
+        # numpy is only imported once the numbers of a table are needed
+        from sec_parser.semantic_elements.table_element.normalized_table import (
+            NormalizedTable,
+        )
+
+        return NormalizedTable.from_grid(self.get_table_grid(), context=context)
+
     def table_to_markdown(self) -> str:
         return self.html_tag.table_to_markdown()
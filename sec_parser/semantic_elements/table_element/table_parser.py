@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from io import StringIO
+from typing import TYPE_CHECKING
 
-import pandas as pd
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
 
 
 class TableParser:
@@ -11,6 +15,8 @@ class TableParser:
 
     @staticmethod
     def _basic_preprocessing(html: str) -> pd.DataFrame:
+        import pandas as pd
+
         if not isinstance(html, pd.DataFrame):
             tables = pd.read_html(StringIO(html), flavor="lxml")
             if len(tables) == 0:
@@ -35,57 +41,54 @@ class TableParser:
 
     @staticmethod
     def _remove_blank_columns(df: pd.DataFrame) -> pd.DataFrame:
-        columns_to_remove = []
-        for i, _ in enumerate(df.columns):
-            if i < len(df.columns) - 1:
-                current_column = df.columns[i]
-                next_column = df.columns[i + 1]
-                non_empty_rows = df[
-                    (df[current_column] != "") & (df[next_column] != "")
-                ]
-                if (
-                    non_empty_rows[current_column] == non_empty_rows[next_column]
-                ).all():
-                    if (df[current_column] == "").sum() >= (
-                        df[next_column] == ""
-                    ).sum():
-                        columns_to_remove.append(current_column)
-                    else:
-                        columns_to_remove.append(next_column)
+        # Each column is compared with the next one, all at once: a column
+        # is redundant if it agrees with the next one wherever both have
+        # text, and the one with more blank cells is removed.
+        cells = df.to_numpy(dtype=object)
+        current, following = cells[:, :-1], cells[:, 1:]
+        has_text = (current != "") & (following != "")
+        is_redundant = ((current == following) | ~has_text).all(axis=0)
+        blanks = (cells == "").sum(axis=0)
+        removes_current = blanks[:-1] >= blanks[1:]
+        columns_to_remove = [
+            df.columns[i] if removes_current[i] else df.columns[i + 1]
+            for i in np.flatnonzero(is_redundant)
+        ]
         return df.drop(columns=columns_to_remove)
 
     @staticmethod
     def _merge_columns_by_marker(table: pd.DataFrame, marker: str) -> pd.DataFrame:
-        for i, _ in enumerate(table.columns):
-            if i < len(table.columns) - 1:
-                current_column = table.columns[i]
-                next_column = table.columns[i + 1]
-                non_marker_rows = table[
-                    (table[current_column] != marker) & (table[next_column] != marker)
-                ]
-                non_empty_non_marker_rows = non_marker_rows[
-                    (non_marker_rows[current_column] != "")
-                    & (non_marker_rows[next_column] != "")
-                ]
-                marker_rows = table.drop(non_empty_non_marker_rows.index)
-                marker_rows_indices = marker_rows.index
-                if (
-                    non_empty_non_marker_rows[current_column]
-                    == non_empty_non_marker_rows[next_column]
-                ).all():
-                    table.loc[marker_rows_indices, current_column] = (
-                        table.loc[marker_rows_indices, current_column]
-                        .str.cat(
-                            table.loc[marker_rows_indices, next_column],
-                            sep="",
-                            na_rep="",
-                        )
-                        .str.strip()
-                    )
-                    table = table.drop(columns=[next_column])
-        return table
+        import pandas as pd
+
+        cells = table.to_numpy(dtype=object)
+        columns = list(table.columns)
+        # A merge shifts the following columns, so each column is compared
+        # with the current next one, in order.
+        for i in range(len(columns)):
+            if i >= len(columns) - 1:
+                continue
+            current, following = cells[:, i], cells[:, i + 1]
+            is_data = (
+                (current != marker)
+                & (following != marker)
+                & (current != "")
+                & (following != "")
+            )
+            if not (current[is_data] == following[is_data]).all():
+                continue
+            rows = ~is_data
+            merged = np.char.add(
+                current[rows].astype(str),
+                following[rows].astype(str),
+            )
+            cells[rows, i] = np.char.strip(merged)
+            cells = np.delete(cells, i + 1, axis=1)
+            del columns[i + 1]
+        return pd.DataFrame(cells, index=table.index, columns=columns)
 
     def parse_as_df(self) -> pd.DataFrame:
+        import pandas as pd
+
         table = self._basic_preprocessing(self._html)
         table = self._remove_blank_columns(table)
         table = self._merge_columns_by_marker(table, "$")
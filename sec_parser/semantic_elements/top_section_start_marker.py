@@ -71,3 +71,9 @@ class TopSectionStartMarker(AbstractLevelElement):
             ),
             "section_type": self.section_type.identifier,
         }
+
+    def _get_detached_fields(self) -> dict[str, Any]:
+        return {
+            **super()._get_detached_fields(),
+            "section_type": self.section_type.identifier,
+        }
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+
+import bs4
+
+# Tags that never have contents nor an end tag
+_VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    },
+)
+
+# Tags whose contents are not parsed as markup
+_RAW_TEXT_TAGS = frozenset({"script", "style", "textarea", "title"})
+
+# Start tags that implicitly close an open <p>
+_CLOSES_P = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "div",
+        "dl",
+        "fieldset",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "menu",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "ul",
+    },
+)
+
+# For each tag, the start tags that implicitly close it if it is still open
+_IMPLICITLY_CLOSED_BY = {
+    "p": _CLOSES_P,
+    "li": frozenset({"li"}),
+    "dt": frozenset({"dt", "dd"}),
+    "dd": frozenset({"dt", "dd"}),
+    "tr": frozenset({"tr"}),
+    "td": frozenset({"td", "th", "tr"}),
+    "th": frozenset({"td", "th", "tr"}),
+    "option": frozenset({"option"}),
+}
+
+# Tags that the HTML parser backend adds when missing, or drops when misplaced.
+# They are ignored when comparing the nesting of the source and the tree.
+_STRUCTURAL_TAGS = frozenset({"html", "head", "body"})
+
+# How many start tags are scanned ahead to find the one of a tree tag
+_MAX_LOOKAHEAD = 64
+
+# A start tag of a raw text element is matched along with its contents,
+# as those are not markup, even if they look like it.
+_MARKUP = re.compile(
+    rb"""
+      <(?P<raw>script|style|textarea|title)(?![^\s/>])(?:[^>"']+|"[^"]*"|'[^']*')*>
+        .*?(?:</(?P=raw)\s*>|\Z)
+    | <(?P<start>[A-Za-z][^\s/>]*)(?P<attrs>(?:[^>"']+|"[^"]*"|'[^']*')*)>
+    | </(?P<end>[^\s/>]+)[^>]*>?
+    | <!--.*?(?:-->|\Z)
+    | <!\[CDATA\[.*?(?:\]\]>|\Z)
+    | <[!?][^>]*>?
+    """,
+    re.DOTALL | re.VERBOSE | re.IGNORECASE,
+)
+
+_SLASH = ord("/")
+
+
+class _StartTag:
+    __slots__ = ("name", "start", "end", "parent")
+
+    def __init__(self, name: str, start: int, parent: _StartTag | None) -> None:
+        self.name = name
+        self.start = start
+        self.end: int | None = None
+        self.parent = parent
+
+
+class SourceSpanIndex:
+    """
+    SourceSpanIndex maps the tags of a parsed document to the start and
+    end offsets of their markup in the source document.
+
+    The HTML parser backends of BeautifulSoup don't record source positions,
+    so the source is scanned separately. The start tags found in the source
+    are then matched, in document order, to the tags of the parsed tree.
+    A tag is only matched if its nesting agrees with the one of the source,
+    so tags that were added or moved by the parser backend to recover from
+    malformed markup are left without a span, rather than given a wrong one.
+
+    The offsets are in bytes. A source given as `str` is UTF-8 encoded.
+
+    The index is built right away, as it has to see the document before
+    the processing steps start mutating it.
+    """
+
+    def __init__(self, root: bs4.Tag, source: str | bytes) -> None:
+        self._root = root
+        self._source = source.encode() if isinstance(source, str) else source
+        # Holds the tags themselves, so that their ids are not reused
+        self._spans_by_id = self._build()
+
+    @property
+    def source(self) -> bytes:
+        return self._source
+
+    def get(self, tag: bs4.Tag) -> tuple[int, int] | None:
+        entry = self._spans_by_id.get(id(tag))
+        return None if entry is None else entry[1:]
+
+    def _build(self) -> dict[int, tuple[bs4.Tag, int, int]]:
+        tokens = _tokenize(self._source)
+        token_starts = [token.start for token in tokens]
+        spans: dict[int, tuple[bs4.Tag, int, int]] = {}
+        document: bs4.Tag = self._root
+        while document.parent is not None:
+            document = document.parent
+
+        # Iterative depth-first traversal, keeping track of the start tag
+        # of the nearest matched ancestor of each tag. A matched tag gets its
+        # span once its subtree is done, if it has as many descendant tags as
+        # its start tag has in the source. Otherwise the parser backend added
+        # or dropped tags within it, and the source is not a faithful copy.
+        cursor = 0
+        tag_count = 0
+        stack: list[tuple[bs4.Tag, _StartTag | None, int | None, int]] = [
+            (child, None, None, 0)
+            for child in reversed(document.contents)
+            if isinstance(child, bs4.Tag)
+        ]
+        while stack:
+            tag, parent_token, token_index, first_descendant = stack.pop()
+            if token_index is not None:
+                token = tokens[token_index]
+                if token.end is not None:
+                    end_index = bisect_left(token_starts, token.end, token_index)
+                    if end_index - token_index - 1 == tag_count - first_descendant:
+                        spans[id(tag)] = (tag, token.start, token.end)
+                continue
+            tag_count += 1
+            token_index = _find_token(tokens, cursor, tag, parent_token)
+            if token_index is not None:
+                cursor = token_index + 1
+                parent_token = tokens[token_index]
+                stack.append((tag, parent_token, token_index, tag_count))
+            stack.extend(
+                (child, parent_token, None, 0)
+                for child in reversed(tag.contents)
+                if isinstance(child, bs4.Tag)
+            )
+        return spans
+
+
+def _find_token(
+    tokens: list[_StartTag],
+    cursor: int,
+    tag: bs4.Tag,
+    parent_token: _StartTag | None,
+) -> int | None:
+    """
+    Find the start tag of `tag`, i.e. the next start tag nested directly in
+    the start tag of its parent. If that start tag has a different name,
+    the tag is not present in the source.
+    """
+    name = tag.name if tag.prefix is None else f"{tag.prefix}:{tag.name}"
+    expected_parent = _skip_structural(parent_token)
+    parent_end = None if expected_parent is None else expected_parent.end
+    for i in range(cursor, min(cursor + _MAX_LOOKAHEAD, len(tokens))):
+        token = tokens[i]
+        if parent_end is not None and token.start >= parent_end:
+            return None
+        if _skip_structural(token.parent) is not expected_parent:
+            continue
+        if token.name in _STRUCTURAL_TAGS and token.name != name:
+            continue
+        return i if token.name == name else None
+    return None
+
+
+def _skip_structural(token: _StartTag | None) -> _StartTag | None:
+    while token is not None and token.name in _STRUCTURAL_TAGS:
+        token = token.parent
+    return token
+
+
+def _tokenize(source: bytes) -> list[_StartTag]:
+    """
+    Scan the start tags of the source, in document order, with their
+    offsets and nesting. Omitted end tags are inferred for the common
+    cases, such as a <p> followed by a <div>. The end of a tag that is
+    not closed otherwise is left as None.
+    """
+    tokens: list[_StartTag] = []
+    open_tags: list[_StartTag] = []
+    names: dict[bytes, str] = {}
+    for match in _MARKUP.finditer(source):
+        raw_name, attrs, end_name, raw_text_name = match.group(
+            "start",
+            "attrs",
+            "end",
+            "raw",
+        )
+        start, end = match.span()
+        if raw_name is not None:
+            name = names.get(raw_name) or names.setdefault(
+                raw_name,
+                raw_name.decode("latin-1").lower(),
+            )
+            if open_tags and open_tags[-1].name in _IMPLICITLY_CLOSED_BY:
+                _close_implied(open_tags, name, start)
+            token = _StartTag(name, start, open_tags[-1] if open_tags else None)
+            tokens.append(token)
+            if name in _VOID_TAGS or (attrs and attrs[-1] == _SLASH):
+                token.end = end
+            else:
+                open_tags.append(token)
+        elif end_name is not None:
+            name = names.get(end_name) or names.setdefault(
+                end_name,
+                end_name.decode("latin-1").lower(),
+            )
+            if open_tags and open_tags[-1].name == name:
+                open_tags.pop().end = end
+            else:
+                _close_misnested(open_tags, name, start, end)
+        elif raw_text_name is not None:
+            name = raw_text_name.decode("latin-1").lower()
+            if open_tags and open_tags[-1].name in _IMPLICITLY_CLOSED_BY:
+                _close_implied(open_tags, name, start)
+            token = _StartTag(name, start, open_tags[-1] if open_tags else None)
+            token.end = end
+            tokens.append(token)
+    return tokens
+
+
+def _close_misnested(
+    open_tags: list[_StartTag],
+    name: str,
+    start: int,
+    end: int,
+) -> None:
+    for i in range(len(open_tags) - 1, -1, -1):
+        if open_tags[i].name == name:
+            unclosed = open_tags[i + 1 :]
+            # Tags with an optional end tag, like <td>, are closed by
+            # the end of their parent. Any other tag still open means
+            # the markup is misnested. Parser backends recover from it
+            # in different ways, so the affected ends are left unknown.
+            if all(t.name in _IMPLICITLY_CLOSED_BY for t in unclosed):
+                for t in unclosed:
+                    t.end = start
+                open_tags[i].end = end
+            del open_tags[i:]
+            return
+
+
+def _close_implied(open_tags: list[_StartTag], name: str, offset: int) -> None:
+    while open_tags and name in _IMPLICITLY_CLOSED_BY.get(
+        open_tags[-1].name,
+        (),
+    ):
+        open_tags.pop().end = offset
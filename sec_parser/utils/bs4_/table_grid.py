@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import csv
+import io
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import bs4
+from bs4.element import PreformattedString
+
+from sec_parser.utils.bs4_.get_single_table import get_single_table
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
+# Line breaks, and runs of whitespace, within a cell become a single space
+_WHITESPACE = re.compile(r"\s{2,}|[\r\n]")
+
+# A number, possibly with thousands separators, such as "1,642" or "-0.5"
+_NUMBER = re.compile(r"[-+]?(?:(?:\d+,)*\d+\.?\d*|\.\d+)(?:[eE]-?\d+)?")
+
+
+@dataclass(frozen=True)
+class TableGrid:
+    """
+    The cells of an HTML table, laid out on a grid of rows and columns.
+
+    A cell that spans several columns takes up all of them, its text is in
+    the last one, and the others are empty. A cell that spans several rows
+    is repeated in each of them, up to the last row of the table. All rows
+    have the same number of columns.
+    The first `header_rows` rows are the header of the table, i.e. the rows
+    of its <thead>, or else its leading rows that only contain <th> cells.
+    """
+
+    rows: tuple[tuple[str, ...], ...]
+    header_rows: int = 0
+
+    @classmethod
+    def from_tag(cls, bs4_tag: bs4.Tag) -> TableGrid:
+        """
+        Extract the grid of the single table within the tag, walking its
+        rows once, without modifying the document.
+        """
+        table = get_single_table(bs4_tag)
+        header: list[bs4.Tag] = []
+        body: list[bs4.Tag] = []
+        footer: list[bs4.Tag] = []
+        for child in table.children:
+            if not isinstance(child, bs4.Tag):
+                continue
+            if child.name == "tr":
+                body.append(child)
+            elif child.name in ("thead", "tbody", "tfoot"):
+                rows = {"thead": header, "tbody": body, "tfoot": footer}[child.name]
+                rows.extend(child.find_all("tr"))
+
+        cells = [_get_cells(tr) for tr in (*header, *body, *footer)]
+        header_rows = len(header)
+        if not header_rows:
+            while header_rows < len(cells) and cells[header_rows] and all(
+                td.name == "th" for td in cells[header_rows]
+            ):
+                header_rows += 1
+
+        rows = _expand_spans(cells)
+        width = max(map(len, rows), default=0)
+        return cls(
+            rows=tuple(tuple(row) + ("",) * (width - len(row)) for row in rows),
+            header_rows=header_rows,
+        )
+
+    @property
+    def header(self) -> tuple[tuple[str, ...], ...]:
+        return self.rows[: self.header_rows]
+
+    @property
+    def body(self) -> tuple[tuple[str, ...], ...]:
+        return self.rows[self.header_rows :]
+
+    def to_markdown(self) -> str:
+        """
+        Render the table as a Markdown table. Empty rows are left out, and
+        the thousands separators of numeric columns are removed.
+        """
+        lines = []
+        if self.header_rows:
+            # Markdown tables have a single header row, so any further
+            # header rows are rendered as the first rows of the body.
+            lines.append(_to_markdown_row(self.rows[0]))
+            lines.append("|" + "---|" * len(self.rows[0]))
+        rows = [*self.rows[1 : self.header_rows], *_normalize_numbers(self.body)]
+        lines.extend(_to_markdown_row(row) for row in rows if any(row))
+        return "\n".join(lines)
+
+    def to_csv(self) -> str:
+        output = io.StringIO()
+        csv.writer(output, lineterminator="\n").writerows(self.rows)
+        return output.getvalue()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        import pandas as pd
+
+        if not self.header_rows:
+            return pd.DataFrame(list(self.rows))
+        return pd.DataFrame(list(self.rows[1:]), columns=list(self.rows[0]))
+
+
+def _get_cells(tr: bs4.Tag) -> list[bs4.Tag]:
+    return [
+        td
+        for td in tr.children
+        if isinstance(td, bs4.Tag) and td.name in ("td", "th")
+    ]
+
+
+def _expand_spans(rows: list[list[bs4.Tag]]) -> list[list[str]]:
+    grid: list[list[str]] = []
+    # The texts of the cells that span into the current row, and the number
+    # of rows that they span, including it, by column
+    spanning: dict[int, tuple[str, int]] = {}
+    for cells in rows:
+        row: list[str] = []
+        next_spanning: dict[int, tuple[str, int]] = {}
+        for td in cells:
+            # Each cell takes the first column that is not taken by a cell
+            # from one of the rows above
+            while len(row) in spanning:
+                _take_spanning(row, len(row), spanning, next_spanning)
+            colspan = _get_span(td, "colspan")
+            rowspan = _get_span(td, "rowspan")
+            text = _get_text(td)
+            for i in range(colspan):
+                column_text = text if i == colspan - 1 else ""
+                if rowspan > 1:
+                    next_spanning[len(row)] = (column_text, rowspan - 1)
+                row.append(column_text)
+        for column in sorted(spanning):
+            if column >= len(row):
+                row.extend([""] * (column - len(row)))
+                _take_spanning(row, column, spanning, next_spanning)
+        grid.append(row)
+        spanning = next_spanning
+    return grid
+
+
+def _take_spanning(
+    row: list[str],
+    column: int,
+    spanning: dict[int, tuple[str, int]],
+    next_spanning: dict[int, tuple[str, int]],
+) -> None:
+    text, rows_left = spanning[column]
+    if rows_left > 1:
+        next_spanning[column] = (text, rows_left - 1)
+    row.append(text)
+
+
+def _get_span(td: bs4.Tag, name: str) -> int:
+    value = td.get(name)
+    if not value:
+        return 1
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1
+
+
+def _get_text(td: bs4.Tag) -> str:
+    parts: list[str] = []
+    _collect_text(td, parts)
+    return _WHITESPACE.sub(" ", "".join(parts).strip())
+
+
+def _collect_text(tag: bs4.Tag, parts: list[str]) -> None:
+    for child in tag.contents:
+        if isinstance(child, bs4.Tag):
+            # Hidden elements are not part of the table
+            if child.name == "style" or "display:none" in child.get(
+                "style",
+                "",
+            ).replace(" ", ""):
+                continue
+            _collect_text(child, parts)
+        elif not isinstance(child, PreformattedString):
+            parts.append(child)
+
+
+def _normalize_numbers(rows: tuple[tuple[str, ...], ...]) -> list[tuple[str, ...]]:
+    """
+    Strip the thousands separators from numbers, and, in the columns that
+    only contain numbers, write them in a uniform way, e.g. "1.50" as "1.5".
+    """
+    columns = [list(column) for column in zip(*rows)]
+    for column in columns:
+        is_numeric = True
+        for i, text in enumerate(column):
+            if "," in text and _NUMBER.fullmatch(text):
+                column[i] = text.replace(",", "")
+            elif text and not _NUMBER.fullmatch(text):
+                is_numeric = False
+        if is_numeric:
+            column[:] = [_format_number(text) for text in column]
+    return list(zip(*columns))
+
+
+def _format_number(text: str) -> str:
+    if not text:
+        return text
+    if not any(c in text for c in ".eE"):
+        return str(int(text))
+    number = float(text)
+    if number.is_integer() and abs(number) < 2**53:
+        return str(int(number))
+    return repr(number)
+
+
+def _to_markdown_row(cells: tuple[str, ...]) -> str:
+    return re.sub(" +", " ", "| " + " | ".join(cells) + " |")
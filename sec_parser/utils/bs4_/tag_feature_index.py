@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable
+
+import bs4
+
+from sec_parser.utils.bs4_.text_styles_metrics import (
+    StyleCascade,
+    compute_effective_style,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.utils.bs4_.source_spans import SourceSpanIndex
+
+# Strings of these exact types are the ones returned by `bs4.Tag.stripped_strings`
+# for regular (non <script>, <style>, etc.) tags.
+_TEXT_STRING_TYPES = bs4.Tag.DEFAULT_INTERESTING_STRING_TYPES
+
+
+class _BrokenStyle:
+    """
+    Marks a tag whose effective style can't be computed, e.g. because one
+    of its ancestors has a malformed `style` attribute. The error is raised
+    lazily, only when the style metrics are actually requested.
+    """
+
+    __slots__ = ("tag",)
+
+    def __init__(self, tag: bs4.Tag) -> None:
+        self.tag = tag
+
+
+class TagFeatures:
+    """
+    Aggregates of a single indexed tag and its subtree.
+
+    The subtree of a tag is represented by ranges into the flat,
+    document-ordered arrays of the owning TagFeatureIndex, so
+    answering a query does not require walking the bs4 tree.
+    """
+
+    __slots__ = (
+        "tag",
+        "position",
+        "end_position",
+        "text_start",
+        "text_end",
+        "string_start",
+        "string_end",
+        "raw_string_start",
+        "raw_string_end",
+        "is_unary_tree",
+        "first_deepest_tag",
+        "_index",
+    )
+
+    def __init__(self, index: TagFeatureIndex, tag: bs4.Tag, position: int) -> None:
+        self._index = index
+        self.tag = tag
+        self.position = position
+        self.end_position = position
+        self.text_start = len(index._text_pieces)  # noqa: SLF001
+        self.text_end = self.text_start
+        self.string_start = len(index._string_lengths)  # noqa: SLF001
+        self.string_end = self.string_start
+        self.raw_string_start = len(index._raw_strings)  # noqa: SLF001
+        self.raw_string_end = self.raw_string_start
+        self.is_unary_tree = True
+        self.first_deepest_tag: bs4.Tag | None = tag
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._index._text_pieces[self.text_start : self.text_end])  # noqa: SLF001
+
+    def get_text(self) -> str:
+        """Return the unstripped text of the subtree, as `bs4.Tag.get_text` does."""
+        if self.tag.interesting_string_types != _TEXT_STRING_TYPES:
+            text: str = self.tag.get_text()
+            return text
+        raw_strings = self._index._raw_strings  # noqa: SLF001
+        return "".join(raw_strings[self.raw_string_start : self.raw_string_end])
+
+    def count_text_matches_in_descendants(
+        self,
+        predicate: Callable[[str], bool],
+    ) -> int:
+        """
+        Mirrors `count_text_matches_in_descendants`, including that the
+        descendants that only wrap a link are always left out.
+        """
+        index = self._index
+        unique_texts = set()
+        for position in range(self.position + 1, self.end_position + 1):
+            descendant = index._features_by_position[position]  # noqa: SLF001
+            deepest_tag = descendant.first_deepest_tag
+            if (
+                descendant.is_unary_tree
+                and deepest_tag is not None
+                and deepest_tag.name == "a"
+            ):
+                continue
+            text = descendant.get_text().strip()
+            if text and text not in unique_texts and predicate(text):
+                unique_texts.add(text)
+        return len(unique_texts)
+
+    def count_tags(self, name: str) -> int:
+        count = 1 if self._matches_name(name) else 0
+        return count + self._count_descendants(name)
+
+    def contains_tag(self, name: str, *, include_self: bool = False) -> bool:
+        if include_self and self.tag.name == name:
+            return True
+        return self._count_descendants(name) > 0
+
+    def has_text_outside_tags(self, tag_names: tuple[str, ...]) -> bool:
+        if self.tag.name in tag_names:
+            return False
+        index = self._index
+        covered_ranges: list[tuple[int, int]] = []
+        for name in set(tag_names):
+            positions = index._positions_by_name.get(name, ())  # noqa: SLF001
+            first = bisect_right(positions, self.position)
+            last = bisect_right(positions, self.end_position)
+            for position in positions[first:last]:
+                descendant = index._features_by_position[position]  # noqa: SLF001
+                # Only the tag itself is matched by name here, prefixed names
+                # don't count (mirrors `has_text_outside_tags`).
+                if descendant.tag.name == name:
+                    covered_ranges.append(
+                        (descendant.string_start, descendant.string_end),
+                    )
+
+        covered = 0
+        covered_until = self.string_start
+        for start, end in sorted(covered_ranges):
+            start = max(start, covered_until)  # noqa: PLW2901
+            if end > start:
+                covered += end - start
+                covered_until = end
+        return covered < self.string_end - self.string_start
+
+    def get_text_styles_metrics(self) -> dict[tuple[str, str], float]:
+        index = self._index
+        total_chars: int = 0
+        style_metrics: dict[tuple[str, str], float] = defaultdict(float)
+        for i in range(self.string_start, self.string_end):
+            char_count = index._string_lengths[i]  # noqa: SLF001
+            effective_styles = index._string_styles[i]  # noqa: SLF001
+            if isinstance(effective_styles, _BrokenStyle):
+                # Re-raise the original error from the original code path
+                effective_styles = compute_effective_style(effective_styles.tag)
+            total_chars += char_count
+            for prop, val in effective_styles.items():
+                style_metrics[(prop, val)] += char_count
+
+        for key in style_metrics:
+            style_metrics[key] = (
+                (style_metrics[key] / total_chars) * 100 if total_chars else 0
+            )
+        return style_metrics
+
+    def _matches_name(self, name: str) -> bool:
+        tag = self.tag
+        return tag.name == name or (
+            tag.prefix is not None and f"{tag.prefix}:{tag.name}" == name
+        )
+
+    def _count_descendants(self, name: str) -> int:
+        positions = self._index._positions_by_name.get(name)  # noqa: SLF001
+        if not positions:
+            return 0
+        return bisect_right(positions, self.end_position) - bisect_right(
+            positions,
+            self.position,
+        )
+
+
+class TagFeatureIndex:
+    """
+    TagFeatureIndex holds per-tag subtree aggregates for a whole document:
+    descendant tag counts by name, text, non-empty strings, unary-tree flags,
+    first deepest tags and the effective style of every piece of text.
+
+    All of them are computed in a single traversal of the document, instead
+    of each HtmlTag helper re-walking its own subtree. This matters because
+    the processing steps query nested tags at several levels, which makes the
+    per-helper approach quadratic on deeply nested documents.
+
+    The index is built lazily on the first lookup. It has to be invalidated
+    if the underlying document is mutated afterwards. Tags that are not part
+    of the indexed document (e.g. copies, or tags created during processing)
+    are not found, and callers are expected to fall back to computing the
+    features directly.
+    """
+
+    def __init__(
+        self,
+        root: bs4.Tag,
+        *,
+        source_spans: SourceSpanIndex | None = None,
+    ) -> None:
+        self._root = root
+        self._features_by_id: dict[int, TagFeatures] | None = None
+        self._features_by_position: list[TagFeatures] = []
+        self._positions_by_name: dict[str, list[int]] = {}
+        self._text_pieces: list[str] = []
+        self._raw_strings: list[str] = []
+        self._string_lengths: list[int] = []
+        self._string_styles: list[dict[str, str] | _BrokenStyle] = []
+        self._style_cascade = StyleCascade()
+        # Source offsets describe the original source, so unlike the other
+        # features, they are kept when the index is invalidated.
+        self._source_spans = source_spans
+
+    @property
+    def style_cascade(self) -> StyleCascade:
+        """The style cascade of the indexed document, shared with its tags."""
+        return self._style_cascade
+
+    @property
+    def source(self) -> bytes | None:
+        """The source of the indexed document, if it was provided."""
+        if self._source_spans is None:
+            return None
+        return self._source_spans.source
+
+    def get_source_span(self, tag: bs4.Tag) -> tuple[int, int] | None:
+        if self._source_spans is None:
+            return None
+        return self._source_spans.get(tag)
+
+    def get(self, tag: bs4.Tag) -> TagFeatures | None:
+        if self._features_by_id is None:
+            self._build()
+        return self._features_by_id.get(id(tag))  # type: ignore[union-attr]
+
+    def invalidate(self) -> None:
+        """Discard the index. It will be rebuilt on the next lookup."""
+        self._features_by_id = None
+        self._style_cascade.clear()
+
+    def _build(self) -> None:
+        self._features_by_id = {}
+        self._features_by_position = []
+        self._positions_by_name = defaultdict(list)
+        self._text_pieces = []
+        self._raw_strings = []
+        self._string_lengths = []
+        self._string_styles = []
+
+        # Iterative depth-first traversal, as real documents can be nested
+        # deeper than the recursion limit. Tags are numbered in pre-order
+        # and their aggregates are finalized in post-order.
+        root_style = self._derive_style(self._root, None)
+        stack = [_Frame(self._enter(self._root), root_style)]
+        while stack:
+            frame = stack[-1]
+            child = next(frame.children, None)
+            if child is None:
+                stack.pop()
+                self._exit(frame)
+            elif isinstance(child, bs4.Tag):
+                frame.add_child(child)
+                child_style = self._derive_style(child, frame.style)
+                stack.append(_Frame(self._enter(child), child_style))
+            elif isinstance(child, bs4.NavigableString):
+                if type(child) in _TEXT_STRING_TYPES:
+                    self._raw_strings.append(child)
+                stripped = child.strip()
+                if not stripped:
+                    continue
+                frame.add_child(child)
+                self._string_lengths.append(len(stripped))
+                self._string_styles.append(frame.style)
+                if type(child) in _TEXT_STRING_TYPES:
+                    self._text_pieces.append(
+                        " ".join([t.strip() for t in stripped.split("\n")]),
+                    )
+
+    def _enter(self, tag: bs4.Tag) -> TagFeatures:
+        position = len(self._features_by_position)
+        features = TagFeatures(self, tag, position)
+        self._features_by_position.append(features)
+        self._features_by_id[id(tag)] = features  # type: ignore[index]
+        self._positions_by_name[tag.name].append(position)
+        if tag.prefix is not None:
+            self._positions_by_name[f"{tag.prefix}:{tag.name}"].append(position)
+        return features
+
+    def _exit(self, frame: _Frame) -> None:
+        features = frame.features
+        features.end_position = len(self._features_by_position) - 1
+        features.text_end = len(self._text_pieces)
+        features.string_end = len(self._string_lengths)
+        features.raw_string_end = len(self._raw_strings)
+
+        # Mirrors `get_first_deepest_tag`, based on the first child.
+        if not frame.has_tag_children:
+            features.first_deepest_tag = features.tag
+        elif isinstance(frame.first_child, bs4.Tag):
+            first_child = self._features_by_id[id(frame.first_child)]  # type: ignore[index]
+            features.first_deepest_tag = first_child.first_deepest_tag
+        else:
+            features.first_deepest_tag = None
+
+        # Mirrors `is_unary_tree`, based on the already finalized children.
+        if features.tag.name == "table" or frame.child_count == 0:
+            features.is_unary_tree = True
+        elif frame.child_count > 1:
+            features.is_unary_tree = False
+        elif isinstance(frame.only_child, bs4.Tag):
+            only_child = self._features_by_id[id(frame.only_child)]  # type: ignore[index]
+            features.is_unary_tree = only_child.is_unary_tree
+        else:
+            features.is_unary_tree = True
+
+    def _derive_style(
+        self,
+        tag: bs4.Tag,
+        parent_style: dict[str, str] | _BrokenStyle | None,
+    ) -> dict[str, str] | _BrokenStyle:
+        if isinstance(parent_style, _BrokenStyle):
+            return _BrokenStyle(tag)
+        try:
+            if parent_style is None:
+                return self._style_cascade.get_effective_style(tag)
+            return self._style_cascade.get_child_style(tag, parent_style)
+        except ValueError:
+            return _BrokenStyle(tag)
+
+
+class _Frame:
+    __slots__ = (
+        "features",
+        "children",
+        "style",
+        "child_count",
+        "first_child",
+        "only_child",
+        "has_tag_children",
+    )
+
+    def __init__(
+        self,
+        features: TagFeatures,
+        style: dict[str, str] | _BrokenStyle,
+    ) -> None:
+        self.features = features
+        self.children = iter(features.tag.children)
+        self.style = style
+        # Number of children that are tags or non-empty strings
+        self.child_count = 0
+        self.first_child: bs4.PageElement | None = None
+        self.only_child: bs4.PageElement | None = None
+        self.has_tag_children = False
+
+    def add_child(self, child: bs4.PageElement) -> None:
+        if self.first_child is None:
+            self.first_child = child
+        self.child_count += 1
+        self.only_child = child
+        self.has_tag_children |= isinstance(child, bs4.Tag)
@@ -9,7 +9,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from bs4 import Tag
 
 
-def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
+def compute_text_styles_metrics(
+    tag: Tag,
+    *,
+    style_cascade: StyleCascade | None = None,
+) -> dict[tuple[str, str], float]:
     """
     Compute the percentage distribution of various CSS styles within the
     text content of a given HTML tag and its descendants.
@@ -27,7 +31,12 @@ def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
 
     Each dictionary entry corresponds to a unique style, (property, value)
     and the percentage of text it affects.
+
+    The effective styles are resolved through `style_cascade`, which can be
+    shared between calls on the same document. If it's not provided, a new
+    one is used for this call only.
     """
+    style_cascade = style_cascade or StyleCascade()
     total_chars: int = 0
     style_metrics: dict[tuple[str, str], float] = defaultdict(float)
 
@@ -40,7 +49,7 @@ def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
         total_chars += char_count
         parent = text_node.find_parent()
 
-        effective_styles: dict[str, str] = _compute_effective_style(parent)
+        effective_styles: dict[str, str] = style_cascade.get_effective_style(parent)
         # pp = parent.find_parent()
         # if pp:
         #     # pp_styles : dict[str, str] = _compute_effective_style(pp)
@@ -63,7 +72,7 @@ def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
     return style_metrics
 
 
-def _compute_effective_style(tag: Tag) -> dict[str, str]:
+def compute_effective_style(tag: Tag) -> dict[str, str]:
     """
     Aggregate the effective styles for a given tag by
     traversing up the parent hierarchy.
@@ -71,20 +80,112 @@ def _compute_effective_style(tag: Tag) -> dict[str, str]:
     effective_styles: dict[str, str] = {}
     found_tag: Tag | None = tag
     while found_tag:
-        if "style" in found_tag.attrs:
-            found_styles = found_tag["style"]
-            if isinstance(found_styles, list):  # pragma: no cover
-                # this should never happen, can't even construct a
-                # scenario where this would occur
-                msg = "Expected a string, got a list"
-                raise SecParserValueError(msg)
-            styles = found_styles.split(";")
-            for style in styles:
-                if ":" in style:
-                    prop, val = style.split(":")
-                    prop = prop.strip()
-                    val = val.strip()
-                    # Only set if not previously set to respect CSS cascading rules
-                    effective_styles.setdefault(prop, val)
+        for prop, val in parse_inline_style(found_tag).items():
+            # Only set if not previously set to respect CSS cascading rules
+            effective_styles.setdefault(prop, val)
         found_tag = found_tag.find_parent()
     return effective_styles
+
+
+def parse_inline_style(tag: Tag) -> dict[str, str]:
+    """Parse the `style` attribute of a single tag, ignoring its ancestors."""
+    inline_styles: dict[str, str] = {}
+    if "style" in tag.attrs:
+        found_styles = tag["style"]
+        if isinstance(found_styles, list):  # pragma: no cover
+            # this should never happen, can't even construct a
+            # scenario where this would occur
+            msg = "Expected a string, got a list"
+            raise SecParserValueError(msg)
+        styles = found_styles.split(";")
+        for style in styles:
+            if ":" in style:
+                prop, val = style.split(":")
+                prop = prop.strip()
+                val = val.strip()
+                # The first declaration of a property wins
+                inline_styles.setdefault(prop, val)
+    return inline_styles
+
+
+class StyleCascade:
+    """
+    StyleCascade memoizes the parsed `style` attributes and the resolved
+    effective styles of the tags of a document. Each tag is parsed only
+    once, and the effective style of a tag is derived from the already
+    resolved effective style of its parent.
+
+    Entries are keyed by node identity and keep a reference to the node,
+    so that the identity can't be reused by another node while cached.
+    The cascade has to be cleared if the document is mutated afterwards.
+
+    The returned dictionaries are shared between tags and must not be
+    modified by the caller.
+    """
+
+    def __init__(self) -> None:
+        self._inline_styles: dict[int, tuple[Tag, dict[str, str]]] = {}
+        self._effective_styles: dict[int, tuple[Tag, dict[str, str]]] = {}
+
+    def get_inline_style(self, tag: Tag) -> dict[str, str]:
+        entry = self._inline_styles.get(id(tag))
+        if entry is None:
+            entry = (tag, parse_inline_style(tag))
+            self._inline_styles[id(tag)] = entry
+        return entry[1]
+
+    def get_effective_style(self, tag: Tag) -> dict[str, str]:
+        # Collect the not yet resolved ancestors iteratively, as real
+        # documents can be nested deeper than the recursion limit.
+        unresolved: list[Tag] = []
+        parent_style: dict[str, str] | None = None
+        found_tag: Tag | None = tag
+        while found_tag:
+            entry = self._effective_styles.get(id(found_tag))
+            if entry is not None:
+                parent_style = entry[1]
+                break
+            unresolved.append(found_tag)
+            found_tag = found_tag.parent
+
+        effective_styles: dict[str, str] = parent_style or {}
+        for found_tag in reversed(unresolved):
+            effective_styles = self._derive(found_tag, parent_style)
+            self._effective_styles[id(found_tag)] = (found_tag, effective_styles)
+            parent_style = effective_styles
+        return effective_styles
+
+    def get_child_style(
+        self,
+        tag: Tag,
+        parent_style: dict[str, str],
+    ) -> dict[str, str]:
+        """
+        Resolve the effective style of a tag, given the already resolved
+        effective style of its parent, without looking up its ancestors.
+        """
+        entry = self._effective_styles.get(id(tag))
+        if entry is None:
+            entry = (tag, self._derive(tag, parent_style))
+            self._effective_styles[id(tag)] = entry
+        return entry[1]
+
+    def clear(self) -> None:
+        self._inline_styles.clear()
+        self._effective_styles.clear()
+
+    def _derive(
+        self,
+        tag: Tag,
+        parent_style: dict[str, str] | None,
+    ) -> dict[str, str]:
+        inline_styles = self.get_inline_style(tag)
+        if parent_style is None:
+            return inline_styles
+        if not inline_styles:
+            return parent_style
+        effective_styles = dict(inline_styles)
+        for prop, val in parent_style.items():
+            # Only set if not previously set to respect CSS cascading rules
+            effective_styles.setdefault(prop, val)
+        return effective_styles
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import click
+import rich.traceback
+from millify import millify
+from rich.console import Console
+from rich.table import Table
+
+from tests.benchmark.compare_benchmarks import (
+    DEFAULT_MEMORY_THRESHOLD,
+    DEFAULT_MIN_TIME,
+    DEFAULT_SIGNIFICANCE_LEVEL,
+    DEFAULT_TIME_THRESHOLD,
+    Change,
+    Comparison,
+    compare_benchmarks,
+)
+from tests.benchmark.generate_filing import SyntheticFilingConfig
+from tests.benchmark.run_benchmarks import (
+    DEFAULT_REPEAT,
+    DocumentBenchmark,
+    get_default_results_path,
+    load_results,
+    run_benchmarks,
+    save_results,
+    select_reports,
+)
+from tests.benchmark.run_scaling_benchmarks import (
+    DEFAULT_MAX_EXPONENT,
+    DEFAULT_SCALES,
+    DEFAULT_SCALING_REPEAT,
+    ScalingPoint,
+    run_scaling_benchmark,
+)
+from tests.utils import DEFAULT_VALIDATION_DATA_DIR
+
+rich.traceback.install()
+
+CHANGE_STYLES = {
+    Change.REGRESSION: "bold red",
+    Change.IMPROVEMENT: "bold green",
+    Change.UNCHANGED: "dim",
+}
+
+
+@click.group()
+def cli() -> None:
+    pass
+
+
+@click.command()
+@click.option(
+    "--data_dir",
+    default=DEFAULT_VALIDATION_DATA_DIR,
+    help="Directory containing cloned repository from alphanome-ai/sec-parser-test-data.",
+)
+@click.option("--yaml_path", help="Path to YAML filter file")
+@click.option(
+    "--repeat",
+    default=DEFAULT_REPEAT,
+    help="Number of times each filing is parsed",
+)
+@click.option(
+    "--output",
+    help="Path of the JSON results. Defaults to baselines/<commit>.json",
+)
+def run(data_dir: str, yaml_path: str | None, repeat: int, output: str | None) -> None:
+    """
+    Benchmark the parser on the selected filings of the local
+    sec-parser-test-data checkout, and save the results as a JSON baseline.
+    """
+    console = Console()
+    reports = select_reports(Path(data_dir), Path(yaml_path) if yaml_path else None)
+
+    def print_document(benchmark: DocumentBenchmark) -> None:
+        console.print(
+            f"{benchmark.identifier}: "
+            f"[bold cyan]{benchmark.megabytes_per_second:.2f} MB/s[/bold cyan] "
+            f"([dim]{millify(benchmark.character_count)} characters, "
+            f"peak memory {millify(benchmark.memory['peak'])}B[/dim])",
+        )
+
+    results = run_benchmarks(reports, repeat=repeat, on_document=print_document)
+    path = Path(output) if output else get_default_results_path(results)
+    save_results(results, path)
+    console.print(f"Saved the results to {path}")
+
+
+@click.command()
+@click.argument("baseline_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("current_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--significance_level",
+    default=DEFAULT_SIGNIFICANCE_LEVEL,
+    help="Maximum p-value of a reported change in time",
+)
+@click.option(
+    "--time_threshold",
+    default=DEFAULT_TIME_THRESHOLD,
+    help="Minimum relative change in time to report, e.g. 0.1 for 10%",
+)
+@click.option(
+    "--min_time",
+    default=DEFAULT_MIN_TIME,
+    help="Minimum time to compare, in seconds",
+)
+@click.option(
+    "--memory_threshold",
+    default=DEFAULT_MEMORY_THRESHOLD,
+    help="Minimum relative change in memory to report, e.g. 0.05 for 5%",
+)
+@click.option("--show_all", is_flag=True, help="Also show the unchanged metrics")
+def compare(
+    baseline_path: str,
+    current_path: str,
+    significance_level: float,
+    time_threshold: float,
+    memory_threshold: float,
+    min_time: float,
+    show_all: bool,
+) -> None:
+    """
+    Compare two benchmark results, and fail if there are statistically
+    significant regressions.
+
+    Both results should come from the same machine, with as little else
+    running on it as possible, as the noise of a busy machine is often
+    larger than the regressions.
+    """
+    console = Console()
+    comparisons = compare_benchmarks(
+        load_results(Path(baseline_path)),
+        load_results(Path(current_path)),
+        significance_level=significance_level,
+        time_threshold=time_threshold,
+        memory_threshold=memory_threshold,
+        min_time=min_time,
+    )
+    shown_comparisons = [
+        c for c in comparisons if show_all or c.change is not Change.UNCHANGED
+    ]
+    if shown_comparisons:
+        print_comparison_table(shown_comparisons)
+    regression_count = sum(c.change is Change.REGRESSION for c in comparisons)
+    if regression_count:
+        console.print(f"[bold red]Found {regression_count} regressions.[/bold red]")
+        sys.exit(1)
+    console.print("No regressions found.")
+
+
+@click.command()
+@click.option(
+    "--form_type",
+    multiple=True,
+    default=["10-Q", "10-K"],
+    help="Form types of the synthetic filings",
+)
+@click.option(
+    "--parameter",
+    default="scale",
+    type=click.Choice(["scale", "span_depth", "div_depth"]),
+    help="Parameter of the synthetic filings that is varied",
+)
+@click.option(
+    "--values",
+    default=",".join(map(str, DEFAULT_SCALES)),
+    help="Comma-separated values of the varied parameter",
+)
+@click.option("--ix_ratio", default=0.05, help="Ratio of elements in ix: tags")
+@click.option("--table_ratio", default=0.12, help="Ratio of elements that are tables")
+@click.option("--repeat", default=DEFAULT_SCALING_REPEAT, help="Parses per filing")
+@click.option(
+    "--max_exponent",
+    default=DEFAULT_MAX_EXPONENT,
+    help="Maximum exponent k of time ~ size^k and memory ~ size^k before failing",
+)
+@click.option("--output", help="Path of the JSON results")
+def scaling(
+    form_type: list[str],
+    parameter: str,
+    values: str,
+    ix_ratio: float,
+    table_ratio: float,
+    repeat: int,
+    max_exponent: float,
+    output: str | None,
+) -> None:
+    """
+    Parse synthetic filings of growing size or nesting depth, and fail if
+    the parse time or memory grows super-linearly with the size, or with
+    the depth.
+    """
+    console = Console()
+    parameter_values = [int(value) for value in values.split(",")]
+    results = []
+    super_linear_count = 0
+    for current_form_type in form_type:
+        table = Table(
+            title=f"{current_form_type} by {parameter}",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        for column in (parameter, "Size", "Elements", "Time", "MB/s", "Peak memory"):
+            table.add_column(column, justify="right")
+
+        def add_row(point: ScalingPoint, table: Table = table) -> None:
+            megabytes_per_second = point.character_count / 1_000_000 / point.time
+            table.add_row(
+                str(getattr(point.config, parameter)),
+                millify(point.character_count, precision=1),
+                str(point.element_count),
+                f"{point.time * 1000:.0f}ms",
+                f"{megabytes_per_second:.2f}",
+                f"{millify(point.peak_memory, precision=1)}B",
+            )
+
+        result = run_scaling_benchmark(
+            SyntheticFilingConfig(
+                form_type=current_form_type,
+                ix_ratio=ix_ratio,
+                table_ratio=table_ratio,
+            ),
+            parameter,
+            parameter_values,
+            repeat=repeat,
+            on_point=add_row,
+        )
+        results.append(result)
+        console.print(table)
+        exponents = {"time": result.time_exponent, "memory": result.memory_exponent}
+        for name, exponent in exponents.items():
+            style = "bold red" if exponent > max_exponent else "bold green"
+            console.print(
+                f"{name} ~ {result.size_name}^[{style}]{exponent:.2f}[/{style}]",
+            )
+        if max(exponents.values()) > max_exponent:
+            super_linear_count += 1
+
+    if output:
+        with Path(output).open("w") as f:
+            json.dump([r.to_dict() for r in results], f, indent=4)
+    if super_linear_count:
+        console.print(
+            f"[bold red]Found super-linear scaling for {super_linear_count} "
+            "form types.[/bold red]",
+        )
+        sys.exit(1)
+
+
+def print_comparison_table(comparisons: list[Comparison]) -> None:
+    console = Console()
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Report", style="dim")
+    table.add_column("Metric")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("p-value", justify="right")
+    for comparison in comparisons:
+        style = CHANGE_STYLES[comparison.change]
+        table.add_row(
+            comparison.identifier,
+            comparison.metric,
+            _format_value(comparison.metric, comparison.baseline),
+            _format_value(comparison.metric, comparison.current),
+            f"[{style}]{(comparison.ratio - 1) * 100:+.1f}%[/{style}]",
+            "" if comparison.p_value is None else f"{comparison.p_value:.3f}",
+        )
+    console.print(table)
+
+
+def _format_value(metric: str, value: float) -> str:
+    if metric.startswith("memory:"):
+        return f"{millify(value, precision=1)}B"
+    return f"{value * 1000:.1f}ms"
+
+
+cli.add_command(run)
+cli.add_command(compare)
+cli.add_command(scaling)
+
+
+if __name__ == "__main__":
+    cli()
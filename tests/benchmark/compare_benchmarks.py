@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import math
+import statistics
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any
+
+DEFAULT_SIGNIFICANCE_LEVEL = 0.05
+DEFAULT_TIME_THRESHOLD = 0.1
+# The times below this are too short to be measured reliably, in seconds.
+DEFAULT_MIN_TIME = 0.001
+DEFAULT_MEMORY_THRESHOLD = 0.05
+
+# The exact distribution of the Mann-Whitney U statistic is computed for
+# samples up to this size, and approximated by the normal distribution above.
+_MAX_EXACT_SAMPLE_SIZE = 30
+
+
+class Change(Enum):
+    REGRESSION = "regression"
+    IMPROVEMENT = "improvement"
+    UNCHANGED = "unchanged"
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """
+    The comparison of a metric of a filing between two benchmark runs.
+
+    Times are compared by their medians, and a change is only reported if
+    it is larger than the threshold, and statistically significant by the
+    Mann-Whitney U test. As many metrics are compared at once, the p-values
+    are adjusted by the Holm-Bonferroni method, so that a change is rarely
+    reported when there is none. Memory is measured once, and is compared by
+    the threshold only.
+    """
+
+    identifier: str
+    metric: str
+    baseline: float
+    current: float
+    p_value: float | None
+    change: Change
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else math.inf
+
+
+def compare_benchmarks(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    significance_level: float = DEFAULT_SIGNIFICANCE_LEVEL,
+    time_threshold: float = DEFAULT_TIME_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> list[Comparison]:
+    """
+    Compare the results of two benchmark runs (see `run_benchmarks`), for
+    the filings and metrics that are in both of them. The times that are
+    shorter than `min_time` in both runs are not compared.
+    """
+    time_comparisons = []
+    memory_comparisons = []
+    for identifier, current_document in current["documents"].items():
+        baseline_document = baseline["documents"].get(identifier)
+        if baseline_document is None:
+            continue
+        for metric, current_samples in current_document["samples"].items():
+            baseline_samples = baseline_document["samples"].get(metric)
+            if not baseline_samples or not current_samples:
+                continue
+            baseline_median = statistics.median(baseline_samples)
+            current_median = statistics.median(current_samples)
+            if max(baseline_median, current_median) < min_time:
+                continue
+            time_comparisons.append(
+                Comparison(
+                    identifier=identifier,
+                    metric=metric,
+                    baseline=baseline_median,
+                    current=current_median,
+                    p_value=mann_whitney_u_test(baseline_samples, current_samples),
+                    change=_get_change(baseline_median, current_median, time_threshold),
+                ),
+            )
+        for metric, current_bytes in current_document["memory"].items():
+            baseline_bytes = baseline_document["memory"].get(metric)
+            if baseline_bytes is None:
+                continue
+            memory_comparisons.append(
+                Comparison(
+                    identifier=identifier,
+                    metric=f"memory:{metric}",
+                    baseline=baseline_bytes,
+                    current=current_bytes,
+                    p_value=None,
+                    change=_get_change(baseline_bytes, current_bytes, memory_threshold),
+                ),
+            )
+
+    adjusted_p_values = _adjust_p_values([c.p_value or 0.0 for c in time_comparisons])
+    time_comparisons = [
+        replace(
+            comparison,
+            p_value=p_value,
+            change=comparison.change
+            if p_value < significance_level
+            else Change.UNCHANGED,
+        )
+        for comparison, p_value in zip(time_comparisons, adjusted_p_values)
+    ]
+    return time_comparisons + memory_comparisons
+
+
+def mann_whitney_u_test(x: list[float], y: list[float]) -> float:
+    """
+    Return the two-sided p-value of the Mann-Whitney U test, i.e. of the
+    hypothesis that the samples come from the same distribution. Unlike
+    the t-test, it does not assume that the times are normally distributed,
+    and it is not thrown off by a few outliers.
+    """
+    n_x, n_y = len(x), len(y)
+    ranks = _rank([*x, *y])
+    u_x = sum(ranks[:n_x]) - n_x * (n_x + 1) / 2
+    u = min(u_x, n_x * n_y - u_x)
+    has_ties = len(set(x) | set(y)) < n_x + n_y
+    if not has_ties and max(n_x, n_y) <= _MAX_EXACT_SAMPLE_SIZE:
+        counts = _count_u_statistics(n_x, n_y)
+        p_value = 2 * sum(counts[: math.floor(u) + 1]) / math.comb(n_x + n_y, n_x)
+        return min(p_value, 1.0)
+
+    mean = n_x * n_y / 2
+    tie_counts = [ranks.count(rank) for rank in set(ranks)]
+    tie_correction = sum(t**3 - t for t in tie_counts) / (
+        (n_x + n_y) * (n_x + n_y - 1)
+    )
+    variance = n_x * n_y / 12 * (n_x + n_y + 1 - tie_correction)
+    if variance == 0:
+        return 1.0
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return min(math.erfc(max(z, 0) / math.sqrt(2)), 1.0)
+
+
+def _adjust_p_values(p_values: list[float]) -> list[float]:
+    """Adjust the p-values for multiple comparisons by the Holm-Bonferroni method."""
+    adjusted = [0.0] * len(p_values)
+    max_adjusted = 0.0
+    order = sorted(range(len(p_values)), key=p_values.__getitem__)
+    for rank, i in enumerate(order):
+        max_adjusted = max(max_adjusted, min((len(p_values) - rank) * p_values[i], 1.0))
+        adjusted[i] = max_adjusted
+    return adjusted
+
+
+def _rank(values: list[float]) -> list[float]:
+    """Rank the values from 1, giving tied values the mean of their ranks."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for i in order[start : end + 1]:
+            ranks[i] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def _count_u_statistics(n_x: int, n_y: int) -> list[int]:
+    """
+    Count the orderings of the two samples by their U statistic, which is the
+    number of pairs in which the value from the first sample is the larger.
+    """
+    # The largest value is either from the first sample, and larger than all
+    # of the values from the second one, or it is from the second sample.
+    size = n_x * n_y + 1
+    previous_row = [[1] + [0] * (size - 1) for _ in range(n_y + 1)]
+    for _ in range(n_x):
+        row: list[list[int]] = []
+        for j in range(n_y + 1):
+            counts = [0] * j + previous_row[j][: size - j]
+            if j:
+                counts = [a + b for a, b in zip(counts, row[j - 1])]
+            row.append(counts)
+        previous_row = row
+    return previous_row[n_y]
+
+
+def _get_change(baseline: float, current: float, threshold: float) -> Change:
+    if current > baseline * (1 + threshold):
+        return Change.REGRESSION
+    if current < baseline * (1 - threshold):
+        return Change.IMPROVEMENT
+    return Change.UNCHANGED
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+WORDS = (
+    "the company revenue net income increase decrease risk market our products "
+    "customers may could adversely affect results operations financial condition "
+    "supply chain competition regulatory changes"
+).split()
+
+# The parts of each form type, with their items and the relative number of
+# elements in each item.
+SECTIONS_BY_FORM_TYPE: dict[str, list[tuple[str, list[tuple[str, int]]]]] = {
+    "10-Q": [
+        ("I", [("1", 20), ("2", 12), ("3", 2), ("4", 2)]),
+        ("II", [("1", 1), ("1A", 8), ("2", 1), ("3", 1), ("5", 1), ("6", 1)]),
+    ],
+    "10-K": [
+        ("I", [("1", 6), ("1A", 14), ("1B", 1), ("2", 1), ("3", 1), ("4", 1)]),
+        ("II", [("5", 2), ("7", 14), ("7A", 2), ("8", 24), ("9", 1), ("9A", 2)]),
+        ("III", [("10", 1), ("11", 1), ("12", 1), ("13", 1), ("14", 1)]),
+        ("IV", [("15", 3), ("16", 1)]),
+    ],
+}
+
+
+@dataclass(frozen=True)
+class SyntheticFilingConfig:
+    """
+    The shape of a synthetic filing, see `generate_filing`.
+
+    - `scale`: the multiplier of the number of elements of each section in
+      `SECTIONS_BY_FORM_TYPE`. At 1, a 10-Q is about 65 KB, and at 16, it is
+      about the size of a large real 10-Q.
+    - `elements_per_page`: the number of elements between page breaks, each
+      with a page number and a page header.
+    - `table_ratio`, `ix_ratio` and `heading_ratio`: the ratios of elements
+      that are tables, that are wrapped in inline XBRL tags and that are
+      bold headings.
+    - `span_depth`: the number of nested spans around the text of each
+      paragraph.
+    - `div_depth`: the number of nested divs around the whole document.
+    """
+
+    form_type: str = "10-Q"
+    scale: int = 1
+    elements_per_page: int = 9
+    table_ratio: float = 0.12
+    ix_ratio: float = 0.05
+    heading_ratio: float = 0.1
+    span_depth: int = 1
+    div_depth: int = 1
+    seed: int = 0
+
+
+def generate_filing(config: SyntheticFilingConfig) -> str:
+    """
+    Generate the HTML of a 10-Q or 10-K shaped filing, with a cover page,
+    the top sections of the form type, and paragraphs, tables, headings and
+    page breaks in between. The same config always generates the same HTML.
+    """
+    return _FilingGenerator(config).generate()
+
+
+class _FilingGenerator:
+    def __init__(self, config: SyntheticFilingConfig) -> None:
+        if config.form_type not in SECTIONS_BY_FORM_TYPE:
+            supported = ", ".join(SECTIONS_BY_FORM_TYPE)
+            msg = f"Unsupported form type: {config.form_type!r}. Supported: {supported}"
+            raise ValueError(msg)
+        self._config = config
+        self._random = random.Random(config.seed)
+        self._parts: list[str] = []
+        self._page_number = 0
+        self._elements_on_page = 0
+
+    def generate(self) -> str:
+        config = self._config
+        self._parts.append("<html><body>")
+        self._parts.append("<div>" * config.div_depth)
+        self._parts.append(
+            '<div style="display:none"><ix:header><ix:hidden>'
+            '<ix:nonNumeric name="dei:DocumentType" contextRef="c-1">'
+            f"{config.form_type}</ix:nonNumeric>"
+            "</ix:hidden></ix:header></div>",
+        )
+        self._add_element(
+            '<div style="text-align:center"><span style="font-weight:bold">'
+            "UNITED STATES SECURITIES AND EXCHANGE COMMISSION</span></div>",
+        )
+        self._add_element(
+            '<div style="text-align:center"><span style="font-weight:bold">'
+            f"FORM {config.form_type}</span></div>",
+        )
+        for part, items in SECTIONS_BY_FORM_TYPE[config.form_type]:
+            self._add_element(self._bold(f"PART {part}"))
+            for item, size in items:
+                self._add_element(self._bold(f"Item {item}. Section Title {item}"))
+                for _ in range(size * config.scale):
+                    self._add_element(self._create_element(item))
+        self._parts.append("</div>" * config.div_depth)
+        self._parts.append("</body></html>")
+        return "\n".join(self._parts)
+
+    def _add_element(self, html: str) -> None:
+        if self._random.random() < self._config.ix_ratio:
+            html = (
+                '<ix:nonNumeric name="us-gaap:TextBlock" contextRef="c-1">'
+                f"{html}</ix:nonNumeric>"
+            )
+        self._parts.append(html)
+        self._elements_on_page += 1
+        if self._elements_on_page >= self._config.elements_per_page:
+            self._add_page_break()
+
+    def _add_page_break(self) -> None:
+        self._page_number += 1
+        self._elements_on_page = 0
+        self._parts.append(
+            '<div style="text-align:center">'
+            f"<span>{self._page_number}</span></div>",
+        )
+        self._parts.append('<hr style="page-break-after:always"/>')
+        self._parts.append(
+            '<div><span style="font-size:8pt">'
+            f"ACME Corp | Form {self._config.form_type}</span></div>",
+        )
+
+    def _create_element(self, item: str) -> str:
+        config = self._config
+        value = self._random.random()
+        if value < config.heading_ratio:
+            return self._bold(
+                f"{self._random.choice(WORDS).capitalize()} "
+                f"{self._random.randint(1, 10**6)}",
+                italic=True,
+            )
+        # The financial statements are mostly tables.
+        table_ratio = max(config.table_ratio, 0.35) if item == "8" else config.table_ratio
+        if value < config.heading_ratio + table_ratio:
+            return self._create_table()
+        return self._create_paragraph()
+
+    def _create_paragraph(self) -> str:
+        words = self._random.choices(WORDS, k=self._random.randint(40, 220))
+        text = " ".join(words)
+        depth = self._config.span_depth
+        spans = '<span style="font-size:10pt">' * depth
+        return f'<div style="margin-top:6pt">{spans}{text}.{"</span>" * depth}</div>'
+
+    def _create_table(self) -> str:
+        rows = "".join(
+            f"<tr><td><span>Line {i} {self._random.choice(WORDS)}</span></td>"
+            f"<td>$</td>"
+            f'<td style="text-align:right">{self._random.randint(1, 999_999):,}</td>'
+            f"<td>$</td>"
+            f'<td style="text-align:right">({self._random.randint(1, 999_999):,})</td>'
+            "</tr>"
+            for i in range(self._random.randint(5, 25))
+        )
+        return (
+            '<div><table><tr><td></td><td colspan="2">2023</td>'
+            f'<td colspan="2">2022</td></tr>{rows}</table></div>'
+        )
+
+    @staticmethod
+    def _bold(text: str, *, italic: bool = False) -> str:
+        style = "font-weight:700;font-style:italic" if italic else "font-weight:700"
+        return f'<div><span style="{style}">{text}</span></div>'
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+import warnings
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from sec_parser import ParsingInstrumentation
+from sec_parser.processing_engine.auto_parser import get_parser_cls
+from sec_parser.processing_engine.html_tag_parser import HtmlTagParser
+from tests.utils import load_yaml_filter, traverse_repository_for_filings
+
+if TYPE_CHECKING:
+    from sec_parser.processing_engine.core import AbstractSemanticElementParser
+    from sec_parser.processing_engine.html_tag import HtmlTag
+    from tests.types import Report
+
+DEFAULT_YAML_FILTER_PATH = Path(__file__).parent / "selected-filings.yaml"
+DEFAULT_BASELINES_DIR = Path(__file__).parent / "baselines"
+DEFAULT_REPEAT = 10
+
+# The HtmlTag methods that are benchmarked on each top level tag. Every
+# repetition parses the tags anew, so that the cached methods are computed,
+# rather than looked up.
+HTML_TAG_METHODS: dict[str, Callable[[HtmlTag], object]] = {
+    "text": lambda tag: tag.text,
+    "html_hash": lambda tag: tag.html_hash,
+    "contains_tag": lambda tag: tag.contains_tag("table", include_self=True),
+    "count_tags": lambda tag: tag.count_tags("b"),
+    "is_unary_tree": lambda tag: tag.is_unary_tree(),
+    "get_text_styles_metrics": lambda tag: tag.get_text_styles_metrics(),
+    "get_approx_table_metrics": lambda tag: tag.get_approx_table_metrics(),
+}
+
+
+@dataclass
+class DocumentBenchmark:
+    """
+    The benchmark results of a single filing.
+
+    - `samples`: the measured times, in seconds, with one sample for each
+      repetition, by the name of the metric: "document" for the whole
+      document, "html_parsing" for parsing the HTML into tags, "step:<name>"
+      for each processing step and "html_tag:<name>" for each HtmlTag method,
+      summed over all of the top level tags.
+    - `memory`: the peak and the retained memory of parsing the document,
+      in bytes, as traced by tracemalloc.
+    """
+
+    identifier: str
+    document_type: str
+    character_count: int
+    byte_count: int
+    element_count: int
+    samples: dict[str, list[float]] = field(default_factory=dict)
+    memory: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def megabytes_per_second(self) -> float:
+        times = sorted(self.samples["document"])
+        return self.byte_count / 1_000_000 / times[len(times) // 2]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "identifier": self.identifier,
+            "document_type": self.document_type,
+            "character_count": self.character_count,
+            "byte_count": self.byte_count,
+            "element_count": self.element_count,
+            "megabytes_per_second": self.megabytes_per_second,
+            "samples": self.samples,
+            "memory": self.memory,
+        }
+
+
+def benchmark_document(
+    report: Report,
+    *,
+    repeat: int = DEFAULT_REPEAT,
+) -> DocumentBenchmark:
+    html = report.primary_doc_html_path.read_text()
+    parser_cls = get_parser_cls(report.document_type)
+    benchmark = DocumentBenchmark(
+        identifier=report.identifier,
+        document_type=report.document_type,
+        character_count=len(html),
+        byte_count=len(html.encode()),
+        element_count=0,
+    )
+    samples: defaultdict[str, list[float]] = defaultdict(list)
+
+    # The first run warms up the caches of the interpreter and the imports,
+    # and is not measured. The whole document is timed without the
+    # instrumentation, whose bookkeeping is not part of the step times.
+    parser = parser_cls()
+    parser.parse(html)
+    instrumentation = ParsingInstrumentation()
+    instrumented_parser = parser_cls(instrumentation=instrumentation)
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        elements = parser.parse(html)
+        samples["document"].append(time.perf_counter() - start_time)
+        instrumented_parser.parse(html)
+        document_report = instrumentation.last_report
+        if document_report is None:  # pragma: no cover
+            msg = "The parser did not report the parsed document."
+            raise RuntimeError(msg)
+        samples["html_parsing"].append(document_report.html_parsing_time or 0.0)
+        step_times: defaultdict[str, float] = defaultdict(float)
+        for step_report in document_report.steps:
+            step_times[step_report.name] += step_report.wall_time
+        for name, wall_time in step_times.items():
+            samples[f"step:{name}"].append(wall_time)
+    benchmark.element_count = len(elements)
+
+    for _ in range(repeat):
+        for name, method_time in _benchmark_html_tag_methods(html).items():
+            samples[f"html_tag:{name}"].append(method_time)
+
+    benchmark.samples = dict(samples)
+    benchmark.memory = _measure_memory(parser_cls, html)
+    return benchmark
+
+
+def _benchmark_html_tag_methods(html: str) -> dict[str, float]:
+    tags = HtmlTagParser().parse(html)
+    times = {}
+    # As in `timeit`, the garbage collector is disabled while timing, as its
+    # pauses would otherwise dominate the short times of the methods.
+    gc.collect()
+    gc.disable()
+    try:
+        for name, method in HTML_TAG_METHODS.items():
+            start_time = time.perf_counter()
+            for tag in tags:
+                method(tag)
+            times[name] = time.perf_counter() - start_time
+    finally:
+        gc.enable()
+    return times
+
+
+def _measure_memory(
+    parser_cls: type[AbstractSemanticElementParser],
+    html: str,
+) -> dict[str, int]:
+    """
+    Measure the peak memory of parsing the document, and the memory that is
+    retained by the parsed elements, in bytes.
+    """
+    parser = parser_cls()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start_size, _ = tracemalloc.get_traced_memory()
+        elements = parser.parse(html)
+        end_size, peak_size = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del elements
+    return {"peak": peak_size - start_size, "retained": end_size - start_size}
+
+
+def select_reports(
+    data_dir: Path,
+    yaml_path: Path | None = None,
+) -> list[Report]:
+    filters = load_yaml_filter(yaml_path or DEFAULT_YAML_FILTER_PATH)
+    document_types = set(filters.get("document_types", []))
+    company_names = set(filters.get("company_names", []))
+    accession_numbers = set(filters.get("accession_numbers", []))
+    reports = [
+        report
+        for report in traverse_repository_for_filings(data_dir)
+        if report.document_type in document_types
+        or report.company_name in company_names
+        or report.accession_number in accession_numbers
+    ]
+    if not reports:
+        msg = f"No filings in {data_dir} match the filters in {yaml_path}."
+        raise FileNotFoundError(msg)
+    return sorted(reports, key=lambda r: r.identifier)
+
+
+def run_benchmarks(
+    reports: list[Report],
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    on_document: Callable[[DocumentBenchmark], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Benchmark the filings, and return the results as JSON-serializable data,
+    which can be saved as a baseline and compared with `compare_benchmarks`.
+    """
+    documents = {}
+    for report in reports:
+        # The warnings about the filings are shown by the snapshot tests,
+        # and are only noise here.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            benchmark = benchmark_document(report, repeat=repeat)
+        documents[benchmark.identifier] = benchmark.to_dict()
+        if on_document is not None:
+            on_document(benchmark)
+    return {
+        "metadata": {
+            "commit": _get_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "documents": documents,
+    }
+
+
+def save_results(results: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    with path.open("r") as f:
+        return json.load(f)
+
+
+def get_default_results_path(results: dict[str, Any]) -> Path:
+    commit = results["metadata"]["commit"] or "unknown"
+    return DEFAULT_BASELINES_DIR / f"{commit}.json"
+
+
+def _get_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S603, S607
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import dataclasses
+import math
+import statistics
+import time
+import tracemalloc
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from sec_parser.processing_engine.auto_parser import get_parser_cls
+from tests.benchmark.generate_filing import SyntheticFilingConfig, generate_filing
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_SCALES = (1, 2, 4, 8, 16)
+DEFAULT_SCALING_REPEAT = 3
+
+# The parse time and memory should grow at most linearly with the size of
+# the filing, or with its nesting depth. An exponent above this is reported
+# as super-linear, with some margin for the noise of the measurements.
+DEFAULT_MAX_EXPONENT = 1.2
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    """The median parse time and the peak memory of a synthetic filing."""
+
+    config: SyntheticFilingConfig
+    character_count: int
+    element_count: int
+    time: float
+    peak_memory: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "config": dataclasses.asdict(self.config),
+            "character_count": self.character_count,
+            "element_count": self.element_count,
+            "time": self.time,
+            "peak_memory": self.peak_memory,
+        }
+
+
+@dataclass(frozen=True)
+class ScalingResult:
+    """
+    The scaling of the parser of a form type, with the exponents `k` of the
+    fitted `time ~ size^k` and `memory ~ size^k`. An exponent of 1 is linear.
+
+    The size is the number of characters of the filing when it is scaled.
+    When its nesting depth is varied instead, the number of characters
+    barely changes, so the size is the depth itself, i.e. the value of the
+    varied parameter. `size_name` tells which one it is.
+    """
+
+    form_type: str
+    parameter: str
+    size_name: str
+    points: tuple[ScalingPoint, ...]
+    time_exponent: float
+    memory_exponent: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "form_type": self.form_type,
+            "parameter": self.parameter,
+            "size_name": self.size_name,
+            "points": [point.to_dict() for point in self.points],
+            "time_exponent": self.time_exponent,
+            "memory_exponent": self.memory_exponent,
+        }
+
+
+def run_scaling_benchmark(
+    base_config: SyntheticFilingConfig,
+    parameter: str,
+    values: Iterable[int],
+    *,
+    repeat: int = DEFAULT_SCALING_REPEAT,
+    on_point: Callable[[ScalingPoint], None] | None = None,
+) -> ScalingResult:
+    """
+    Parse synthetic filings that differ by a single parameter of the config,
+    such as "scale" or "span_depth", and fit the exponents of the parse time
+    and memory against the size of the filings (see `ScalingResult`).
+    """
+    parser_cls = get_parser_cls(base_config.form_type)
+    points = []
+    for value in values:
+        config = dataclasses.replace(base_config, **{parameter: value})
+        html = generate_filing(config)
+        times = []
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                elements = parser_cls().parse(html)
+                times.append(time.perf_counter() - start_time)
+            tracemalloc.start()
+            try:
+                parser_cls().parse(html)
+                _, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        point = ScalingPoint(
+            config=config,
+            character_count=len(html),
+            element_count=len(elements),
+            time=statistics.median(times),
+            peak_memory=peak_memory,
+        )
+        points.append(point)
+        if on_point is not None:
+            on_point(point)
+
+    if parameter == "scale":
+        size_name = "characters"
+        sizes = [point.character_count for point in points]
+    else:
+        size_name = parameter
+        sizes = [getattr(point.config, parameter) for point in points]
+    return ScalingResult(
+        form_type=base_config.form_type,
+        parameter=parameter,
+        size_name=size_name,
+        points=tuple(points),
+        time_exponent=fit_exponent(sizes, [point.time for point in points]),
+        memory_exponent=fit_exponent(sizes, [point.peak_memory for point in points]),
+    )
+
+
+def fit_exponent(sizes: list[int], values: list[float]) -> float:
+    """Fit `value ~ size^k` by least squares on the logarithms, and return `k`."""
+    if len(set(sizes)) < 2:
+        msg = "At least two different sizes are needed to fit the exponent."
+        raise ValueError(msg)
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in values]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
@@ -0,0 +1,137 @@
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine import auto_parser
+from sec_parser.processing_engine.auto_parser import (
+    AutoParser,
+    detect_form_type,
+    register_parser,
+)
+from sec_parser.processing_engine.core import Edgar10KParser, Edgar10QParser
+
+BODY = """
+<div><span style="font-weight:bold">Part I</span></div>
+<div><span style="font-weight:bold">Item 1. Business</span></div>
+<p>Some text.</p>
+"""
+
+
+@pytest.mark.parametrize(
+    ("name", "html", "expected"),
+    values := [
+        (
+            "xbrl_fact",
+            """
+            <div style="display:none"><ix:header><ix:hidden>
+            <ix:nonNumeric name="dei:DocumentType" contextRef="c-1">10-K</ix:nonNumeric>
+            </ix:hidden></ix:header></div>
+            <p>FORM 10-Q</p>
+            """,
+            "10-K",
+        ),
+        (
+            "xbrl_fact_of_amendment",
+            '<ix:nonnumeric name="dei:DocumentType"><span>10-Q/A</span></ix:nonnumeric>',
+            "10-Q",
+        ),
+        (
+            "cover_page",
+            "<p>UNITED STATES</p><p><b>FORM</b>&nbsp;<b>10&#8209;Q</b></p>",
+            "10-Q",
+        ),
+        (
+            "cover_page_split_across_inline_tags",
+            "<p><b>FORM 10-</b><b>Q</b></p><p>FORM 10-<span>K</span></p>",
+            "10-Q",
+        ),
+        (
+            "cover_page_split_across_blocks",
+            "<div>FORM</div><div>10-K</div>",
+            "10-K",
+        ),
+        (
+            "cover_page_of_amendment",
+            "<p>Form 10-K/A</p><p>Amendment No. 1</p>",
+            "10-K",
+        ),
+        (
+            "first_form_on_cover_page",
+            "<p>FORM 10-Q</p><p>See our annual report on Form 10-K.</p>",
+            "10-Q",
+        ),
+        (
+            "unregistered_form_type",
+            "<p>FORM 10-KSB</p><p>FORM 8-K</p>",
+            None,
+        ),
+        (
+            "no_form_type",
+            "<p>Some text.</p>",
+            None,
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_detect_form_type(name, html, expected):
+    # Act
+    actual = detect_form_type(html)
+
+    # Assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "form_type", "parser_cls"),
+    values := [
+        ("10-Q", "10-Q", Edgar10QParser),
+        ("10-K", "10-K", Edgar10KParser),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_auto_parser(name, form_type, parser_cls):
+    # Arrange
+    html = f"<p>FORM {form_type}</p>{BODY}"
+    expected = [type(e).__name__ for e in parser_cls().parse(html)]
+    parser = AutoParser()
+
+    # Act
+    first = parser.parse(html)
+    second = parser.parse(html.encode())
+
+    # Assert
+    assert [type(e).__name__ for e in first] == expected
+    assert [type(e).__name__ for e in second] == expected
+    assert type(parser.get_parser(form_type)) is parser_cls
+    assert parser.get_parser(form_type) is parser.get_parser(form_type.lower())
+
+
+def test_auto_parser_with_default_form_type():
+    # Arrange
+    parser = AutoParser(default_form_type="10-K")
+
+    # Act
+    form_type = parser.get_form_type(BODY)
+
+    # Assert
+    assert form_type == "10-K"
+
+
+def test_auto_parser_without_form_type():
+    # Arrange
+    parser = AutoParser()
+
+    # Act & Assert
+    with pytest.raises(SecParserValueError, match="Could not detect"):
+        parser.parse(BODY)
+
+
+def test_register_parser(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(auto_parser, "PARSERS_BY_FORM_TYPE", {})
+
+    # Act
+    register_parser("8-k", Edgar10QParser)
+
+    # Assert
+    assert detect_form_type("<p>FORM 8-K</p>") == "8-K"
+    assert type(AutoParser().get_parser("8-K")) is Edgar10QParser
@@ -0,0 +1,158 @@
+import os
+
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine import auto_parser
+from sec_parser.processing_engine.batch import (
+    _Document,
+    _split_into_chunks,
+    parse_many,
+)
+from sec_parser.processing_engine.core import Edgar10KParser, Edgar10QParser
+from sec_parser.processing_engine.parse_cache import ParseCache
+
+HTML = b"""
+<p><b>Overview</b></p>
+<p>Some text.</p>
+"""
+
+
+class CrashingParser(Edgar10QParser):
+    """Kills the worker process on documents that contain "crash"."""
+
+    def parse_detached(self, html, **kwargs):
+        if b"crash" in html:
+            os._exit(1)
+        return super().parse_detached(html, **kwargs)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_parse_many(tmp_path, workers):
+    # Arrange
+    path = tmp_path / "document.html"
+    path.write_bytes(HTML)
+    expected = Edgar10QParser().parse_detached(HTML)
+
+    # Act
+    results = sorted(parse_many([path, HTML], workers=workers), key=lambda r: r.index)
+
+    # Assert
+    assert [r.index for r in results] == [0, 1]
+    assert [r.source for r in results] == [str(path), None]
+    for result in results:
+        assert result.ok
+        assert list(result.elements) == expected
+        assert result.elements[-1].text == "Some text."
+
+
+def test_parse_many_with_parse_cache(tmp_path):
+    # Arrange
+    cache = ParseCache(tmp_path)
+
+    # Act
+    results = list(parse_many([HTML, HTML], workers=2, parse_cache=cache))
+
+    # Assert
+    assert all(r.ok for r in results)
+    assert cache.size > 0
+
+
+def test_parse_many_isolates_failures(tmp_path):
+    # Arrange
+    missing_path = tmp_path / "missing.html"
+
+    # Act
+    results = sorted(
+        parse_many([missing_path, HTML], workers=0),
+        key=lambda r: r.index,
+    )
+
+    # Assert
+    assert not results[0].ok
+    assert results[0].elements is None
+    assert "FileNotFoundError" in results[0].error
+    assert results[1].ok
+
+
+def test_parse_many_in_process_with_interleaved_batches():
+    # Arrange
+    html = b"<p><b>Part II</b></p><p><b>Item 7. Discussion</b></p><p>Text.</p>"
+    batch_10q = parse_many([html, html], form_type="10-Q", workers=0)
+    batch_10k = parse_many([html, html], form_type="10-K", workers=0)
+    expected_10q = [type(e).__name__ for e in Edgar10QParser().parse(html)]
+    expected_10k = [type(e).__name__ for e in Edgar10KParser().parse(html)]
+
+    # Act
+    results = [next(batch_10q), next(batch_10k), next(batch_10q), next(batch_10k)]
+
+    # Assert
+    assert expected_10q != expected_10k
+    assert [[e.cls_name for e in r.elements] for r in results] == [
+        expected_10q,
+        expected_10k,
+        expected_10q,
+        expected_10k,
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_isolates_worker_crashes(monkeypatch, workers):
+    # Arrange
+    monkeypatch.setitem(auto_parser.PARSERS_BY_FORM_TYPE, "CRASH", CrashingParser)
+    sources = [HTML] * 10 + [HTML + b"<p>crash</p>"] + [HTML] * 10
+
+    # Act
+    results = sorted(
+        parse_many(sources, form_type="CRASH", workers=workers),
+        key=lambda r: r.index,
+    )
+
+    # Assert
+    assert [r.index for r in results] == list(range(len(sources)))
+    assert [r.ok for r in results] == [s != sources[10] for s in sources]
+    assert "BrokenProcessPool" in results[10].error
+
+
+def test_parse_many_stops_early():
+    # Arrange
+    batch = parse_many([HTML] * 40, workers=2)
+
+    # Act
+    first = next(batch)
+    batch.close()
+
+    # Assert
+    assert first.ok
+
+
+def test_parse_many_with_unsupported_form_type():
+    # Act & Assert
+    with pytest.raises(SecParserValueError):
+        list(parse_many([HTML], form_type="8-K"))
+
+
+def test_parse_many_detects_form_types():
+    # Arrange
+    sources = [b"<p>FORM 10-Q</p>" + HTML, b"<p>FORM 10-K</p>" + HTML, HTML]
+
+    # Act
+    results = sorted(
+        parse_many(sources, form_type=None, workers=0),
+        key=lambda r: r.index,
+    )
+
+    # Assert
+    assert [r.ok for r in results] == [True, True, False]
+    assert "Could not detect the form type" in results[2].error
+
+
+def test_split_into_chunks():
+    # Arrange
+    documents = [_Document(i, b"", size) for i, size in enumerate([1, 8, 2, 5, 4])]
+
+    # Act
+    chunks = _split_into_chunks(documents, max_chunk_count=2)
+
+    # Assert
+    assert [[d.size for d in chunk] for chunk in chunks] == [[8], [5, 4], [2, 1]]
@@ -0,0 +1,90 @@
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.classification_memo import ClassificationMemo
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.processing_engine.html_tag_parser import HtmlTagParser
+from sec_parser.processing_steps.highlighted_text_classifier import (
+    HighlightedTextClassifier,
+)
+from sec_parser.semantic_elements.highlighted_text_element import (
+    HighlightedTextElement,
+)
+from sec_parser.semantic_elements.semantic_elements import TextElement
+
+HTML = """
+<p><b>Part I</b></p>
+<p><b>Item 1. Financial Statements</b></p>
+<p>Some text.</p>
+<table>
+    <tr><td>Revenue</td><td>100</td></tr>
+    <tr><td>Net income</td><td>10</td></tr>
+</table>
+<p><img src="logo.jpg"></p>
+<p>&nbsp;</p>
+"""
+
+
+def test_classification_memo():
+    # Arrange
+    memo = ClassificationMemo()
+    parser = Edgar10QParser(classification_memo=memo)
+
+    # Act
+    first = parser.parse_detached(HTML)
+    misses = memo.misses
+    second = parser.parse_detached(HTML)
+
+    # Assert
+    assert first == second == Edgar10QParser().parse_detached(HTML)
+    assert [e.text_style for e in first] == [
+        e.text_style for e in Edgar10QParser().parse_detached(HTML)
+    ]
+    assert memo.misses == misses
+    assert memo.hits > 0
+
+
+def test_classification_memo_with_style_context():
+    # Arrange
+    html = """
+    <div style="font-weight:bold"><span>Same text</span></div>
+    <div><span>Same text</span></div>
+    """
+    root_tags = HtmlTagParser().parse(html.strip())
+    elements = [TextElement(tag.get_children()[0]) for tag in root_tags]
+    step = HighlightedTextClassifier(
+        types_to_process={TextElement},
+        classification_memo=ClassificationMemo(),
+    )
+
+    # Act
+    processed_elements = step.process(elements)
+
+    # Assert
+    assert [type(e) for e in processed_elements] == [
+        HighlightedTextElement,
+        TextElement,
+    ]
+
+
+def test_classification_memo_evicts_least_recently_used():
+    # Arrange
+    tags = HtmlTagParser().parse("<p>a</p><p>b</p><p>c</p>")
+    memo = ClassificationMemo(max_entries=2)
+    memo.get_or_compute("name", tags[0], lambda: "a")
+    memo.get_or_compute("name", tags[1], lambda: "b")
+    memo.get_or_compute("name", tags[0], lambda: "unexpected")
+
+    # Act
+    memo.get_or_compute("name", tags[2], lambda: "c")
+
+    # Assert
+    assert len(memo) == 2
+    assert memo.get_or_compute("name", tags[0], lambda: "recomputed") == "a"
+    assert memo.get_or_compute("name", tags[1], lambda: "recomputed") == "recomputed"
+
+
+def test_classification_memo_with_invalid_max_entries():
+    # Act & Assert
+    with pytest.raises(SecParserValueError):
+        ClassificationMemo(max_entries=0)
@@ -0,0 +1,118 @@
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.columnar_format import (
+    ColumnarDocument,
+    dump_columnar,
+    dumps_columnar,
+)
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.semantic_elements.detached_semantic_element import (
+    DetachedSemanticElement,
+)
+from sec_parser.semantic_elements.highlighted_text_element import TextStyle
+from sec_parser.semantic_tree.tree_builder import TreeBuilder
+
+HTML = """
+<p><b>Part I</b></p>
+<p><b>Item 1. Financial Statements</b></p>
+<p>Some text.</p>
+<p><b>Item 2. Management's Discussion</b></p>
+<p>More text.</p>
+<p><b>Part II</b></p>
+<p><b>Item 1A. Risk Factors</b></p>
+<p>Risky text.</p>
+"""
+
+
+def create_element(text, **kwargs):
+    return DetachedSemanticElement(
+        cls_name="TextElement",
+        text=text,
+        html_hash="0123abcd",
+        **kwargs,
+    )
+
+
+def test_columnar_format():
+    # Arrange
+    elements = [
+        create_element(
+            "title",
+            level=1,
+            section_type="part1item1",
+            text_style=TextStyle(bold_with_font_weight=True, italic=True),
+            source_span=(10, 20),
+        ),
+        create_element(
+            "composite",
+            inner_elements=(
+                create_element("inner ‘unicode’"),
+                create_element("", inner_elements=(create_element("nested"),)),
+            ),
+        ),
+        create_element("no style", text_style=TextStyle()),
+    ]
+
+    # Act
+    document = ColumnarDocument(dumps_columnar(elements))
+
+    # Assert
+    assert len(document) == 3
+    assert document.detach() == elements
+    assert document[1].inner_elements[1].inner_elements[0].text == "nested"
+    assert document[-1].text_style == TextStyle()
+    assert document[0].to_dict() == elements[0].to_dict()
+
+
+def test_columnar_format_with_sections(tmp_path):
+    # Arrange
+    elements = Edgar10QParser().parse(HTML)
+    path = tmp_path / "document.secp"
+    dump_columnar(elements, path)
+
+    # Act
+    with ColumnarDocument.open(path) as document:
+        sections = document.sections
+        part2 = [e.text for e in document.get_section("part2")]
+        item1 = [e.text for e in document.get_section("part1item1")]
+        detached = document.detach()
+
+    # Assert
+    assert detached == [e.detach() for e in elements]
+    assert sections == ["part1", "part1item1", "part1item2", "part2", "part2item1a"]
+    assert part2 == ["Part II", "Item 1A. Risk Factors", "Risky text."]
+    assert item1 == ["Item 1. Financial Statements", "Some text."]
+
+
+def test_columnar_format_with_semantic_tree():
+    # Arrange
+    tree = TreeBuilder().build(Edgar10QParser().parse(HTML))
+
+    def get_shape(nodes):
+        return [(node.text, get_shape(node.children)) for node in nodes]
+
+    # Act
+    document = ColumnarDocument(dumps_columnar(tree))
+
+    # Assert
+    assert get_shape(document.root_nodes) == get_shape(tree)
+    assert [e.text for e in document] == [node.text for node in tree.nodes]
+
+
+@pytest.mark.parametrize(
+    ("name", "data"),
+    values := [
+        ("empty", b""),
+        ("invalid_magic", b"NOTCOLUMNAR" + bytes(16)),
+        (
+            "unsupported_version",
+            b"SECPCOL\0" + (999).to_bytes(4, "little") + bytes(8),
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_columnar_format_with_invalid_data(name, data):
+    # Act & Assert
+    with pytest.raises(SecParserValueError):
+        ColumnarDocument(data)
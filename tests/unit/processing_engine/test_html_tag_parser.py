@@ -1,6 +1,6 @@
 import pytest
 
-from sec_parser.processing_engine import HtmlTagParser
+from sec_parser.processing_engine import HtmlTagParser, LxmlHtmlTagParser
 
 from sec_parser.exceptions import SecParserValueError
 
@@ -20,3 +20,43 @@ def test_parse_no_html(html_string):
     # Act and Assert
     with pytest.raises(SecParserValueError):
         parser.parse(html_string)
+
+
+@pytest.mark.parametrize("track_source_spans", [True, False])
+def test_parse_source_spans(track_source_spans):
+    # Arrange
+    html = b"<div><p>a</p><p>b</p></div>"
+    parser = HtmlTagParser(track_source_spans=track_source_spans)
+
+    # Act
+    tags = parser.parse(html)
+
+    # Assert
+    if track_source_spans:
+        assert [tag.source_span for tag in tags] == [(5, 13), (13, 21)]
+        assert [bytes(tag.get_source_slice()) for tag in tags] == [
+            b"<p>a</p>",
+            b"<p>b</p>",
+        ]
+    else:
+        assert [tag.source_span for tag in tags] == [None, None]
+        assert [tag.get_source_slice() for tag in tags] == [None, None]
+
+
+def test_lxml_html_tag_parser():
+    # Arrange
+    html = """
+    <div><p>a</p><ix:nonNumeric><p class="x  y">b</p></ix:nonNumeric></div>
+    """
+
+    # Act
+    expected = HtmlTagParser().parse(html)
+    actual = LxmlHtmlTagParser().parse(html)
+
+    # Assert
+    assert [tag.get_source_code() for tag in actual] == [
+        tag.get_source_code() for tag in expected
+    ]
+    assert [tag.source_span for tag in actual] == [
+        tag.source_span for tag in expected
+    ]
@@ -0,0 +1,160 @@
+import json
+
+import pytest
+
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.processing_engine.html_tag_parser import HtmlTagParser
+from sec_parser.processing_engine.instrumentation import (
+    DocumentReport,
+    ParsingInstrumentation,
+)
+from sec_parser.processing_engine.types import ParsingOptions
+from sec_parser.processing_steps.image_classifier import ImageClassifier
+from sec_parser.processing_steps.page_number_classifier import PageNumberClassifier
+from sec_parser.processing_steps.text_classifier import TextClassifier
+from sec_parser.semantic_elements.semantic_elements import TextElement
+
+HTML = """
+<p><b>Part I</b></p>
+<p><b>Item 1. Financial Statements</b></p>
+<p>Some text.</p>
+<p>More text.</p>
+"""
+
+
+def test_parsing_instrumentation():
+    # Arrange
+    reports = []
+    instrumentation = ParsingInstrumentation(callbacks=[reports.append])
+    parser = Edgar10QParser(instrumentation=instrumentation)
+
+    # Act
+    elements = parser.parse(HTML)
+
+    # Assert
+    report = instrumentation.last_report
+    assert reports == [report]
+    assert report.parser == "Edgar10QParser"
+    assert report.source_length == len(HTML)
+    assert report.element_count == len(elements)
+    assert 0 <= report.html_parsing_time <= report.wall_time
+    assert sum(s.wall_time for s in report.steps) <= report.wall_time
+    assert all(s.elements_seen >= s.elements_processed for s in report.steps)
+    steps = {s.name: s for s in report.steps}
+    assert "TextClassifier" in steps
+    text_classifier = steps["TextClassifier"]
+    assert text_classifier.type_transitions[
+        ("NotYetClassifiedElement", "TextElement")
+    ] == sum(type(e).__name__ == "TextElement" for e in elements)
+    cache_accesses = [
+        name
+        for s in report.steps
+        for name in [*s.cache_hits, *s.cache_misses]
+    ]
+    assert "text" in cache_accesses
+    json.dumps(report.to_dict())
+
+
+def test_parsing_instrumentation_of_a_single_step():
+    # Arrange
+    instrumentation = ParsingInstrumentation()
+    parser = Edgar10QParser(
+        get_steps=lambda: [TextClassifier()],
+        instrumentation=instrumentation,
+    )
+    tags = HtmlTagParser().parse(HTML)
+
+    # Act
+    elements = parser.parse_from_tags(tags)
+
+    # Assert
+    report = instrumentation.last_report
+    assert report.html_parsing_time is None
+    assert report.source_length is None
+    [step] = report.steps
+    assert step.name == "TextClassifier"
+    assert step.elements_seen == len(tags)
+    assert step.elements_processed == len(tags)
+    assert step.type_transitions == {
+        ("NotYetClassifiedElement", "TextElement"): len(elements),
+    }
+
+
+def test_parsing_instrumentation_counts_the_visited_elements():
+    # Arrange
+    instrumentation = ParsingInstrumentation()
+    parser = Edgar10QParser(
+        get_steps=lambda: [
+            TextClassifier(),
+            ImageClassifier(types_to_process={TextElement}),
+            PageNumberClassifier(),
+        ],
+        parsing_options=ParsingOptions(fuse_elementwise_steps=True),
+        instrumentation=instrumentation,
+    )
+    tags = HtmlTagParser().parse(HTML)
+
+    # Act
+    parser.parse_from_tags(tags)
+
+    # Assert
+    fused_step, two_pass_step = instrumentation.last_report.steps
+    assert fused_step.name == "TextClassifier+ImageClassifier"
+    assert fused_step.elements_seen == len(tags)
+    assert fused_step.elements_processed == len(tags)
+    assert two_pass_step.name == "PageNumberClassifier"
+    assert two_pass_step.elements_seen == 2 * len(tags)
+    assert two_pass_step.elements_processed == 2 * len(tags)
+
+
+def test_parsing_instrumentation_reports_each_document_once():
+    # Arrange
+    reports = []
+    instrumentation = ParsingInstrumentation(callbacks=[reports.append])
+    parser = Edgar10QParser(instrumentation=instrumentation)
+
+    # Act
+    parser.parse(HTML, sections=["part1item1"])
+    parser.parse(HTML)
+
+    # Assert
+    assert len(reports) == 2
+    assert all(isinstance(r, DocumentReport) for r in reports)
+    assert instrumentation.get_recorder() is None
+
+
+def test_parsing_instrumentation_with_failing_callback():
+    # Arrange
+    reports = []
+
+    def failing_callback(report):
+        raise RuntimeError
+
+    instrumentation = ParsingInstrumentation(callbacks=[failing_callback])
+    instrumentation.add_callback(reports.append)
+    parser = Edgar10QParser(instrumentation=instrumentation)
+
+    # Act
+    elements = parser.parse(HTML)
+
+    # Assert
+    assert elements
+    assert reports == [instrumentation.last_report]
+
+
+def test_parsing_instrumentation_is_not_reported_on_error():
+    # Arrange
+    reports = []
+    instrumentation = ParsingInstrumentation(callbacks=[reports.append])
+
+    def get_steps():
+        msg = "Invalid steps"
+        raise ValueError(msg)
+
+    parser = Edgar10QParser(get_steps=get_steps, instrumentation=instrumentation)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid steps"):
+        parser.parse(HTML)
+    assert reports == []
+    assert instrumentation.get_recorder() is None
@@ -0,0 +1,249 @@
+import os
+
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.core import Edgar10KParser, Edgar10QParser
+from sec_parser.processing_engine.html_tag_parser import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+)
+from sec_parser.processing_engine.parse_cache import (
+    ParseCache,
+    _deserialize,
+    _serialize,
+)
+from sec_parser.processing_steps.table_classifier import TableClassifier
+from sec_parser.processing_steps.text_classifier import TextClassifier
+from sec_parser.semantic_elements.detached_semantic_element import (
+    DetachedSemanticElement,
+)
+from sec_parser.semantic_elements.highlighted_text_element import TextStyle
+from sec_parser.semantic_elements.semantic_elements import NotYetClassifiedElement
+
+HTML = """
+<p><b>Part I</b></p>
+<p><b>Item 1. Financial Statements</b></p>
+<p>Some text.</p>
+"""
+
+
+def create_element(text, **kwargs):
+    return DetachedSemanticElement(
+        cls_name="TextElement",
+        text=text,
+        html_hash=f"hash-{text}",
+        **kwargs,
+    )
+
+
+def test_parse_cache(tmp_path):
+    # Arrange
+    cache = ParseCache(tmp_path)
+    parser = Edgar10QParser(parse_cache=cache)
+
+    # Act
+    first = parser.parse_detached(HTML)
+    second = parser.parse_detached(HTML.encode())
+    third = Edgar10QParser(parse_cache=ParseCache(tmp_path)).parse_detached(HTML)
+
+    # Assert
+    assert first == second == third
+    assert first == Edgar10QParser().parse_detached(HTML)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.size > 0
+
+
+@pytest.mark.parametrize(
+    ("name", "parser_cls", "kwargs", "namespace"),
+    values := [
+        ("other_parser", Edgar10KParser, {}, ""),
+        ("other_arguments", Edgar10QParser, {"unwrap_elements": False}, ""),
+        ("other_sections", Edgar10QParser, {"sections": ["part1item1"]}, ""),
+        ("other_namespace", Edgar10QParser, {}, "custom-steps"),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_parse_cache_key(tmp_path, name, parser_cls, kwargs, namespace):
+    # Arrange
+    Edgar10QParser(parse_cache=ParseCache(tmp_path)).parse_detached(HTML)
+    cache = ParseCache(tmp_path, namespace=namespace)
+
+    # Act
+    parser_cls(parse_cache=cache).parse_detached(HTML, **kwargs)
+
+    # Assert
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+@pytest.mark.parametrize(
+    ("name", "html_tag_parser"),
+    values := [
+        ("without_source_spans", HtmlTagParser(track_source_spans=False)),
+        ("other_backend", HtmlTagParser("html.parser")),
+        ("other_class", LxmlHtmlTagParser()),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_parse_cache_key_with_html_tag_parser(tmp_path, name, html_tag_parser):
+    # Arrange
+    Edgar10QParser(parse_cache=ParseCache(tmp_path)).parse_detached(HTML)
+    cache = ParseCache(tmp_path)
+    parser = Edgar10QParser(parse_cache=cache, html_tag_parser=html_tag_parser)
+
+    # Act
+    actual = parser.parse_detached(HTML)
+
+    # Assert
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert actual == Edgar10QParser(html_tag_parser=html_tag_parser).parse_detached(
+        HTML,
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "create_step", "expected_hits"),
+    values := [
+        (
+            "same_arguments",
+            lambda: TableClassifier(types_to_process={NotYetClassifiedElement}),
+            1,
+        ),
+        (
+            "other_argument_value",
+            lambda: TableClassifier(
+                types_to_process={NotYetClassifiedElement},
+                check_threshold=False,
+            ),
+            0,
+        ),
+        ("other_types_to_process", lambda: TableClassifier(), 0),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_parse_cache_key_with_step_arguments(
+    tmp_path,
+    name,
+    create_step,
+    expected_hits,
+):
+    # Arrange
+    Edgar10QParser(
+        get_steps=lambda: [
+            TableClassifier(types_to_process={NotYetClassifiedElement}),
+            TextClassifier(),
+        ],
+        parse_cache=ParseCache(tmp_path),
+    ).parse_detached(HTML)
+    cache = ParseCache(tmp_path)
+    parser = Edgar10QParser(
+        get_steps=lambda: [create_step(), TextClassifier()],
+        parse_cache=cache,
+    )
+
+    # Act
+    parser.parse_detached(HTML)
+
+    # Assert
+    assert cache.hits == expected_hits
+
+
+def test_parse_cache_serialization():
+    # Arrange
+    elements = [
+        create_element(
+            "title",
+            level=1,
+            section_type="part1item1",
+            text_style=TextStyle(bold_with_font_weight=True, italic=True),
+            source_span=(10, 20),
+        ),
+        create_element(
+            "composite",
+            inner_elements=(create_element("inner ‘unicode’"),),
+        ),
+    ]
+
+    # Act
+    actual = _deserialize(_serialize(elements))
+
+    # Assert
+    assert actual == elements
+
+
+def test_parse_cache_with_corrupt_entry(tmp_path):
+    # Arrange
+    cache = ParseCache(tmp_path)
+    cache.put("abcd", [create_element("text")])
+    next(tmp_path.glob("*/abcd.*")).write_bytes(b"corrupt")
+
+    # Act
+    actual = cache.get("abcd")
+    cache.put("abcd", [create_element("text")])
+
+    # Assert
+    assert actual is None
+    assert cache.get("abcd") == [create_element("text")]
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path):
+    # Arrange
+    elements = [create_element("x" * 1000)]
+    cache = ParseCache(tmp_path, max_size=10_000)
+    cache.put("aa01", elements)
+    entry_size = cache.size
+    cache = ParseCache(tmp_path, max_size=int(entry_size * 3.5))
+    cache.put("aa02", elements)
+    cache.put("aa03", elements)
+    for i, key in enumerate(["aa01", "aa02", "aa03"]):
+        os.utime(next(tmp_path.glob(f"*/{key}.*")), (i, i))
+    cache.get("aa01")
+
+    # Act
+    cache.put("aa04", elements)
+
+    # Assert
+    assert cache.get("aa02") is None
+    assert cache.get("aa01") == elements
+    assert cache.get("aa04") == elements
+    assert cache.size <= entry_size * 3
+
+
+def test_parse_cache_shared_by_several_processes(tmp_path):
+    # Arrange
+    elements = [create_element("x" * 1000)]
+    cache = ParseCache(tmp_path)
+    cache.put("aa00", elements)
+    entry_size = cache.size
+    cache.clear()
+    max_size = entry_size * 20
+    caches = [ParseCache(tmp_path, max_size=max_size) for _ in range(2)]
+    for c in caches:
+        # Both processes scan the directory before the other one writes.
+        _ = c.size
+
+    # Act
+    for i in range(30):
+        caches[i % 2].put(f"aa{i:02}", elements)
+
+    # Assert
+    assert ParseCache(tmp_path).size <= max_size * 1.2 + entry_size
+
+
+def test_parse_cache_clear(tmp_path):
+    # Arrange
+    cache = ParseCache(tmp_path)
+    cache.put("abcd", [create_element("text")])
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert cache.size == 0
+    assert cache.get("abcd") is None
+
+
+def test_parse_cache_with_invalid_max_size(tmp_path):
+    # Act & Assert
+    with pytest.raises(SecParserValueError):
+        ParseCache(tmp_path, max_size=0)
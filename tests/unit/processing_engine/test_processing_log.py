@@ -0,0 +1,71 @@
+from unittest.mock import Mock
+
+import pytest
+
+from sec_parser.processing_engine.processing_log import (
+    LogItem,
+    ProcessingLog,
+    ProcessingLogMode,
+)
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected_items", "expected_calls_before_read"),
+    [
+        (ProcessingLogMode.FULL, [LogItem("a", "x"), LogItem("b", {"k": 1})], 1),
+        (ProcessingLogMode.LAZY, [LogItem("a", "x"), LogItem("b", {"k": 1})], 0),
+        (ProcessingLogMode.OFF, [], 0),
+    ],
+)
+def test_add_item(mode, expected_items, expected_calls_before_read):
+    # Arrange
+    log = ProcessingLog(mode)
+    payload_factory = Mock(return_value={"k": 1})
+
+    # Act
+    log.add_item(message="x", log_origin="a")
+    log.add_item(message=payload_factory, log_origin="b")
+
+    # Assert
+    assert payload_factory.call_count == expected_calls_before_read
+    assert list(log.get_items()) == expected_items
+    assert list(log.get_items()) == expected_items
+    assert payload_factory.call_count == (1 if expected_items else 0)
+
+
+@pytest.mark.parametrize("mode", [ProcessingLogMode.FULL, ProcessingLogMode.LAZY])
+def test_copies_are_independent(mode):
+    # Arrange
+    log = ProcessingLog(mode)
+    log.add_item(message="shared", log_origin="a")
+
+    # Act
+    first_copy = log.copy()
+    second_copy = log.copy()
+    first_copy.add_item(message="first", log_origin="b")
+    second_copy.add_item(message="second", log_origin="c")
+    log.add_item(message="original", log_origin="d")
+
+    # Assert
+    assert [i.payload for i in log.get_items()] == ["shared", "original"]
+    assert [i.payload for i in first_copy.get_items()] == ["shared", "first"]
+    assert [i.payload for i in second_copy.get_items()] == ["shared", "second"]
+    assert first_copy.mode is mode
+
+
+def test_long_copy_chain():
+    # Arrange
+    log = ProcessingLog()
+    chain = [log]
+
+    # Act
+    for index in range(100):
+        log.add_item(message=index, log_origin="a")
+        log = log.copy()
+        chain.append(log)
+    chain[50].add_item(message="late", log_origin="b")
+
+    # Assert
+    assert [i.payload for i in chain[-1].get_items()] == list(range(100))
+    assert [i.payload for i in chain[50].get_items()] == [*range(50), 50, "late"]
+    assert [i.payload for i in chain[51].get_items()] == list(range(52))
@@ -2,12 +2,16 @@ from unittest.mock import patch
 
 import pytest
 
+from sec_parser.exceptions import SecParserValueError
 from sec_parser.processing_engine.core import Edgar10QParser
 from sec_parser.processing_engine.processing_log import LogItem
+from sec_parser.processing_engine.types import ParsingOptions
 from sec_parser.semantic_elements.composite_semantic_element import (
     CompositeSemanticElement,
 )
+from sec_parser.semantic_elements.semantic_elements import IrrelevantElement
 from sec_parser.semantic_elements.title_element import TitleElement
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
 from tests.unit._utils import assert_elements
 
 
@@ -83,3 +87,151 @@ def test_transformation_history(name, html_str, expected_processing_log):
         len(processed_elements) == 1
     )  # For simplicity, while crafting `html_str` make sure it always returns single element.
     assert processing_log == expected_processing_log
+
+
+@pytest.mark.parametrize(
+    "reuse_processing_steps",
+    [True, False],
+)
+def test_reuse_processing_steps(reuse_processing_steps):
+    # Arrange
+    html_str = """
+        <p>Introduction</p>
+        <span style="font-weight:bold">Part I</span>
+        <p>Hello</p>
+    """
+    get_steps_calls = []
+
+    def get_steps():
+        get_steps_calls.append(None)
+        return Edgar10QParser().get_default_steps()
+
+    sec_parser = Edgar10QParser(
+        get_steps,
+        parsing_options=ParsingOptions(
+            reuse_processing_steps=reuse_processing_steps,
+        ),
+    )
+    expected_elements = Edgar10QParser().parse(html_str)
+
+    # Act
+    elements = [sec_parser.parse(html_str) for _ in range(3)]
+
+    # Assert
+    assert len(get_steps_calls) == (1 if reuse_processing_steps else 3)
+    for processed_elements in elements:
+        assert [e.to_dict() for e in processed_elements] == [
+            e.to_dict() for e in expected_elements
+        ]
+
+
+SECTIONS_HTML = """
+    <p>Cover page</p>
+    <div><span style="font-weight:bold">Part I</span></div>
+    <div><span style="font-weight:bold">Item 1. Financial Statements</span></div>
+    <p>The financial statements are presented below, in millions of dollars.</p>
+    <p>Revenue increased, see Part II, Item 1A for the related risks.</p>
+    <div><span style="font-weight:bold">Item 2. Management's Discussion</span></div>
+    <p>Management discusses the results of operations for the quarter.</p>
+    <div><span style="font-weight:bold">Part II</span></div>
+    <div><span style="font-weight:bold">Item 1A. Risk Factors</span></div>
+    <p>Our business is subject to numerous risks and uncertainties.</p>
+    <p>Competition in our markets could adversely affect our results.</p>
+    <div><span style="font-weight:bold">Item 2. Unregistered Sales</span></div>
+    <p>There were no unregistered sales of equity securities.</p>
+"""
+
+
+@pytest.mark.parametrize(
+    ("name", "sections", "expected_texts"),
+    values := [
+        (
+            "item",
+            {"part2item1a"},
+            [
+                "Item 1A. Risk Factors",
+                "Our business is subject to numerous risks and uncertainties.",
+                "Competition in our markets could adversely affect our results.",
+            ],
+        ),
+        (
+            "part",
+            {"part2"},
+            [
+                "Part II",
+                "Item 1A. Risk Factors",
+                "Our business is subject to numerous risks and uncertainties.",
+                "Competition in our markets could adversely affect our results.",
+                "Item 2. Unregistered Sales",
+                "There were no unregistered sales of equity securities.",
+            ],
+        ),
+        (
+            "several",
+            {"part1item1", "part2item2"},
+            [
+                "Item 1. Financial Statements",
+                "The financial statements are presented below, in millions of dollars.",
+                "Revenue increased, see Part II, Item 1A for the related risks.",
+                "Item 2. Unregistered Sales",
+                "There were no unregistered sales of equity securities.",
+            ],
+        ),
+        (
+            "missing",
+            {"part1item4"},
+            [],
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_parse_sections(name, sections, expected_texts):
+    # Arrange
+    sec_parser = Edgar10QParser()
+    expected_elements = [
+        e for e in sec_parser.parse(SECTIONS_HTML) if e.text in expected_texts
+    ]
+
+    # Act
+    elements = sec_parser.parse(SECTIONS_HTML, sections=sections)
+
+    # Assert
+    assert [e.text for e in elements] == expected_texts
+    assert [type(e) for e in elements] == [type(e) for e in expected_elements]
+
+
+def test_parse_sections_keeps_irrelevant_elements():
+    # Arrange
+    sec_parser = Edgar10QParser()
+    all_elements = sec_parser.parse(SECTIONS_HTML, include_irrelevant_elements=True)
+
+    # Act
+    elements = sec_parser.parse(
+        SECTIONS_HTML,
+        sections={"part2item1a"},
+        include_irrelevant_elements=True,
+    )
+
+    # Assert
+    assert [e.text for e in elements] == [e.text for e in all_elements]
+    assert [
+        e.text for e in elements if isinstance(e, TopSectionTitle)
+    ] == ["Item 1A. Risk Factors"]
+    assert sum(not isinstance(e, IrrelevantElement) for e in elements) == 3
+
+
+def test_parse_sections_without_top_section_manager():
+    # Arrange
+    def get_steps():
+        return [
+            step
+            for step in Edgar10QParser().get_default_steps()
+            if "TopSection" not in type(step).__name__
+            and "IntroductorySection" not in type(step).__name__
+        ]
+
+    sec_parser = Edgar10QParser(get_steps)
+
+    # Act & Assert
+    with pytest.raises(SecParserValueError):
+        sec_parser.parse(SECTIONS_HTML, sections={"part2item1a"})
@@ -0,0 +1,97 @@
+import gc
+import io
+import weakref
+
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine import HtmlTagParser, StreamingHtmlTagParser
+
+HTML = """
+<html><body><div>
+<p style="font-weight:bold">Part I. Financial Information</p>
+<p>Some <b>text</b>.</p>
+<table><tr><td>1<td>2</table>
+<ix:nonNumeric name="a">Tagged</ix:nonNumeric>
+</div></body></html>
+"""
+
+
+def _describe(tags):
+    return [
+        (tag.get_source_code(), tag.text, tag.get_text_styles_metrics())
+        for tag in tags
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [8, 64, 64 * 1024])
+@pytest.mark.parametrize("max_buffered_tags", [0, 20_000])
+def test_streaming_html_tag_parser(chunk_size, max_buffered_tags):
+    # Arrange
+    expected = HtmlTagParser(track_source_spans=False).parse(HTML)
+    parser = StreamingHtmlTagParser(
+        chunk_size=chunk_size,
+        max_buffered_tags=max_buffered_tags,
+    )
+
+    # Act
+    actual = parser.parse(HTML)
+
+    # Assert
+    assert _describe(actual) == _describe(expected)
+    assert len(actual) == 4
+
+
+def test_streaming_html_tag_parser_from_file():
+    # Arrange
+    html = '<meta charset="latin-1"><div><p>caf\xe9</p><p>b</p></div>'
+    expected = HtmlTagParser(track_source_spans=False).parse(html)
+    file = io.BytesIO(html.encode("latin-1"))
+
+    # Act
+    actual = list(StreamingHtmlTagParser(chunk_size=16).iter_parse(file))
+
+    # Assert
+    assert _describe(actual) == _describe(expected)
+    assert actual[0].text == "caf\xe9"
+
+
+def test_streaming_html_tag_parser_keeps_inherited_styles():
+    # Arrange
+    html = '<div style="font-weight:bold"><p>a</p><p>b</p></div><p>c</p>'
+
+    # Act
+    tags = StreamingHtmlTagParser(max_buffered_tags=0).parse(html)
+
+    # Assert
+    assert [tag.text for tag in tags] == ["a", "b", "c"]
+    assert tags[0].get_text_styles_metrics() == {("font-weight", "bold"): 100.0}
+    assert tags[1].get_text_styles_metrics() == {("font-weight", "bold"): 100.0}
+    assert tags[0].parent.name == "div"
+
+
+def test_streaming_html_tag_parser_releases_yielded_tags():
+    # Arrange
+    html = "<div>" + "<p>text</p>" * 100 + "</div>"
+    parser = StreamingHtmlTagParser(chunk_size=64, max_buffered_tags=0)
+    tags = parser.iter_parse(html)
+    first = next(tags)
+    first_ref = weakref.ref(first._bs4)  # noqa: SLF001
+
+    # Act
+    del first
+    rest = list(tags)
+    gc.collect()
+
+    # Assert
+    assert first_ref() is None
+    assert len(rest) == 99
+
+
+def test_streaming_html_tag_parser_without_tags():
+    # Arrange
+    parser = StreamingHtmlTagParser()
+
+    # Act & Assert
+    with pytest.raises(SecParserValueError):
+        parser.parse("   ")
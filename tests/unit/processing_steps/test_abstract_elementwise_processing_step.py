@@ -10,12 +10,16 @@ from sec_parser.processing_engine.processing_log import LogItemOrigin
 from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
     MODULE_LOGGER_NAME,
     AbstractElementwiseProcessingStep,
+    ElementDispatch,
     ElementProcessingContext,
     ErrorWhileProcessingElement,
 )
 from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
 )
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
 
 
 class MockSemanticElement(AbstractSemanticElement):
@@ -26,6 +30,10 @@ class AnotherMockSemanticElement(AbstractSemanticElement):
     pass
 
 
+class MockSemanticElementSubclass(MockSemanticElement):
+    pass
+
+
 class ProcessingStep(AbstractElementwiseProcessingStep):
     def __init__(
         self,
@@ -145,3 +153,79 @@ def test_error_while_processing_element_with_no_error():
             error=None,
             log_origin=Mock(spec=LogItemOrigin),
         )
+
+
+@pytest.mark.parametrize(
+    ("types_to_process", "types_to_exclude", "element_type", "expected"),
+    [
+        (None, None, MockSemanticElement, ElementDispatch.PROCESS),
+        (None, None, CompositeSemanticElement, ElementDispatch.RECURSE),
+        (None, None, ErrorWhileProcessingElement, ElementDispatch.SKIP),
+        ({MockSemanticElement}, None, MockSemanticElement, ElementDispatch.PROCESS),
+        (
+            {MockSemanticElement},
+            None,
+            MockSemanticElementSubclass,
+            ElementDispatch.PROCESS,
+        ),
+        (
+            {MockSemanticElement},
+            None,
+            AnotherMockSemanticElement,
+            ElementDispatch.SKIP,
+        ),
+        (
+            {MockSemanticElement},
+            None,
+            CompositeSemanticElement,
+            ElementDispatch.RECURSE,
+        ),
+        (
+            None,
+            {MockSemanticElement},
+            MockSemanticElementSubclass,
+            ElementDispatch.SKIP,
+        ),
+        (
+            None,
+            {CompositeSemanticElement},
+            CompositeSemanticElement,
+            ElementDispatch.SKIP,
+        ),
+    ],
+)
+def test_get_element_dispatch(
+    types_to_process,
+    types_to_exclude,
+    element_type,
+    expected,
+):
+    # Arrange
+    step = ProcessingStep(
+        types_to_process=types_to_process,
+        types_to_exclude=types_to_exclude,
+    )
+
+    # Act
+    dispatch = step.get_element_dispatch(element_type)
+
+    # Assert
+    assert dispatch is expected
+    assert step.get_element_dispatch(element_type) is expected
+
+
+def test_process_recurses_into_composite_elements():
+    # Arrange
+    step = ProcessingStep(types_to_process={MockSemanticElement})
+    inner_element = MockSemanticElementSubclass(Mock())
+    skipped_element = AnotherMockSemanticElement(Mock())
+    composite = CompositeSemanticElement(
+        Mock(),
+        inner_elements=(inner_element, skipped_element),
+    )
+
+    # Act
+    step.process([composite])
+
+    # Assert
+    assert step.seen_elements == [inner_element]
@@ -38,3 +38,17 @@ def test_process_already_processed_raises_error():
         match="This Step instance has already processed a document",
     ):
         step.process(elements)
+
+
+def test_process_after_reset():
+    # Arrange
+    elements: list[AbstractSemanticElement] = [DummyElement(Mock()) for _ in range(5)]
+    step = DummyProcessingStep()
+    step.process(elements)
+
+    # Act
+    step.reset()
+    processed_elements = step.process(elements)
+
+    # Assert
+    assert processed_elements == elements
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from loguru import logger
+
+from sec_parser.exceptions import SecParserError, SecParserValueError
+from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+    MODULE_LOGGER_NAME,
+    AbstractElementwiseProcessingStep,
+    ElementProcessingContext,
+    ErrorWhileProcessingElement,
+)
+from sec_parser.processing_steps.fused_elementwise_processing_step import (
+    FusedElementwiseProcessingStep,
+    fuse_elementwise_steps,
+)
+from sec_parser.semantic_elements.abstract_semantic_element import (
+    AbstractSemanticElement,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+
+
+class MockSemanticElement(AbstractSemanticElement):
+    pass
+
+
+class AnotherMockSemanticElement(AbstractSemanticElement):
+    pass
+
+
+class ConvertingStep(AbstractElementwiseProcessingStep):
+    _IS_ELEMENT_LOCAL = True
+
+    def __init__(self, name: str, calls: list, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.name = name
+        self.calls = calls
+
+    def _process_element(
+        self,
+        element: AbstractSemanticElement,
+        _: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        self.calls.append((self.name, element.html_tag))
+        if isinstance(element, MockSemanticElement):
+            return AnotherMockSemanticElement(element.html_tag)
+        return element
+
+
+class ErrorRaisingStep(AbstractElementwiseProcessingStep):
+    _IS_ELEMENT_LOCAL = True
+
+    def _process_element(
+        self,
+        element: AbstractSemanticElement,
+        _: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        raise SecParserError
+
+
+class TwoIterationStep(ConvertingStep):
+    _NUM_ITERATIONS = 2
+
+
+def _create_elements(tags: list) -> list[AbstractSemanticElement]:
+    return [
+        MockSemanticElement(tags[0]),
+        CompositeSemanticElement(
+            tags[1],
+            inner_elements=(
+                MockSemanticElement(tags[2]),
+                AnotherMockSemanticElement(tags[3]),
+            ),
+        ),
+        AnotherMockSemanticElement(tags[4]),
+    ]
+
+
+def _describe(elements) -> list:
+    return [
+        (type(e), e.html_tag, _describe(e.inner_elements))
+        if isinstance(e, CompositeSemanticElement)
+        else (type(e), e.html_tag)
+        for e in elements
+    ]
+
+
+def _create_steps(calls: list) -> list[AbstractElementwiseProcessingStep]:
+    return [
+        ConvertingStep("a", calls, types_to_process={MockSemanticElement}),
+        ConvertingStep("b", calls),
+        ConvertingStep("c", calls, types_to_exclude={MockSemanticElement}),
+    ]
+
+
+def test_fused_steps_produce_the_same_elements():
+    # Arrange
+    tags = [Mock() for _ in range(5)]
+    sequential_calls: list = []
+    fused_calls: list = []
+    sequential_elements = _create_elements(tags)
+    fused_elements = _create_elements(tags)
+    (fused_step,) = fuse_elementwise_steps(_create_steps(fused_calls))
+
+    # Act
+    for step in _create_steps(sequential_calls):
+        sequential_elements = step.process(sequential_elements)
+    fused_elements = fused_step.process(fused_elements)
+
+    # Assert
+    assert isinstance(fused_step, FusedElementwiseProcessingStep)
+    assert _describe(fused_elements) == _describe(sequential_elements)
+    assert sorted(fused_calls, key=str) == sorted(sequential_calls, key=str)
+
+
+def test_fused_steps_process_each_element_before_the_next_one():
+    # Arrange
+    tags = [Mock() for _ in range(5)]
+    calls: list = []
+    (fused_step,) = fuse_elementwise_steps(_create_steps(calls))
+
+    # Act
+    fused_step.process(_create_elements(tags))
+
+    # Assert
+    assert [(name, tags.index(tag)) for name, tag in calls] == [
+        ("a", 0),
+        ("b", 0),
+        ("c", 0),
+        ("a", 2),
+        ("b", 2),
+        ("c", 2),
+        ("b", 3),
+        ("c", 3),
+        ("b", 4),
+        ("c", 4),
+    ]
+
+
+def test_steps_that_are_not_fusable_act_as_barriers():
+    # Arrange
+    calls: list = []
+    steps = [
+        ConvertingStep("a", calls),
+        ConvertingStep("b", calls),
+        TwoIterationStep("c", calls),
+        ConvertingStep("d", calls),
+    ]
+
+    # Act
+    fused_steps = fuse_elementwise_steps(steps)
+
+    # Assert
+    assert len(fused_steps) == 3
+    assert isinstance(fused_steps[0], FusedElementwiseProcessingStep)
+    assert fused_steps[0].steps == steps[:2]
+    assert fused_steps[1:] == steps[2:]
+
+
+def test_step_that_is_not_fusable_is_rejected():
+    # Arrange
+    step = TwoIterationStep("a", [])
+
+    # Act & Assert
+    with pytest.raises(SecParserValueError):
+        FusedElementwiseProcessingStep([step])
+
+
+def test_error_while_processing_element_in_fused_steps():
+    # Arrange
+    calls: list = []
+    fused_step = FusedElementwiseProcessingStep(
+        [ErrorRaisingStep(), ConvertingStep("b", calls)],
+    )
+
+    # Act
+    logger.disable(MODULE_LOGGER_NAME)
+    elements = fused_step.process([MockSemanticElement(Mock())])
+    logger.enable(MODULE_LOGGER_NAME)
+
+    # Assert
+    assert isinstance(elements[0], ErrorWhileProcessingElement)
+    assert calls == []
@@ -0,0 +1,70 @@
+from unittest.mock import Mock
+
+import pytest
+
+from sec_parser.processing_steps.abstract_classes.processing_context import (
+    ElementProcessingContext,
+)
+from sec_parser.semantic_elements.semantic_elements import (
+    NotYetClassifiedElement,
+    PageBreakElement,
+)
+
+
+def _create_elements(layout: str):
+    """Create elements from a layout string, e.g. "..|.", where "|" is a page break."""
+    return [
+        PageBreakElement(Mock()) if c == "|" else NotYetClassifiedElement(Mock())
+        for c in layout
+    ]
+
+
+@pytest.mark.parametrize(
+    ("layout", "index", "expected_previous", "expected_next", "expected_page"),
+    [
+        ("..|...|.", 4, 2, 2, 2),
+        ("..|...|.", 7, 1, None, 3),
+        ("..|...|.", 1, None, 1, 1),
+        # A page break at index 0 is not considered a previous page break
+        ("|...", 2, None, None, 2),
+        ("....", 3, None, None, 1),
+    ],
+)
+def test_page_break_lookups(
+    layout,
+    index,
+    expected_previous,
+    expected_next,
+    expected_page,
+):
+    # Arrange
+    context = ElementProcessingContext(
+        iteration=0,
+        elements=_create_elements(layout),
+    )
+
+    # Act
+    context.element_index = index
+
+    # Assert
+    assert context.distant_to_previous_pagebreak_element(Mock()) == expected_previous
+    assert context.distance_to_next_pagebreak_element() == expected_next
+    assert context.get_page_number() == expected_page
+    assert context.page_break_count == layout.count("|")
+
+
+def test_replace_element_updates_page_breaks():
+    # Arrange
+    elements = _create_elements(".....")
+    context = ElementProcessingContext(iteration=0, elements=elements)
+    context.element_index = 4
+    assert context.distant_to_previous_pagebreak_element(Mock()) is None
+
+    # Act
+    context.replace_element(2, PageBreakElement(Mock()))
+
+    # Assert
+    assert isinstance(elements[2], PageBreakElement)
+    assert context.distant_to_previous_pagebreak_element(Mock()) == 2
+    assert context.get_page_number() == 2
+    assert context.page_break_count == 1
@@ -0,0 +1,63 @@
+import pytest
+
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.processing_steps.top_section_filter import TopSectionFilter
+from sec_parser.semantic_elements.semantic_elements import IrrelevantElement
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
+
+
+@pytest.mark.parametrize(
+    ("name", "sections", "expected_relevant_texts"),
+    values := [
+        (
+            "item_ends_with_next_item",
+            {"part1item1"},
+            ["Item 1. Financial Statements", "Statements."],
+        ),
+        (
+            "part_includes_its_items",
+            {"part1"},
+            [
+                "Part I",
+                "Item 1. Financial Statements",
+                "Statements.",
+                "Item 2. Management's Discussion",
+                "Discussion.",
+            ],
+        ),
+        (
+            "item_ends_with_next_part",
+            {"part1item2"},
+            ["Item 2. Management's Discussion", "Discussion."],
+        ),
+        (
+            "none",
+            set(),
+            [],
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_top_section_filter(name, sections, expected_relevant_texts):
+    # Arrange
+    html_str = """
+        <p>Cover page.</p>
+        <div><span style="font-weight:bold">Part I</span></div>
+        <div><span style="font-weight:bold">Item 1. Financial Statements</span></div>
+        <p>Statements.</p>
+        <div><span style="font-weight:bold">Item 2. Management's Discussion</span></div>
+        <p>Discussion.</p>
+        <div><span style="font-weight:bold">Part II</span></div>
+        <p>Other information.</p>
+    """
+    elements = Edgar10QParser().parse(html_str, unwrap_elements=False)
+    assert any(isinstance(e, TopSectionTitle) for e in elements)
+    step = TopSectionFilter(sections)
+
+    # Act
+    processed_elements = step.process(elements)
+
+    # Assert
+    assert [
+        e.text for e in processed_elements if not isinstance(e, IrrelevantElement)
+    ] == expected_relevant_texts
@@ -0,0 +1,117 @@
+import re
+
+import pytest
+
+from sec_parser.processing_steps.top_section_manager import (
+    TopSectionLayout,
+    TopSectionManager,
+)
+from sec_parser.processing_steps.top_section_manager_for_10q import (
+    TopSectionManagerFor10Q,
+)
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
+from sec_parser.semantic_elements.top_section_title_types import TopSectionType
+from tests.unit.processing_steps._utils import parse_initial_semantic_elements
+
+TOP_SECTIONS_IN_TEST_FORM = TopSectionLayout(
+    form_type="TEST",
+    part_pattern=re.compile(r"part\s+(i+)", re.IGNORECASE),
+    item_pattern=re.compile(r"item\s+(\d+)", re.IGNORECASE),
+    sections=(
+        TopSectionType(identifier="part1", title="Part I", order=0, level=0),
+        TopSectionType(identifier="part1item1", title="Item 1", order=1, level=1),
+        TopSectionType(identifier="part1item2", title="Item 2", order=2, level=1),
+    ),
+    invalid_section=TopSectionType(
+        identifier="invalid",
+        title="Invalid",
+        order=-1,
+        level=1,
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    ("name", "html_str", "expected_identifiers"),
+    values := [
+        (
+            "in_order",
+            """
+                <p>Part I</p>
+                <p>Item 1</p>
+                <p>Text</p>
+                <p>Item 2</p>
+            """,
+            ["part1", "part1item1", None, "part1item2"],
+        ),
+        (
+            "out_of_order",
+            """
+                <p>Part I</p>
+                <p>Item 2</p>
+                <p>Item 1</p>
+            """,
+            ["part1", "part1item2", None],
+        ),
+        (
+            "first_candidate_without_table",
+            """
+                <p>Part I</p>
+                <div><table><tr><td>Item 1</td></tr></table></div>
+                <p>Item 1</p>
+                <p>Item 1</p>
+            """,
+            ["part1", None, "part1item1", None],
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_top_section_manager(name, html_str, expected_identifiers):
+    # Arrange
+    elements = parse_initial_semantic_elements(html_str)
+    step = TopSectionManager(TOP_SECTIONS_IN_TEST_FORM)
+
+    # Act
+    processed_elements = step.process(elements)
+
+    # Assert
+    actual_identifiers = [
+        e.section_type.identifier if isinstance(e, TopSectionTitle) else None
+        for e in processed_elements
+    ]
+    assert actual_identifiers == expected_identifiers
+
+
+def test_top_section_manager_warns_about_invalid_sections():
+    # Arrange
+    elements = parse_initial_semantic_elements("<p>Part III</p><p>Text</p>")
+    step = TopSectionManager(TOP_SECTIONS_IN_TEST_FORM)
+
+    # Act
+    with pytest.warns(UserWarning, match="part3"):
+        processed_elements = step.process(elements)
+
+    # Assert
+    assert isinstance(processed_elements[0], TopSectionTitle)
+    assert processed_elements[0].section_type.identifier == "invalid"
+
+
+@pytest.mark.parametrize(
+    ("name", "text", "expected_part", "expected_item"),
+    values := [
+        ("part", "Part II. Other Information", "2", None),
+        ("item", "Item 1A. Risk Factors", None, "1a"),
+        ("neither", "Items of the balance sheet", None, None),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_top_section_layout_of_10q(name, text, expected_part, expected_item):
+    # Act
+    actual_part = TopSectionManagerFor10Q.match_part(text)
+    actual_item = TopSectionManagerFor10Q.match_item(text)
+    actual_match = TopSectionManagerFor10Q.is_match_part_or_item(text)
+
+    # Assert
+    assert actual_part == expected_part
+    assert actual_item == expected_item
+    assert actual_match is (expected_part is not None or expected_item is not None)
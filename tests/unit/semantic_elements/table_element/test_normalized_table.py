@@ -0,0 +1,130 @@
+import bs4
+import numpy as np
+import pytest
+
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.semantic_elements.table_element.normalized_table import (
+    NormalizedTable,
+)
+from sec_parser.semantic_elements.table_element.table_element import TableElement
+from sec_parser.utils.bs4_.table_grid import TableGrid
+
+NAN = float("nan")
+
+
+@pytest.mark.parametrize(
+    ("name", "rows", "expected_values", "expected_currency", "expected_percent"),
+    values := [
+        (
+            "plain_numbers",
+            (("a", "1,234", "12.50", "-3"),),
+            [[NAN, 1234, 12.5, -3]],
+            [[False, False, False, False]],
+            [[False, False, False, False]],
+        ),
+        (
+            "markers_in_cells",
+            (("$1,234", "(56)", "$(7.5)", "8%", "(9)%"),),
+            [[1234, -56, -7.5, 8, -9]],
+            [[True, False, True, False, False]],
+            [[False, False, False, True, True]],
+        ),
+        (
+            "markers_in_columns",
+            (
+                ("Net income", "$", "(1,642", ")", "", "12", "%"),
+                ("Other", "", "3", "", "$", "4", ""),
+            ),
+            [[NAN, -1642, 12], [NAN, 3, 4]],
+            [[False, True, False], [False, False, True]],
+            [[False, False, True], [False, False, False]],
+        ),
+        (
+            "zeros",
+            (("—", "–", "-", "−", "- -"),),  # noqa: RUF001
+            [[0, 0, 0, 0, NAN]],
+            [[False] * 5],
+            [[False] * 5],
+        ),
+        (
+            "text",
+            (("Note 7", "1.2.3", ".", "2023", "²"),),
+            [[NAN, NAN, NAN, 2023, NAN]],
+            [[False] * 5],
+            [[False] * 5],
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_from_grid(name, rows, expected_values, expected_currency, expected_percent):
+    # Arrange
+    grid = TableGrid(rows=rows)
+
+    # Act
+    table = NormalizedTable.from_grid(grid)
+
+    # Assert
+    np.testing.assert_array_equal(table.values, np.array(expected_values))
+    np.testing.assert_array_equal(table.is_currency, np.array(expected_currency))
+    np.testing.assert_array_equal(table.is_percent, np.array(expected_percent))
+
+
+def test_from_grid_keeps_the_text_of_the_remaining_columns():
+    # Arrange
+    grid = TableGrid(rows=(("Net income", "$", "598", ""), ("Total", "", "1", "")))
+
+    # Act
+    table = NormalizedTable.from_grid(grid)
+
+    # Assert
+    assert table.text.tolist() == [["Net income", "598"], ["Total", "1"]]
+
+
+@pytest.mark.parametrize(
+    ("name", "rows", "context", "expected_scale"),
+    values := [
+        ("no_hint", (("a", "1"),), "", 1),
+        ("hint_in_table", (("(in Thousands)", "1"),), "", 1_000),
+        ("hint_in_context", (("a", "1"),), "Dollars in millions", 1_000_000),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_scale(name, rows, context, expected_scale):
+    # Act
+    table = NormalizedTable.from_grid(TableGrid(rows=rows), context=context)
+
+    # Assert
+    assert table.scale == expected_scale
+
+
+def test_scaled_values():
+    # Arrange
+    grid = TableGrid(rows=(("in billions", "2", "3%"),))
+
+    # Act
+    table = NormalizedTable.from_grid(grid)
+
+    # Assert
+    np.testing.assert_array_equal(table.scaled_values, [[NAN, 2e9, 3]])
+
+
+def test_from_grid_of_empty_table():
+    # Act
+    table = NormalizedTable.from_grid(TableGrid(rows=()))
+
+    # Assert
+    assert table.values.shape == (0, 0)
+
+
+def test_table_element_get_normalized_table():
+    # Arrange
+    html = "<table><tr><td>Revenue</td><td>$</td><td>1,000</td></tr></table>"
+    table = bs4.BeautifulSoup(html, "lxml").table
+    element = TableElement(HtmlTag(table))
+
+    # Act
+    normalized = element.get_normalized_table()
+
+    # Assert
+    np.testing.assert_array_equal(normalized.values, [[NAN, 1000]])
+    np.testing.assert_array_equal(normalized.is_currency, [[False, True]])
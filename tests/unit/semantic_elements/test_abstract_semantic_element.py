@@ -1,12 +1,21 @@
+import gc
+import weakref
 from unittest.mock import Mock
 
 import bs4
 import pytest
 
 from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.processing_engine.processing_log import (
+    ProcessingLog,
+    ProcessingLogMode,
+)
 from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
 )
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
 
 
 class DummyElement(AbstractSemanticElement):
@@ -54,3 +63,30 @@ def test_repr():
 
     # Assert
     assert repr_string == "DummyElement<div>"
+
+
+@pytest.mark.parametrize("mode", [ProcessingLogMode.FULL, ProcessingLogMode.LAZY])
+def test_log_init_records_the_element_as_created(mode):
+    # Arrange
+    html_tag = HtmlTag(bs4.Tag(name="div"))
+    inner_elements = (DummyElement(html_tag), DummyElement(html_tag))
+    element = CompositeSemanticElement(
+        html_tag,
+        processing_log=ProcessingLog(mode),
+        log_origin="origin",
+        inner_elements=inner_elements,
+    )
+    element_ref = weakref.ref(element)
+
+    # Act
+    element.inner_elements = inner_elements[:1]
+    derived = DummyElement.create_from_element(element, log_origin="derived")
+    del element
+    gc.collect()
+
+    # Assert
+    assert element_ref() is None
+    assert [item.payload for item in derived.processing_log.get_items()] == [
+        {"cls_name": "CompositeSemanticElement", "inner_elements": 2},
+        {"cls_name": "DummyElement"},
+    ]
@@ -0,0 +1,98 @@
+import gc
+import pickle
+import weakref
+from dataclasses import asdict
+
+import bs4
+
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.semantic_elements.detached_semantic_element import (
+    DetachedSemanticElement,
+)
+from sec_parser.semantic_elements.highlighted_text_element import (
+    HighlightedTextElement,
+    TextStyle,
+)
+
+HTML = """
+<p><b>Part I. Financial Information</b></p>
+<p><b>Item 2. Management's Discussion</b></p>
+<p><span style="font-weight:bold">Overview</span></p>
+<p>Some text.</p>
+"""
+
+
+def test_detach():
+    # Arrange
+    elements = Edgar10QParser().parse(HTML)
+
+    # Act
+    detached = [e.detach() for e in elements]
+
+    # Assert
+    assert [d.cls_name for d in detached] == [type(e).__name__ for e in elements]
+    assert [d.text for d in detached] == [e.text for e in elements]
+    assert [d.html_hash for d in detached] == [
+        e.html_tag.to_dict()["html_hash"] for e in elements
+    ]
+    assert [d.to_dict() for d in detached] == [
+        {k: v for k, v in e.to_dict().items() if k != "html_hash"} for e in elements
+    ]
+    assert [d.source_span for d in detached] == [e.source_span for e in elements]
+    assert detached[1].source_span is not None
+    assert detached[1].section_type == "part1item2"
+    assert detached[1].level == 1
+
+
+def test_detach_highlighted_text_element():
+    # Arrange
+    style = TextStyle(bold_with_font_weight=True)
+    element = HighlightedTextElement(HtmlTag(bs4.Tag(name="p")), style=style)
+
+    # Act
+    detached = element.detach()
+
+    # Assert
+    assert detached.text_style == style
+    assert detached.to_dict()["text_style"] == asdict(style)
+
+
+def test_detached_elements_do_not_retain_the_document():
+    # Arrange
+    parser = Edgar10QParser()
+    elements = parser.parse(HTML)
+    document_ref = weakref.ref(elements[0].html_tag._bs4)  # noqa: SLF001
+
+    # Act
+    detached = [e.detach() for e in elements]
+    del elements
+    gc.collect()
+
+    # Assert
+    assert document_ref() is None
+    assert detached == parser.parse_detached(HTML)
+
+
+def test_detached_element_is_picklable():
+    # Arrange
+    element = DetachedSemanticElement(
+        cls_name="CompositeSemanticElement",
+        text="a",
+        html_hash="1234",
+        source_span=(0, 10),
+        inner_elements=(
+            DetachedSemanticElement(cls_name="TextElement", text="a", html_hash="5"),
+        ),
+    )
+
+    # Act
+    result = pickle.loads(pickle.dumps(element))  # noqa: S301
+
+    # Assert
+    assert result == element
+    assert result.to_dict(include_contents=True) == {
+        "cls_name": "CompositeSemanticElement",
+        "inner_elements": 1,
+        "text_content": "a",
+    }
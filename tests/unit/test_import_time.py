@@ -0,0 +1,47 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# The budget for `import sec_parser`, in microseconds. It is several times
+# the import time on a developer machine, to keep the test from being flaky,
+# while still catching the import of a heavy dependency such as pandas.
+IMPORT_TIME_BUDGET_US = 1_500_000
+
+# Dependencies that are only needed by some features, and thus only
+# imported on first use
+LAZILY_IMPORTED_MODULES = ["pandas", "tabulate"]
+
+
+def _import_sec_parser():
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", "import sec_parser"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Each line reads "import time: <self> | <cumulative> | <module>"
+    cumulative_times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)", line)
+        if match:
+            cumulative_times[match.group(3)] = int(match.group(1))
+    return cumulative_times
+
+
+def test_import_time_is_within_budget():
+    # Act
+    cumulative_times = _import_sec_parser()
+
+    # Assert
+    assert cumulative_times["sec_parser"] < IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize("module", LAZILY_IMPORTED_MODULES)
+def test_heavy_dependencies_are_not_imported(module):
+    # Act
+    cumulative_times = _import_sec_parser()
+
+    # Assert
+    assert module not in cumulative_times
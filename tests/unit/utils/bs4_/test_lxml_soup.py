@@ -0,0 +1,63 @@
+import bs4
+import pytest
+
+from sec_parser.utils.bs4_.lxml_soup import parse_with_lxml
+
+
+def _describe(soup):
+    elements = [soup, *soup.descendants]
+    positions = {id(element): i for i, element in enumerate(elements)}
+    result = []
+    for element in elements:
+        links = (
+            element.parent,
+            element.previous_element,
+            element.next_element,
+            element.previous_sibling,
+            element.next_sibling,
+        )
+        result.append(
+            (
+                type(element),
+                element.name if isinstance(element, bs4.Tag) else str(element),
+                element.attrs if isinstance(element, bs4.Tag) else None,
+                [None if link is None else positions[id(link)] for link in links],
+            ),
+        )
+    return result
+
+
+@pytest.mark.parametrize(
+    ("name", "html"),
+    values := [
+        ("empty", ""),
+        ("text_only", "text"),
+        ("well_formed", b'<div class="a  b"><p>x</p>\n  <p id="y">z</p></div>'),
+        ("omitted_end_tags", "<p>a<div>b</div><table><tr><td>1<td>2</table>"),
+        ("namespaced_tags", "<ix:nonNumeric name='a'><b>x</b></ix:nonNumeric>"),
+        ("whitespace", "<div> \n <pre>\n  </pre>\t<span> </span></div>"),
+        ("comments", "<!-- a --><div><!----><!-- b --></div>"),
+        ("doctype", "<!DOCTYPE html><html><body><p>x</p></body></html>"),
+        ("processing_instructions", "<p>x<?php y ?></p><?php z ?>"),
+        ("scripts_and_styles", "<script>if (a<b) {}</script><style>p {}</style>"),
+        ("meta_charset", b"<meta charset='latin-1'><p>\xe9</p>"),
+        ("misnested_tags", "<div><span>x<div>y</span>z</div><b>w</b>"),
+        (
+            "repeated_tags",
+            '<p class="a b">x</p><p class="c" id="d">y</p><p>z</p><p class="">w</p>',
+        ),
+        ("entities", "<p>&nbsp;&amp;&#8212;&lt;b&gt;&unknown;</p>"),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_parse_with_lxml(name, html):
+    # Arrange
+    expected = bs4.BeautifulSoup(html, "lxml")
+
+    # Act
+    actual = parse_with_lxml(html)
+
+    # Assert
+    assert str(actual) == str(expected)
+    assert _describe(actual) == _describe(expected)
+    assert actual.original_encoding == expected.original_encoding
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import bs4
+import pytest
+
+from sec_parser.utils.bs4_.source_spans import SourceSpanIndex
+
+
+def _get_source_slices(html: bytes) -> list[tuple[str, bytes | None]]:
+    root = bs4.BeautifulSoup(html, "lxml")
+    index = SourceSpanIndex(root, html)
+    result = []
+    for tag in root.find_all(True):
+        span = index.get(tag)
+        result.append((tag.name, None if span is None else html[span[0] : span[1]]))
+    return result
+
+
+@pytest.mark.parametrize(
+    ("name", "html", "expected"),
+    values := [
+        (
+            "well_formed",
+            b'<div><span style="a>b">x</span><br><img src="y"/></div>',
+            [
+                ("html", None),
+                ("body", None),
+                ("div", b'<div><span style="a>b">x</span><br><img src="y"/></div>'),
+                ("span", b'<span style="a>b">x</span>'),
+                ("br", b"<br>"),
+                ("img", b'<img src="y"/>'),
+            ],
+        ),
+        (
+            "omitted_end_tags",
+            b"<p>a<div>b</div><table><tr><td>1<td>2</table>",
+            [
+                ("html", None),
+                ("body", None),
+                ("p", b"<p>a"),
+                ("div", b"<div>b</div>"),
+                ("table", b"<table><tr><td>1<td>2</table>"),
+                ("tr", b"<tr><td>1<td>2"),
+                ("td", b"<td>1"),
+                ("td", b"<td>2"),
+            ],
+        ),
+        (
+            "markup_in_comments_and_scripts",
+            b"<div><!-- <p> --><script>if (a<b) {}</script><P>x</P></div>",
+            [
+                ("html", None),
+                ("body", None),
+                ("div", b"<div><!-- <p> --><script>if (a<b) {}</script><P>x</P></div>"),
+                ("script", b"<script>if (a<b) {}</script>"),
+                ("p", b"<P>x</P>"),
+            ],
+        ),
+        (
+            "structural_tags",
+            b"<html><body>text<div>x</div></body></html>",
+            [
+                ("html", b"<html><body>text<div>x</div></body></html>"),
+                ("body", b"<body>text<div>x</div></body>"),
+                ("div", b"<div>x</div>"),
+            ],
+        ),
+        (
+            "misnested_tags",
+            b"<div><span>x<div>y</span>z</div><b>w</b>",
+            [
+                ("html", None),
+                ("body", None),
+                ("div", None),
+                ("span", None),
+                ("div", None),
+                ("b", None),
+            ],
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_source_spans(name, html, expected):
+    # Act
+    actual = _get_source_slices(html)
+
+    # Assert
+    assert [tag_name for tag_name, _ in actual] == [tag_name for tag_name, _ in expected]
+    assert actual == expected
+
+
+def test_source_given_as_str_is_utf8_encoded():
+    # Arrange
+    html = "<div>\u00e9</div><span>x</span>"
+    root = bs4.BeautifulSoup(html, "lxml")
+
+    # Act
+    index = SourceSpanIndex(root, html)
+
+    # Assert
+    assert index.get(root.span) == (13, 27)
+    assert index.source[13:27] == b"<span>x</span>"
@@ -0,0 +1,159 @@
+import bs4
+import pytest
+
+from sec_parser.utils.bs4_.table_grid import TableGrid
+
+
+def _table(html):
+    return bs4.BeautifulSoup(html, "lxml").table
+
+
+@pytest.mark.parametrize(
+    ("name", "html", "expected_rows", "expected_header_rows"),
+    values := [
+        (
+            "simple",
+            "<table><tr><td>a</td><td>b</td></tr><tr><td>c</td></tr></table>",
+            (("a", "b"), ("c", "")),
+            0,
+        ),
+        (
+            "colspan",
+            "<table><tr><td colspan='3'>a</td></tr><tr><td>b</td></tr></table>",
+            (("", "", "a"), ("b", "", "")),
+            0,
+        ),
+        (
+            "rowspan",
+            """
+            <table>
+                <tr><td rowspan="2">a</td><td>b</td></tr>
+                <tr><td>c</td></tr>
+                <tr><td>d</td><td rowspan="5">e</td></tr>
+            </table>
+            """,
+            (("a", "b"), ("a", "c"), ("d", "e")),
+            0,
+        ),
+        (
+            "header_from_th",
+            "<table><tr><th>a</th></tr><tr><th>b</th></tr><tr><td>c</td></tr></table>",
+            (("a",), ("b",), ("c",)),
+            2,
+        ),
+        (
+            "header_from_thead",
+            """
+            <table>
+                <tfoot><tr><td>f</td></tr></tfoot>
+                <thead><tr><td>h</td></tr></thead>
+                <tbody><tr><td>b</td></tr></tbody>
+            </table>
+            """,
+            (("h",), ("b",), ("f",)),
+            1,
+        ),
+        (
+            "text",
+            """
+            <table><tr>
+                <td> a <b>b</b>\n\n c <!-- d --></td>
+                <td>e<span style="display: none">f</span><style>g</style></td>
+            </tr></table>
+            """,
+            (("a b c", "e"),),
+            0,
+        ),
+        (
+            "nested_table",
+            "<div><table><tr><td>a<table><tr><td>b</td></tr></table></td></tr></table>",
+            (("ab",),),
+            0,
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_from_tag(name, html, expected_rows, expected_header_rows):
+    # Arrange
+    table = _table(html)
+
+    # Act
+    grid = TableGrid.from_tag(table)
+
+    # Assert
+    assert grid.rows == expected_rows
+    assert grid.header_rows == expected_header_rows
+
+
+def test_from_tag_does_not_modify_the_table():
+    # Arrange
+    table = _table("<table><tr><td colspan='2' rowspan='2'>a</td></tr></table>")
+    expected = str(table)
+
+    # Act
+    TableGrid.from_tag(table)
+
+    # Assert
+    assert str(table) == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "grid", "expected"),
+    values := [
+        (
+            "without_header",
+            TableGrid(rows=(("a", "", "b"), ("", "", ""), ("", "c", ""))),
+            "| a | | b |\n| | c | |",
+        ),
+        (
+            "with_header",
+            TableGrid(rows=(("a", "b"), ("c", "d"), ("1", "2")), header_rows=2),
+            "| a | b |\n|---|---|\n| c | d |\n| 1 | 2 |",
+        ),
+        (
+            "numbers",
+            TableGrid(
+                rows=(
+                    ("Year", "2023", "$", "1,234,567", "(1,642"),
+                    ("", "", "", "12.50", ")"),
+                ),
+            ),
+            "| Year | 2023 | $ | 1234567 | (1,642 |\n| | | | 12.5 | ) |",
+        ),
+        (
+            "numbers_in_text_columns",
+            TableGrid(rows=(("1,234", "12.50"), ("a", "b"))),
+            "| 1234 | 12.50 |\n| a | b |",
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_to_markdown(name, grid, expected):
+    # Act
+    actual = grid.to_markdown()
+
+    # Assert
+    assert actual == expected
+
+
+def test_to_csv():
+    # Arrange
+    grid = TableGrid(rows=(("a", "b, c"), ("1,234", "")), header_rows=1)
+
+    # Act
+    actual = grid.to_csv()
+
+    # Assert
+    assert actual == 'a,"b, c"\n"1,234",\n'
+
+
+def test_to_dataframe():
+    # Arrange
+    grid = TableGrid(rows=(("a", "b"), ("1", "2")), header_rows=1)
+
+    # Act
+    dataframe = grid.to_dataframe()
+
+    # Assert
+    assert list(dataframe.columns) == ["a", "b"]
+    assert dataframe.to_numpy().tolist() == [["1", "2"]]
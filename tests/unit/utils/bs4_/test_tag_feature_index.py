@@ -0,0 +1,144 @@
+import bs4
+import pytest
+
+from sec_parser.processing_engine.html_tag_parser import HtmlTagParser
+from sec_parser.utils.bs4_.contains_tag import contains_tag
+from sec_parser.utils.bs4_.count_tags import count_tags
+from sec_parser.utils.bs4_.count_text_matches_in_descendants import (
+    count_text_matches_in_descendants,
+)
+from sec_parser.utils.bs4_.get_first_deepest_tag import get_first_deepest_tag
+from sec_parser.utils.bs4_.has_text_outside_tags import has_text_outside_tags
+from sec_parser.utils.bs4_.is_unary_tree import is_unary_tree
+from sec_parser.utils.bs4_.tag_feature_index import TagFeatureIndex
+from sec_parser.utils.bs4_.text_styles_metrics import compute_text_styles_metrics
+
+
+def _expected_text(tag: bs4.Tag) -> str:
+    return "\n".join(
+        " ".join(t.strip() for t in text.split("\n")) for text in tag.stripped_strings
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "html"),
+    values := [
+        (
+            "nested_styles",
+            """
+            <div style="color:#000000;">
+                <span>This is text</span>
+                <span style="font-weight:600;">This is <b>bold</b></span>
+            </div>
+            <div><p><b>text</b>extra text</p></div>
+            """,
+        ),
+        (
+            "tables_and_images",
+            """
+            <div><table><tr><td>1</td></tr></table>outside</div>
+            <div><div><img src="a.png"></div></div>
+            <div><table></table><table></table></div>
+            """,
+        ),
+        (
+            "unary_and_comments",
+            """
+            <div><p><span>unary</span></p></div>
+            <div>text<span>not unary</span><!-- comment --></div>
+            <div style="font-weight:bold"><span>a</span> <span>b</span></div>
+            """,
+        ),
+        (
+            "xbrl_tags",
+            """
+            <ix:nonnumeric name="x"><div><span>Wrapped
+            text</span></div></ix:nonnumeric>
+            <div><ix:nonfraction>1</ix:nonfraction></div>
+            """,
+        ),
+        (
+            "links_and_titles",
+            """
+            <div><p><a href="#a">Part I</a></p><p>Part I</p></div>
+            <div><span>Item 1.</span> <b>Item 2</b> text <a>Item 3</a></div>
+            <div><p>Part II<br>Item 1</p> <p><!-- Item 4 --><a>x</a></p></div>
+            """,
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_index_matches_direct_computation(name, html):
+    # Arrange
+    root = HtmlTagParser()._parse_to_bs4(html)
+    index = TagFeatureIndex(root)
+
+    for tag in [root, *root.find_all(True)]:
+        # Act
+        features = index.get(tag)
+
+        # Assert
+        assert features is not None
+        assert features.text == _expected_text(tag)
+        assert features.is_unary_tree == is_unary_tree(tag)
+        assert features.get_text() == tag.get_text()
+        assert features.first_deepest_tag is get_first_deepest_tag(tag)
+        for prefix in ("part", "item", ""):
+            predicate = lambda text, p=prefix: text.lower().startswith(p)  # noqa: E731
+            assert features.count_text_matches_in_descendants(
+                predicate,
+            ) == count_text_matches_in_descendants(tag, predicate)
+        assert features.get_text_styles_metrics() == compute_text_styles_metrics(tag)
+        for tag_name in ("b", "span", "table", "img", "ix:nonnumeric"):
+            assert features.count_tags(tag_name) == count_tags(tag, tag_name)
+            for include_self in (True, False):
+                assert features.contains_tag(
+                    tag_name,
+                    include_self=include_self,
+                ) == contains_tag(tag, tag_name, include_self=include_self)
+        for tag_names in (("table",), ("b",), ("span", "b")):
+            assert features.has_text_outside_tags(tag_names) == has_text_outside_tags(
+                tag,
+                tag_names,
+            )
+
+
+def test_unknown_tag_is_not_found():
+    # Arrange
+    root = HtmlTagParser()._parse_to_bs4("<div><p>a</p><p>b</p></div>")
+    index = TagFeatureIndex(root)
+    other = bs4.BeautifulSoup("<p>a</p>", "lxml").p
+
+    # Act & Assert
+    assert index.get(other) is None
+
+
+def test_invalidate_rebuilds_after_mutation():
+    # Arrange
+    root = HtmlTagParser()._parse_to_bs4("<div><p>a</p><p>b</p></div>")
+    index = TagFeatureIndex(root)
+    assert index.get(root).text == "a\nb"
+
+    # Act
+    root.find("p").string = "c"
+    index.invalidate()
+
+    # Assert
+    assert index.get(root).text == "c\nb"
+
+
+def test_malformed_style_raises_only_when_styles_are_requested():
+    # Arrange
+    root = HtmlTagParser()._parse_to_bs4(
+        '<div style="background:url(http://a)"><p>a</p></div><p>b</p>',
+    )
+    index = TagFeatureIndex(root)
+    div = root.find("div")
+
+    # Act
+    features = index.get(div)
+
+    # Assert
+    assert features.text == "a"
+    with pytest.raises(ValueError, match="too many values to unpack"):
+        features.get_text_styles_metrics()
@@ -1,7 +1,11 @@
 import pytest
 from bs4 import BeautifulSoup
 
-from sec_parser.utils.bs4_.text_styles_metrics import compute_text_styles_metrics
+from sec_parser.utils.bs4_.text_styles_metrics import (
+    StyleCascade,
+    compute_effective_style,
+    compute_text_styles_metrics,
+)
 
 
 # Test: Normal case with multiple styles
@@ -55,3 +59,48 @@ def test_should_return_correct_metrics_for_inherited_styles():
     # Assert
     assert result[("color", "#000000")] == 100.0
     assert result[("font-weight", "600")] == 50.0
+
+
+def test_style_cascade_matches_direct_computation():
+    # Arrange
+    html = """
+    <div style="color:#000000; font-size:10pt">
+        <p style="font-size:12pt;color:red;font-size:14pt">
+            <span>text</span><b style="font-weight:bold">bold</b>
+        </p>
+        <p><span style="color:blue">blue</span></p>
+    </div>
+    """
+    soup = BeautifulSoup(html, "lxml")
+    style_cascade = StyleCascade()
+
+    for tag in reversed(soup.find_all(True)):
+        # Act
+        result = style_cascade.get_effective_style(tag)
+
+        # Assert
+        expected = compute_effective_style(tag)
+        assert result == expected
+        assert list(result) == list(expected)
+
+
+def test_style_cascade_parses_each_tag_once(monkeypatch):
+    # Arrange
+    html = '<div style="color:red"><p><span>a</span><span>b</span></p></div>'
+    soup = BeautifulSoup(html, "lxml")
+    style_cascade = StyleCascade()
+    parsed = []
+    parse = style_cascade.get_inline_style.__func__
+
+    def counting_parse(self, tag):
+        parsed.append(tag)
+        return parse(self, tag)
+
+    monkeypatch.setattr(StyleCascade, "get_inline_style", counting_parse)
+
+    # Act
+    result = compute_text_styles_metrics(soup.div, style_cascade=style_cascade)
+
+    # Assert
+    assert result == {("color", "red"): 100.0}
+    assert len(parsed) == len({id(tag) for tag in parsed})